@@ -146,11 +146,14 @@ class DocResolver:
         self._cache_manager = CacheManager(self.base_dir) if CacheManager else None
 
     def _get_index_mtime(self) -> float:
-        """Get modification time of index.yaml."""
-        try:
-            return self._index_path.stat().st_mtime
-        except OSError:
-            return 0.0
+        """Get modification time of the index (index.yaml or its write-ahead log, whichever is newer)."""
+        mtimes = []
+        for path in (self._index_path, self.index_manager.wal_path):
+            try:
+                mtimes.append(path.stat().st_mtime)
+            except OSError:
+                continue
+        return max(mtimes, default=0.0)
 
     def _is_cache_valid(self) -> bool:
         """Check if inverted index cache is valid.
@@ -82,6 +82,33 @@ class MetadataExtractor:
     _filter_config = None
     _stop_words_cache: set[str] | None = None
     _extraction_limits_cache: dict[str, int] | None = None
+    _yake_extractor = None
+    
+    @classmethod
+    def preload(cls) -> None:
+        """Warm the class-level caches (configs, limits, stop words, YAKE extractor).
+
+        Intended as a process-pool initializer so each worker pays this setup
+        cost once instead of on its first task.
+        """
+        cls._load_configs()
+        cls._get_extraction_limits()
+        cls._get_stop_words()
+        if YAKE_AVAILABLE:
+            cls._get_yake_extractor()
+    
+    @classmethod
+    def _get_yake_extractor(cls):
+        """Get a YAKE KeywordExtractor configured from defaults.yaml (cached at class level)."""
+        if cls._yake_extractor is None:
+            cls._yake_extractor = yake.KeywordExtractor(
+                lan=get_default('keyword_extraction.yake', 'language', 'en'),
+                n=get_default('keyword_extraction.yake', 'max_ngram_size', 3),
+                dedupLim=get_default('keyword_extraction.yake', 'dedup_threshold', 0.7),
+                top=get_default('keyword_extraction.yake', 'top_keywords', 15),
+                features=None
+            )
+        return cls._yake_extractor
     
     @classmethod
     def _get_extraction_limits(cls) -> dict[str, int]:
@@ -119,10 +146,43 @@ class MetadataExtractor:
         
         self.url = url
         try:
-            self.content = self.file_path.read_text(encoding='utf-8')
+            content = self.file_path.read_text(encoding='utf-8')
         except UnicodeDecodeError as e:
             raise ValueError(f"Failed to read file as UTF-8: {self.file_path}") from e
         
+        self._set_content(content)
+    
+    @classmethod
+    def from_bytes(cls, file_path: Path, data: bytes, url: str | None = None) -> 'MetadataExtractor':
+        """
+        Create an extractor from file bytes that were already read
+        
+        Args:
+            file_path: Path the bytes were read from (used for path-based heuristics)
+            data: Raw file contents
+            url: Optional source URL
+        
+        Returns:
+            MetadataExtractor instance (the file is not opened again)
+        
+        Raises:
+            ValueError: If data can't be decoded as UTF-8
+        """
+        extractor = cls.__new__(cls)
+        extractor.file_path = Path(file_path)
+        extractor.url = url
+        try:
+            content = data.decode('utf-8')
+        except UnicodeDecodeError as e:
+            raise ValueError(f"Failed to read file as UTF-8: {extractor.file_path}") from e
+        
+        # Match read_text() universal newline handling
+        extractor._set_content(content.replace('\r\n', '\n').replace('\r', '\n'))
+        return extractor
+    
+    def _set_content(self, content: str) -> None:
+        """Store document content and derive frontmatter/body."""
+        self.content = content
         self.frontmatter = self._parse_frontmatter()
         self.body = self._strip_frontmatter()
         
@@ -163,7 +223,8 @@ class MetadataExtractor:
         else:
             cls._filter_config = {}
     
-    def _get_stop_words(self) -> set[str]:
+    @classmethod
+    def _get_stop_words(cls) -> set[str]:
         """Get stop words from library + domain-specific config.
 
         Prefer spaCy's official stop-word list when available but always fall back
@@ -217,7 +278,7 @@ class MetadataExtractor:
                 })
         
         # Add domain-specific stop words from config
-        domain_stop_words = self._filter_config.get('domain_stop_words', [])
+        domain_stop_words = (cls._filter_config or {}).get('domain_stop_words', [])
         stop_words.update(domain_stop_words)
         
         # Add common markdown/document terms
@@ -474,10 +535,6 @@ class MetadataExtractor:
             yake_text = yake_text.strip()
 
             # Get YAKE config from defaults.yaml
-            yake_language = get_default('keyword_extraction.yake', 'language', 'en')
-            yake_max_ngram = get_default('keyword_extraction.yake', 'max_ngram_size', 3)
-            yake_dedup = get_default('keyword_extraction.yake', 'dedup_threshold', 0.7)
-            yake_top = get_default('keyword_extraction.yake', 'top_keywords', 15)
             yake_min_length = get_default('keyword_extraction.yake', 'min_text_length', 50)
             
             # YAKE requires a minimum amount of text for meaningful extraction
@@ -485,15 +542,9 @@ class MetadataExtractor:
             if len(yake_text) < yake_min_length:
                 return keywords, yake_used, count
 
-            # Extract keywords with YAKE using config values
+            # Extract keywords with YAKE using config values (extractor reused across documents)
             try:
-                kw_extractor = yake.KeywordExtractor(
-                    lan=yake_language,
-                    n=yake_max_ngram,
-                    dedupLim=yake_dedup,
-                    top=yake_top,
-                    features=None
-                )
+                kw_extractor = self._get_yake_extractor()
                 yake_keywords = kw_extractor.extract_keywords(yake_text)
 
                 # Add YAKE keywords (score, keyword tuple)
@@ -28,11 +28,14 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 import bootstrap; skill_dir = bootstrap.skill_dir; config_dir = bootstrap.config_dir
 
+import atexit
+import copy
 import json
+import mmap
 import os
-import shutil
+import re
 import time
-from typing import Any, Dict, Iterator
+from typing import Any, Dict, ItemsView, Iterator
 
 from utils.script_utils import configure_utf8_output, ensure_yaml_installed
 
@@ -46,6 +49,8 @@ try:
 except ImportError:
     HAS_RUAMEL = False
     yaml = ensure_yaml_installed()
+    # libyaml-backed dumper is several times faster; pure-Python SafeDumper otherwise
+    YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
 
 # Import config registry for defaults (bootstrap already set up paths)
 try:
@@ -67,10 +72,38 @@ FILE_RETRY_DELAY = get_default('index', 'file_retry_delay', 0.2)  # Delay for at
 FILE_MAX_RETRIES = get_default('index', 'file_max_retries', 5)  # Maximum retries for file operations
 STALE_LOCK_THRESHOLD = get_default('index', 'stale_lock_threshold', 300.0)  # Locks older than 5 minutes are considered stale
 BATCH_PROGRESS_INTERVAL = get_default('index', 'batch_progress_interval', 100)  # Log progress every N entries in batch operations
+WAL_COMPACT_BYTES = get_default('index', 'wal_compact_bytes', 1048576)  # Fold the write-ahead log into the index files above this size
 
 # Additional constants for DRY compliance
 YAML_WIDTH = 4096  # Wide width for long URLs in YAML output
 LOCK_STALE_CHECK_INTERVAL = 50  # Check for stale lock every N retry attempts
+# Top-level YAML key line: first byte is not whitespace and the line contains ':'
+TOP_LEVEL_KEY_PATTERN = re.compile(rb'^(?=[^ \t\r\n])[^\n]*?:', re.MULTILINE)
+# Fields batch_update_entries() never overwrites once set
+PROTECTED_FIELDS = frozenset({'path', 'url', 'hash', 'last_fetched', 'source_type', 'sitemap_url'})
+# Fields with a secondary (inverted) index for search_entries() lookups
+INDEXED_FIELDS = frozenset({'path', 'url', 'hash', 'source_type', 'sitemap_url'})
+
+def _sorted_keys(value: Any) -> Any:
+    """
+    Return dicts (recursively) with keys in sorted order.
+
+    Index files are written in insertion order, so entries are sorted once
+    when loaded or inserted instead of on every dump.
+
+    Args:
+        value: Index, entry or nested value
+
+    Returns:
+        Copy of value with sorted dict keys (non-dict values are returned as-is)
+    """
+    if not isinstance(value, dict):
+        return value
+    try:
+        keys = sorted(value)
+    except TypeError:
+        keys = list(value)  # Mixed key types - keep existing order
+    return {key: _sorted_keys(value[key]) for key in keys}
 
 class IndexManager:
     """Manage index files with support for large files and JSON optimization
@@ -79,6 +112,8 @@ class IndexManager:
     - JSON is used for reads (>100x faster than YAML parsing)
     - YAML is maintained for human readability and git diffs
     - Both formats are kept in sync on writes
+    - Single-entry writes go to an append-only log (index.wal) that is
+      replayed on load and folded into both formats by compact()
     """
 
     def __init__(self, base_dir: Path, index_filename: str = "index.yaml"):
@@ -94,6 +129,17 @@ class IndexManager:
         # JSON path for fast loading (>100x faster than YAML)
         self.json_path = self.base_dir / index_filename.replace('.yaml', '.json')
         self.lock_file = self.base_dir / '.index.lock'
+        # Append-only write-ahead log for single-entry updates/removals (JSON lines)
+        self.wal_path = self.index_path.with_suffix('.wal')
+        self._compact_at_exit_registered = False
+
+        # Copy-on-write read snapshot: (index, version, file stamp).
+        # Readers grab a reference without locking; writers build a new dict
+        # and publish it by rebinding the attribute (atomic under the GIL).
+        # Published dicts must never be mutated in place.
+        self._snapshot: tuple[Dict, int, tuple | None] = ({}, 0, None)
+        # Secondary index (field -> value -> ordered doc_ids) and the snapshot it was built from
+        self._secondary: tuple[Dict | None, Dict[str, Dict[Any, Dict[str, None]]]] = (None, {})
 
         # Initialize YAML parser
         if HAS_RUAMEL:
@@ -184,6 +230,15 @@ class IndexManager:
         Returns:
             True if lock acquired, False otherwise
         """
+        # Fast path: an uncontended lock is one exclusive create, with no
+        # stale-lock check or timing setup
+        try:
+            fd = os.open(str(self.lock_file), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            os.close(fd)
+            return True
+        except OSError:
+            pass  # Lock held (or stale) - use the retry/backoff path below
+
         if self._acquire_lock():
             return True
         print(f"⚠️  Warning: Could not acquire index lock for {operation}, retrying...")
@@ -207,9 +262,8 @@ class IndexManager:
         retry_delay = FILE_RETRY_DELAY
         for attempt in range(FILE_MAX_RETRIES):
             try:
-                if dest.exists():
-                    dest.unlink()
-                shutil.move(str(temp_path), str(dest))
+                # os.replace overwrites atomically (no unlink window) on POSIX and Windows
+                os.replace(temp_path, dest)
                 return True
             except (OSError, PermissionError) as e:
                 if attempt < FILE_MAX_RETRIES - 1:
@@ -219,6 +273,34 @@ class IndexManager:
                 raise e
         return False
 
+    def _fsync_dir(self) -> None:
+        """
+        Flush directory entries (renames, unlinks) in base_dir to disk.
+
+        One call covers every rename made since the last one, so multi-file
+        writes pay for a single directory sync. No-op where unsupported (Windows).
+        """
+        if not hasattr(os, 'O_DIRECTORY'):
+            return
+        try:
+            fd = os.open(self.base_dir, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _discard_temp(temp_path: Path) -> None:
+        """Remove a leftover temporary file, ignoring errors."""
+        try:
+            temp_path.unlink(missing_ok=True)
+        except Exception:
+            pass
+
     def _validate_index_not_empty(self, index: Dict, operation: str) -> bool:
         """
         Validate index is not empty before write operation (data loss prevention).
@@ -349,6 +431,63 @@ class IndexManager:
             print(f"❌ Error loading index.yaml: {e}")
             return {}
 
+    def _write_temp_json(self, index: Dict) -> Path:
+        """
+        Serialize the index to a fsync'd temporary JSON file
+
+        Args:
+            index: Dictionary of index entries to save
+
+        Returns:
+            Path of the temporary file (to be renamed over index.json)
+
+        Raises:
+            Exception: If serialization or the write fails
+        """
+        temp_path = self.json_path.with_suffix('.json.tmp')
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(index, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception:
+            self._discard_temp(temp_path)
+            raise
+        return temp_path
+
+    def _write_temp_yaml(self, index: Dict) -> Path:
+        """
+        Serialize the index to a fsync'd temporary YAML file
+
+        The temporary file name includes the PID so writers in different
+        processes cannot collide.
+
+        Args:
+            index: Dictionary of index entries to save
+
+        Returns:
+            Path of the temporary file (to be renamed over index.yaml)
+
+        Raises:
+            Exception: If serialization or the write fails
+        """
+        temp_path = self.index_path.with_name(f'{self.index_path.name}.{os.getpid()}.tmp')
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                if HAS_RUAMEL:
+                    self.yaml.dump(index, f)
+                else:
+                    # Keys are already sorted (_sorted_keys), so sort_keys=True
+                    # would only repeat the work; width matches the ruamel path
+                    yaml.dump(index, f, Dumper=YAML_DUMPER, default_flow_style=False,
+                              sort_keys=False, allow_unicode=True, width=YAML_WIDTH)
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception:
+            self._discard_temp(temp_path)
+            raise
+        return temp_path
+
     def _save_json(self, index: Dict) -> bool:
         """
         Save index to JSON file for fast loading (>100x faster than YAML)
@@ -362,21 +501,18 @@ class IndexManager:
         if not index:
             return True  # Nothing to save
 
-        temp_path = self.json_path.with_suffix('.json.tmp')
+        temp_path = None
         try:
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(index, f, indent=2, ensure_ascii=False, sort_keys=True)
-
+            temp_path = self._write_temp_json(index)
             # Atomic rename with retry
-            return self._atomic_move_with_retry(temp_path, self.json_path)
+            saved = self._atomic_move_with_retry(temp_path, self.json_path)
+            self._fsync_dir()
+            return saved
         except Exception as e:
             print(f"⚠️  Error saving index.json: {e}")
             # Clean up temp file on error
-            if temp_path.exists():
-                try:
-                    temp_path.unlink()
-                except Exception:
-                    pass
+            if temp_path is not None:
+                self._discard_temp(temp_path)
             return False
 
     def load_all(self) -> Dict:
@@ -386,92 +522,377 @@ class IndexManager:
         Returns:
             Dictionary of all index entries (doc_id -> metadata)
         """
+        index = None
         # Prefer JSON for speed (>100x faster than YAML parsing)
         if self.json_path.exists():
             try:
                 with open(self.json_path, 'r', encoding='utf-8') as f:
-                    return json.load(f) or {}
+                    index = json.load(f) or {}
             except Exception as e:
                 print(f"⚠️  JSON load failed, falling back to YAML: {e}")
                 # Fall through to YAML loading
 
-        # Fallback to YAML for compatibility
-        return self._load_yaml_full()
+        if index is None:
+            # Fallback to YAML for compatibility
+            index = self._load_yaml_full()
+
+        # Apply single-entry writes not yet folded into the index files
+        self._replay_wal(index)
+        return index
+
+    def _append_wal(self, record: Dict) -> int:
+        """
+        Durably append one operation to the write-ahead log (caller holds the lock)
+
+        Args:
+            record: Operation, e.g. {"op": "update", "id": doc_id, "meta": {...}}
+                    or {"op": "remove", "id": doc_id}
+
+        Returns:
+            Size of the log in bytes after the append
+
+        Raises:
+            Exception: If the log cannot be written
+        """
+        line = json.dumps(record, ensure_ascii=False, default=str) + '\n'
+        with open(self.wal_path, 'a', encoding='utf-8') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+            wal_size = f.tell()
+
+        if not self._compact_at_exit_registered:
+            # Leave complete index files behind for tools that read index.yaml directly
+            atexit.register(self.compact)
+            self._compact_at_exit_registered = True
+
+        return wal_size
+
+    def _replay_wal(self, index: Dict) -> int:
+        """
+        Apply write-ahead log operations to a loaded index in place
+
+        A truncated last line (interrupted append) is ignored.
+
+        Args:
+            index: Index loaded from index.json/index.yaml
+
+        Returns:
+            Number of operations applied
+        """
+        try:
+            with open(self.wal_path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return 0
+        except Exception as e:
+            print(f"⚠️  Error reading {self.wal_path.name}: {e}")
+            return 0
+
+        applied = 0
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                break  # Partial write at the tail
+            if record.get('op') == 'update':
+                index[record['id']] = record['meta']
+            elif record.get('op') == 'remove':
+                index.pop(record['id'], None)
+            applied += 1
+        return applied
+
+    def _write_snapshot_files(self, index: Dict) -> None:
+        """
+        Write full index.yaml + index.json and drop the folded write-ahead log
+        (caller holds the lock)
+
+        Group commit: both temporary files are written and fsync'd first, then
+        renamed into place, and a single directory fsync covers both renames
+        and the log removal.
+
+        Args:
+            index: Complete index to persist
+
+        Raises:
+            Exception: If either file cannot be written
+        """
+        temps: list[tuple[Path, Path]] = []
+        try:
+            temps.append((self._write_temp_yaml(index), self.index_path))
+            if index:  # An empty index.json is never written (see _save_json)
+                # Also save JSON for fast loading (>100x faster)
+                temps.append((self._write_temp_json(index), self.json_path))
+            for temp_path, dest in temps:
+                self._atomic_move_with_retry(temp_path, dest)
+        finally:
+            # Clean up temp files on error
+            for temp_path, _ in temps:
+                self._discard_temp(temp_path)
+        self.wal_path.unlink(missing_ok=True)
+        self._fsync_dir()
+
+    def compact(self) -> bool:
+        """
+        Fold the write-ahead log into index.yaml and index.json
+
+        Runs automatically at interpreter exit after single-entry writes and
+        whenever the log exceeds WAL_COMPACT_BYTES.
+
+        Returns:
+            True if successful (or nothing to compact), False otherwise
+        """
+        if not self.wal_path.exists():
+            return True
+
+        if not self._acquire_lock_with_retry("compaction"):
+            return False
+
+        try:
+            index = dict(self._read_snapshot())
+            if not self._validate_index_not_empty(index, "compaction"):
+                return False
+            self._write_snapshot_files(index)
+            self._publish_snapshot(index)
+            return True
+
+        except Exception as e:
+            print(f"❌ Error compacting index write-ahead log: {e}")
+            return False
+
+        finally:
+            self._release_lock()
     
+    def _index_exists(self) -> bool:
+        """
+        Check whether any index state exists on disk
+
+        A fresh index may so far consist of the write-ahead log only.
+
+        Returns:
+            True if index.yaml, index.json or the write-ahead log exists
+        """
+        return any(path.exists() for path in (self.index_path, self.json_path, self.wal_path))
+
+    def _file_stamp(self) -> tuple | None:
+        """
+        Identify the on-disk state that load_all() would read.
+
+        Returns:
+            (filename, mtime_ns, size) of the JSON index (or of the YAML index
+            when no JSON exists) plus the same for the write-ahead log;
+            None if none of the files exist
+        """
+        base_stamp = None
+        for path in (self.json_path, self.index_path):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            base_stamp = (path.name, st.st_mtime_ns, st.st_size)
+            break
+
+        try:
+            st = self.wal_path.stat()
+            wal_stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            wal_stamp = None
+
+        if base_stamp is None and wal_stamp is None:
+            return None
+        return (base_stamp, wal_stamp)
+
+    def _read_snapshot(self) -> Dict:
+        """
+        Get the current read snapshot without taking the index lock.
+
+        The snapshot is reloaded only when the index files changed on disk
+        (e.g. written by another process). The returned dict is shared and
+        must be treated as read-only.
+
+        Returns:
+            Dictionary of all index entries (doc_id -> metadata)
+        """
+        index, version, stamp = self._snapshot
+        current_stamp = self._file_stamp()
+        if current_stamp != stamp:
+            # Stamp is taken before loading so a concurrent write forces a reload next time
+            # Sort once here; writers keep this order so dumps need no sort_keys
+            index = _sorted_keys(self.load_all())
+            self._snapshot = (index, version + 1, current_stamp)
+        return index
+
+    def _publish_snapshot(self, index: Dict) -> None:
+        """
+        Publish a freshly written index as the new read snapshot.
+
+        Args:
+            index: Index dictionary that was just persisted (must not be mutated afterwards)
+        """
+        version = self._snapshot[1]
+        self._snapshot = (index, version + 1, self._file_stamp())
+
     def get_entry(self, doc_id: str) -> Dict | None:
         """
-        Get single entry - uses full YAML parsing for accuracy (handles lists, complex types)
+        Get single entry from the read snapshot (no lock, no reparse when unchanged)
         
         Args:
             doc_id: Document ID to look up
         
         Returns:
-            Metadata dict if found, None otherwise
+            Metadata dict if found (a private copy the caller may modify), None otherwise
         """
-        if not self.index_path.exists():
+        if not self._index_exists():
             return None
         
-        # Use full YAML parsing to handle lists and complex types correctly
-        # For single entry lookups, this is still fast enough
         try:
-            index = self.load_all()
-            return index.get(doc_id)
+            entry = self._read_snapshot().get(doc_id)
+            # Callers commonly edit the entry and pass it to update_entry()
+            return copy.deepcopy(entry) if entry is not None else None
         except Exception as e:
             print(f"⚠️  Error reading entry {doc_id}: {e}")
             return None
     
     def list_entries(self) -> Iterator[tuple[str, Dict]]:
         """
-        Iterator for all entries - uses full YAML parsing for accuracy (handles lists, complex types)
-        
-        Note: This loads the entire index into memory for accuracy. For very large files,
-        consider using get_entry() for individual lookups instead.
+        Iterator for all entries from the read snapshot (no lock, no reparse when unchanged)
         
         Yields:
-            Tuples of (doc_id, metadata)
+            Tuples of (doc_id, metadata), each metadata a private copy the caller may modify
         """
-        if not self.index_path.exists():
+        if not self._index_exists():
             return
         
-        # Use full YAML parsing to handle lists and complex types correctly
-        # The naive line-by-line parser cannot handle YAML lists (tags, keywords)
-        # which causes tags to appear as empty strings
         try:
-            index = self.load_all()
-            for doc_id, metadata in index.items():
-                yield (doc_id, metadata)
+            index = self._read_snapshot()
+        except Exception as e:
+            print(f"⚠️  Error loading entries: {e}")
+            return
+        # Writers publish a new dict instead of mutating, so iteration is safe;
+        # entries are copied like get_entry() since callers hand them on
+        for doc_id, metadata in index.items():
+            yield doc_id, copy.deepcopy(metadata)
+    
+    def entries_view(self) -> ItemsView[str, Dict]:
+        """
+        Items view over the read snapshot (no copy; len() is O(1))
+        
+        Lets callers take the entry count and iterate from the same snapshot
+        instead of counting and listing separately. Unlike list_entries(), the
+        metadata dicts are shared with the snapshot, so the view is read-only:
+        mutating an entry would change what every later reader sees. Use
+        get_entry() or list_entries() to obtain copies for modification.
+        
+        Returns:
+            Dict items view of (doc_id, metadata) pairs (empty if no index)
+        """
+        if not self._index_exists():
+            return {}.items()
+        
+        try:
+            return self._read_snapshot().items()
         except Exception as e:
             print(f"⚠️  Error loading entries: {e}")
+            return {}.items()
+    
+    def list_entries_missing(self, required_keys: tuple[str, ...]) -> Iterator[tuple[str, Dict]]:
+        """
+        Iterator over snapshot entries that lack at least one of required_keys
+        
+        Note: The yielded metadata dicts are shared with the snapshot and must be
+        treated as read-only.
+        
+        Args:
+            required_keys: Field names an entry must all have to be excluded
+        
+        Yields:
+            Tuples of (doc_id, metadata) for incomplete entries
+        """
+        required = frozenset(required_keys)
+        for doc_id, metadata in self.entries_view():
+            if not required <= metadata.keys():
+                yield doc_id, metadata
+    
+    def count_missing(self, required_keys: tuple[str, ...]) -> int:
+        """
+        Count snapshot entries that lack at least one of required_keys
+        
+        Args:
+            required_keys: Field names an entry must all have to be excluded
+        
+        Returns:
+            Number of incomplete entries
+        """
+        required = frozenset(required_keys)
+        return sum(1 for _doc_id, metadata in self.entries_view() if not required <= metadata.keys())
     
     def get_entry_count(self) -> int:
         """
         Quick count of entries without loading full file
+
+        Uses the in-memory snapshot when it is current, otherwise scans the raw
+        bytes of index.yaml (memory-mapped) for top-level keys without decoding.
         
         Returns:
             Number of entries in index
         """
+        index, _, stamp = self._snapshot
+        if stamp is not None and stamp == self._file_stamp():
+            return len(index)
+        if self.wal_path.exists():
+            # index.yaml does not include logged writes yet
+            return len(self._read_snapshot())
+
         if not self.index_path.exists():
             return 0
         
-        count = 0
         try:
-            with open(self.index_path, 'r', encoding='utf-8') as f:
-                for line in f:
+            with open(self.index_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return 0  # mmap cannot map an empty file
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
                     # Count entry keys (lines starting at column 0 with ':')
-                    stripped = line.rstrip()
-                    if stripped and not line.startswith(' ') and not line.startswith('\t'):
-                        if ':' in stripped:
-                            count += 1
+                    return sum(1 for _ in TOP_LEVEL_KEY_PATTERN.finditer(mm))
         except Exception:
             # Fallback to full load
             index = self.load_all()
             return len(index)
-        
-        return count
     
+    def _get_secondary_index(self, index: Dict) -> Dict[str, Dict[Any, Dict[str, None]]]:
+        """
+        Get the secondary index for a snapshot, building it on first use.
+
+        Doc IDs are kept in dicts (ordered sets) so lookups preserve index order.
+
+        Args:
+            index: Snapshot dictionary returned by _read_snapshot()
+
+        Returns:
+            Mapping of field -> value -> {doc_id: None} for INDEXED_FIELDS
+        """
+        built_for, secondary = self._secondary
+        if built_for is index:
+            return secondary
+
+        secondary = {field: {} for field in INDEXED_FIELDS}
+        for doc_id, metadata in index.items():
+            if not isinstance(metadata, dict):
+                continue
+            for field, postings in secondary.items():
+                try:
+                    postings.setdefault(metadata.get(field), {})[doc_id] = None
+                except TypeError:
+                    pass  # Unhashable value can never equal a hashable filter value
+        self._secondary = (index, secondary)
+        return secondary
+
     def search_entries(self, **filters) -> list[tuple[str, Dict]]:
         """
         Search entries by metadata fields
+
+        Filters on INDEXED_FIELDS are answered from the secondary index; other
+        fields are checked only on the candidates it returns (or by a linear
+        scan when no indexed field is filtered).
         
         Args:
             **filters: Field name and value pairs to filter by
@@ -479,16 +900,35 @@ class IndexManager:
         Returns:
             List of (doc_id, metadata) tuples matching filters
         """
-        results = []
-        
-        for doc_id, metadata in self.list_entries():
-            match = True
+        if not self._index_exists():
+            return []
+
+        try:
+            index = self._read_snapshot()
+        except Exception as e:
+            print(f"⚠️  Error loading entries: {e}")
+            return []
+
+        candidates = None
+        if filters.keys() & INDEXED_FIELDS:
+            secondary = self._get_secondary_index(index)
             for key, value in filters.items():
-                if metadata.get(key) != value:
-                    match = False
-                    break
-            
-            if match:
+                if key not in INDEXED_FIELDS:
+                    continue
+                try:
+                    postings = secondary[key].get(value, {})
+                except TypeError:
+                    continue  # Unhashable filter value - verified below instead
+                if candidates is None or len(postings) < len(candidates):
+                    candidates = postings
+
+        if candidates is None:
+            candidates = index
+
+        results = []
+        for doc_id in candidates:
+            metadata = index[doc_id]
+            if all(metadata.get(key) == value for key, value in filters.items()):
                 results.append((doc_id, metadata))
         
         return results
@@ -509,36 +949,33 @@ class IndexManager:
             return False
 
         try:
-            # Load existing index
-            index = self.load_all()
+            snapshot = self._read_snapshot()
 
             # Safety check: prevent writing empty index (data loss prevention)
-            if not self._validate_index_not_empty(index, "update"):
+            if not self._validate_index_not_empty(snapshot, "update"):
                 return False
 
-            # Update entry
-            index[doc_id] = metadata
-
-            # Write to temporary file first, then rename (atomic write)
-            temp_path = self.index_path.with_suffix('.yaml.tmp')
-            try:
-                if HAS_RUAMEL:
-                    with open(temp_path, 'w', encoding='utf-8') as f:
-                        self.yaml.dump(index, f)
-                else:
-                    with open(temp_path, 'w', encoding='utf-8') as f:
-                        yaml.dump(index, f, default_flow_style=False, sort_keys=True, allow_unicode=True)
-
-                # Atomic rename with retry
-                self._atomic_move_with_retry(temp_path, self.index_path)
-                # Also save JSON for fast loading (>100x faster)
-                self._save_json(index)
-                return True
-            except Exception as e:
-                # Clean up temp file on error
-                if temp_path.exists():
-                    temp_path.unlink()
-                raise e
+            # Copied so later caller edits cannot leak into the snapshot
+            new_entry = _sorted_keys(metadata)
+            if snapshot.get(doc_id) == new_entry:
+                return True  # No-op update - nothing to persist
+
+            # Copy the current snapshot (refreshed under the lock) and update entry
+            index = dict(snapshot)
+            is_new = doc_id not in index
+            index[doc_id] = new_entry
+            if is_new:
+                # Keep doc_ids ordered (near-linear: the rest is already sorted)
+                index = dict(sorted(index.items()))
+
+            if not self.index_path.exists():
+                # Fresh index: write the files directly so index.yaml exists for other readers
+                self._write_snapshot_files(index)
+            # Append to the write-ahead log instead of rewriting the whole index
+            elif self._append_wal({'op': 'update', 'id': doc_id, 'meta': index[doc_id]}) > WAL_COMPACT_BYTES:
+                self._write_snapshot_files(index)
+            self._publish_snapshot(index)
+            return True
 
         except Exception as e:
             print(f"❌ Error updating entry {doc_id}: {e}")
@@ -563,8 +1000,8 @@ class IndexManager:
             return False
 
         try:
-            # Load existing index
-            index = self.load_all()
+            # Copy the current snapshot (refreshed under the lock)
+            index = dict(self._read_snapshot())
 
             # Safety check: prevent writing empty index (data loss prevention)
             if not self._validate_index_not_empty(index, "removal"):
@@ -576,26 +1013,14 @@ class IndexManager:
             else:
                 return False  # Entry not found
 
-            # Write to temporary file first, then rename (atomic write)
-            temp_path = self.index_path.with_suffix('.yaml.tmp')
-            try:
-                if HAS_RUAMEL:
-                    with open(temp_path, 'w', encoding='utf-8') as f:
-                        self.yaml.dump(index, f)
-                else:
-                    with open(temp_path, 'w', encoding='utf-8') as f:
-                        yaml.dump(index, f, default_flow_style=False, sort_keys=True, allow_unicode=True)
-
-                # Atomic rename with retry
-                self._atomic_move_with_retry(temp_path, self.index_path)
-                # Also save JSON for fast loading (>100x faster)
-                self._save_json(index)
-                return True
-            except Exception as e:
-                # Clean up temp file on error
-                if temp_path.exists():
-                    temp_path.unlink()
-                raise e
+            if not self.index_path.exists():
+                # Fresh index: write the files directly so index.yaml exists for other readers
+                self._write_snapshot_files(index)
+            # Append to the write-ahead log instead of rewriting the whole index
+            elif self._append_wal({'op': 'remove', 'id': doc_id}) > WAL_COMPACT_BYTES:
+                self._write_snapshot_files(index)
+            self._publish_snapshot(index)
+            return True
 
         except Exception as e:
             print(f"❌ Error removing entry {doc_id}: {e}")
@@ -623,14 +1048,16 @@ class IndexManager:
             return False
 
         try:
-            # Load existing index once
-            index = self.load_all()
+            # Copy the current snapshot once (refreshed under the lock)
+            index = dict(self._read_snapshot())
 
             # Safety check: prevent writing empty index (data loss prevention)
             if not self._validate_index_not_empty(index, "batch update"):
                 return False
 
             # Update all entries in memory with progress logging
+            changed = False
+            added_new = False
             total_updates = len(updates)
             for i, (doc_id, metadata) in enumerate(updates.items()):
                 # Progress logging for large batches
@@ -640,37 +1067,38 @@ class IndexManager:
 
                 # Merge with existing metadata if entry exists
                 if doc_id in index:
-                    existing = index[doc_id]
+                    # Copy the entry - the previous snapshot may still be in use by readers
+                    existing = dict(index[doc_id])
                     # Only update metadata fields, preserve critical fields like 'path', 'url', 'hash'
-                    protected_fields = ['path', 'url', 'hash', 'last_fetched', 'source_type', 'sitemap_url']
-                    for key, value in metadata.items():
-                        # Only update if not a protected field, or if it's None/missing
-                        if key not in protected_fields or existing.get(key) is None:
-                            existing[key] = value
-                    index[doc_id] = existing
+                    protected_keys = PROTECTED_FIELDS & metadata.keys()
+                    if protected_keys:
+                        existing.update({k: v for k, v in metadata.items() if k not in protected_keys})
+                        # Protected fields are only filled in if None/missing
+                        for key in protected_keys:
+                            if existing.get(key) is None:
+                                existing[key] = metadata[key]
+                    else:
+                        existing.update(metadata)
+                    existing = _sorted_keys(existing)
+                    if existing != index[doc_id]:
+                        index[doc_id] = existing
+                        changed = True
                 else:
-                    index[doc_id] = metadata
+                    index[doc_id] = _sorted_keys(metadata)
+                    changed = added_new = True
 
-            # Write to temporary file first, then rename (atomic write)
-            temp_path = self.index_path.with_suffix('.yaml.tmp')
-            try:
-                if HAS_RUAMEL:
-                    with open(temp_path, 'w', encoding='utf-8') as f:
-                        self.yaml.dump(index, f)
-                else:
-                    with open(temp_path, 'w', encoding='utf-8') as f:
-                        yaml.dump(index, f, default_flow_style=False, sort_keys=True, allow_unicode=True)
+            if not changed:
+                return True  # Every update was a no-op - nothing to persist
 
-                # Atomic rename with retry
-                self._atomic_move_with_retry(temp_path, self.index_path)
-                # Also save JSON for fast loading (>100x faster)
-                self._save_json(index)
-                return True
-            except Exception as e:
-                # Clean up temp file on error
-                if temp_path.exists():
-                    temp_path.unlink()
-                raise e
+            if added_new:
+                # Keep doc_ids ordered with one sort per batch (near-linear on sorted input)
+                index = dict(sorted(index.items()))
+
+            # Group commit under the lock; the log is dropped only after both
+            # files (which include every logged write) are in place
+            self._write_snapshot_files(index)
+            self._publish_snapshot(index)
+            return True
 
         except Exception as e:
             print(f"❌ Error in batch update: {e}")
@@ -680,6 +1108,42 @@ class IndexManager:
             # Always release lock
             self._release_lock()
     
+    def write_all(self, index: Dict) -> bool:
+        """
+        Replace the whole index with one write of index.yaml + index.json
+
+        For callers that compute the complete index themselves (rebuild_index);
+        one locked group commit instead of a logged write per entry.
+
+        Args:
+            index: Complete index (doc_id -> metadata); not mutated
+
+        Returns:
+            True if successful, False otherwise
+        """
+        # Acquire lock with retry
+        if not self._acquire_lock_with_retry("full write"):
+            return False
+
+        try:
+            # Safety check against the on-disk state: refuse to overwrite an
+            # index that exists but failed to load (data loss prevention)
+            if not self._validate_index_not_empty(self._read_snapshot(), "full write"):
+                return False
+
+            index = _sorted_keys(dict(sorted(index.items())))
+            self._write_snapshot_files(index)
+            self._publish_snapshot(index)
+            return True
+
+        except Exception as e:
+            print(f"❌ Error writing index: {e}")
+            return False
+
+        finally:
+            # Always release lock
+            self._release_lock()
+
     def remove_entries_by_filter(self, **filters) -> int:
         """
         Remove multiple entries matching filters
@@ -701,8 +1165,8 @@ class IndexManager:
             return 0
 
         try:
-            # Load existing index
-            index = self.load_all()
+            # Copy the current snapshot (refreshed under the lock)
+            index = dict(self._read_snapshot())
 
             # Remove matching entries
             removed_count = 0
@@ -711,16 +1175,9 @@ class IndexManager:
                     del index[doc_id]
                     removed_count += 1
 
-            # Write back
-            if HAS_RUAMEL:
-                with open(self.index_path, 'w', encoding='utf-8') as f:
-                    self.yaml.dump(index, f)
-            else:
-                with open(self.index_path, 'w', encoding='utf-8') as f:
-                    yaml.dump(index, f, default_flow_style=False, sort_keys=True, allow_unicode=True)
-
-            # Also save JSON for fast loading (>100x faster)
-            self._save_json(index)
+            # Write back (atomic)
+            self._write_snapshot_files(index)
+            self._publish_snapshot(index)
 
             return removed_count
 
@@ -738,20 +1195,35 @@ class IndexManager:
 
         This method loads the YAML index and saves it as JSON for fast loading.
         Use this after manual YAML edits or when the JSON file is missing/corrupted.
+        Pending write-ahead log operations are applied and folded into both files.
 
         Returns:
             True if successful, False otherwise
         """
+        has_wal = self.wal_path.exists()
+        if has_wal and not self._acquire_lock_with_retry("regenerate"):
+            return False
+
         try:
             # Force load from YAML (bypass JSON even if it exists)
             index = self._load_yaml_full()
+            replayed = self._replay_wal(index)
+            # Manual YAML edits may be in any order
+            index = _sorted_keys(index)
 
             if not index:
                 print("⚠️  YAML index is empty, nothing to regenerate")
                 return False
 
+            if replayed:
+                # Compact: index.yaml must include the logged writes before the log is dropped
+                self._write_snapshot_files(index)
+                print(f"✅ Regenerated index.json ({len(index)} entries)")
+                return True
+
             # Save as JSON
             if self._save_json(index):
+                self.wal_path.unlink(missing_ok=True)
                 print(f"✅ Regenerated index.json ({len(index)} entries)")
                 return True
             else:
@@ -762,3 +1234,7 @@ class IndexManager:
             print(f"❌ Error regenerating JSON: {e}")
             return False
 
+        finally:
+            if has_wal:
+                self._release_lock()
+
@@ -23,10 +23,17 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import argparse
+import functools
+import hashlib
 import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from time import monotonic
 
 from utils.cli_utils import add_common_index_args
 from utils.metadata_utils import normalize_keywords, normalize_tags
+from utils.path_config import get_cache_dir
 from utils.script_utils import (
     configure_utf8_output,
     resolve_base_dir,
@@ -51,6 +58,34 @@ except ImportError:
     print("Make sure index_manager.py is available (management/index_manager.py).")
     sys.exit(EXIT_INDEX_ERROR)
 
+# Extraction results are persisted in chunks of this many entries (--flush-every)
+BATCH_FLUSH_SIZE = 500
+CHECKPOINT_FILENAME = 'extract_checkpoint.jsonl'  # Unflushed extraction results (in the local cache dir)
+PREFETCH_THREADS = 4  # Reader threads prefetching document bytes in serial extraction
+PREFETCH_DEPTH = 32  # Max documents read ahead of the extractor (bounds memory)
+PROGRESS_MIN_INTERVAL = 0.5  # Seconds between extract-keywords progress lines
+PROGRESS_RATE_SMOOTHING = 0.3  # EMA weight of the newest rate sample in the ETA
+
+# Metadata field names, interned so key compares and dict probes take the identity fast path
+TITLE, DESCRIPTION, KEYWORDS, TAGS, CATEGORY, DOMAIN, SUBSECTIONS = map(
+    sys.intern, ('title', 'description', 'keywords', 'tags', 'category', 'domain', 'subsections')
+)
+
+# Metadata fields an entry needs to count as complete, and the fields extraction may update
+REQUIRED_KEYS = (TITLE, DESCRIPTION, KEYWORDS, TAGS, CATEGORY, DOMAIN)
+REQUIRED_KEY_SET = frozenset(REQUIRED_KEYS)
+EXTRACT_KEYS = REQUIRED_KEYS + (SUBSECTIONS,)
+
+# Optional faster JSON encoder for --json output
+try:
+    import orjson
+
+    def _dumps_json(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+except ImportError:
+    def _dumps_json(obj) -> str:
+        return json.dumps(obj, indent=2)
+
 # Import metadata extractor (optional)
 try:
     from management.extract_metadata import MetadataExtractor
@@ -271,11 +306,33 @@ def cmd_update_metadata(manager: IndexManager, doc_id: str, field: str, value: s
         print(f"❌ Failed to update {field} for {doc_id}")
         sys.exit(1)
 
-def _auto_install_optional_dependencies(verbose: bool = False) -> None:
+@functools.lru_cache(maxsize=1)
+def _get_environment_info() -> dict | None:
+    """Return interpreter/pip diagnostics (probed once per process), or None if unavailable."""
+    try:
+        from setup.setup_dependencies import get_python_environment_info
+        return get_python_environment_info()
+    except Exception:
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _get_effective_spacy_status() -> dict | None:
+    """Return effective spaCy availability (probed once per process), or None if unknown."""
+    try:
+        from setup.setup_dependencies import get_effective_spacy_status  # type: ignore
+        return get_effective_spacy_status()
+    except Exception:
+        return None
+
+def _auto_install_optional_dependencies(verbose: bool = False) -> bool:
     """Auto-install optional dependencies if missing (uses pre-built wheels when possible)
 
     This function is intentionally best-effort only: failures here should never
     prevent keyword extraction from proceeding with fallback methods.
+
+    Returns:
+        True if any installation was attempted (callers should refresh
+        dependency flags), False otherwise
     """
     import sys  # Ensure sys is available in this scope
     try:
@@ -285,11 +342,11 @@ def _auto_install_optional_dependencies(verbose: bool = False) -> None:
             run_pip_install,
             install_spacy_with_model,
             detect_python_for_spacy,
-            get_python_environment_info,
+            clear_probe_caches,
         )
 
         # Capture environment snapshot for diagnostics
-        env_info = get_python_environment_info()
+        env_info = _get_environment_info() or {}
 
         # Check availability by trying to import directly (current interpreter)
         yake_available = check_import('yake')
@@ -315,12 +372,13 @@ def _auto_install_optional_dependencies(verbose: bool = False) -> None:
         needs_python313 = python_version >= '3.14' or python_version < '3.7'
 
         # Always show what we're checking (diagnostic)
-        if verbose:
+        if verbose and env_info:
             print("  🔍 Keyword extraction environment:")
             print(f"     Python: {env_info['python_version']} at {env_info['python_executable']}")
             if env_info.get('pip_location'):
                 match = "matches" if env_info.get('pip_python_match') else "may not match"
                 print(f"     pip:    {env_info['pip_location']} ({match} this interpreter)")
+        if verbose:
             print(f"  🔍 Dependency check: YAKE={yake_available}, spaCy={spacy_available}, spaCy model={spacy_model_available}")
             print(f"  🔍 Missing: YAKE={not yake_available}, spaCy={spacy_missing}, spaCy model={spacy_model_missing}")
             print(f"  🔍 Python version: {python_version}, Python 3.13 available: {python313_available is not None}")
@@ -375,14 +433,14 @@ def _auto_install_optional_dependencies(verbose: bool = False) -> None:
                     print("     Scripts will continue with fallback stop words")
                     print()
 
-            # Force reload of extract_metadata to pick up newly installed packages
-            # Remove from cache to force fresh import
-            if 'extract_metadata' in sys.modules:
-                del sys.modules['extract_metadata']
-            # Re-import to get fresh constants
-            import extract_metadata  # noqa: F401
+            # Environment probes are stale after installing packages
+            _get_environment_info.cache_clear()
+            _get_effective_spacy_status.cache_clear()
+            clear_probe_caches()
             print("=" * 60)
             print()
+            return True
+        return False
     except Exception as e:
         # If auto-install fails, show error but continue with fallbacks
         print(f"⚠️  Auto-install failed: {e}")
@@ -391,62 +449,206 @@ def _auto_install_optional_dependencies(verbose: bool = False) -> None:
             traceback.print_exc()
         print("   Scripts will continue with fallback methods")
         print()
+        return False
 
-def cmd_extract_keywords(manager: IndexManager, base_dir: Path, skip_existing: bool = True, verbose: bool = False, auto_install: bool = True, json_output: bool = False) -> None:
+def _snapshot_existing_files(base_dir: Path) -> frozenset[str]:
     """
-    Extract keywords from all documents (uses batch updates for efficiency)
-    
+    Collect every file under base_dir in a single directory walk
+
+    Lets callers test many index paths for existence with set lookups
+    instead of one stat() per entry.
+
     Args:
-        manager: IndexManager instance
         base_dir: Base directory for references
-        skip_existing: Skip files that already have all metadata fields (default: True)
-        verbose: Print detailed progress (default: False)
-        auto_install: Auto-install optional dependencies if missing (default: True)
+
+    Returns:
+        Frozenset of file paths relative to base_dir, in POSIX form
     """
-    if not MetadataExtractor:
-        print("❌ Error: extract_metadata module not available")
-        sys.exit(1)
+    existing = set()
+    for root, _dirs, files in os.walk(base_dir):
+        rel_root = Path(root).relative_to(base_dir).as_posix()
+        prefix = '' if rel_root == '.' else rel_root + '/'
+        existing.update(prefix + name for name in files)
+    return frozenset(existing)
+
+def _has_min_meaningful_keywords(keywords, n: int = 3, min_len: int = 4) -> bool:
+    """Return True once n keywords of at least min_len characters are seen (early exit)."""
+    count = 0
+    for k in keywords:
+        if isinstance(k, str):
+            if len(k) < min_len:
+                continue
+        elif not k or len(str(k)) < min_len:
+            continue
+        count += 1
+        if count >= n:
+            return True
+    return False
+
+def _decide_default(existing_value, skip_existing: bool) -> bool:
+    """Update a field only if it is missing or empty."""
+    return not existing_value
+
+def _decide_keywords(existing_value, skip_existing: bool) -> bool:
+    """Update keywords if forced, empty, or fewer than 3 meaningful (4+ chars) keywords."""
+    # FIX 2025-11-25: Previously ignored skip_existing for per-field decisions
+    if not skip_existing or not existing_value:
+        return True
+    return isinstance(existing_value, list) and not _has_min_meaningful_keywords(existing_value)
+
+def _decide_always(existing_value, skip_existing: bool) -> bool:
+    """Always update (tags pick up config changes; subsections are always re-extracted)."""
+    return True
+
+# Per-field update decisions for extracted metadata (default: _decide_default)
+_SHOULD_UPDATE = {
+    KEYWORDS: _decide_keywords,
+    TAGS: _decide_always,
+    SUBSECTIONS: _decide_always,
+}
+
+def _load_extract_checkpoint(checkpoint_path: Path) -> dict:
+    """
+    Load extraction results left by an interrupted extract-keywords run
     
-    # Auto-install optional dependencies if missing (before checking status)
-    if auto_install:
-        if verbose:
-            print("🔧 Auto-install enabled - checking for missing dependencies...")
-        _auto_install_optional_dependencies(verbose=verbose)
+    Args:
+        checkpoint_path: Path to the JSONL checkpoint file
     
-    # Check and report dependency status (after potential auto-install)
-    # Import or re-import to get current constants
-    if 'extract_metadata' in sys.modules:
-        from importlib import reload
-        import extract_metadata
-        reload(extract_metadata)
-    else:
-        import extract_metadata
-    from management.extract_metadata import YAKE_AVAILABLE, SPACY_AVAILABLE
+    Returns:
+        Dictionary of doc_id -> update dict (empty if there is no checkpoint)
+    """
+    resumed = {}
+    if not checkpoint_path.exists():
+        return resumed
+    try:
+        with open(checkpoint_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # Torn final line from a killed run
+                resumed[record['id']] = record['u']
+    except (OSError, KeyError, TypeError) as e:
+        print(f"⚠️  Warning: Ignoring unreadable extraction checkpoint {checkpoint_path}: {e}")
+        return {}
+    return resumed
+
+def _iter_prefetched(work_items: list):
+    """
+    Yield work items with their file bytes, read ahead by a small thread pool
+
+    File reads release the GIL, so the next documents are loaded while the
+    current one is being extracted. At most PREFETCH_DEPTH reads are in flight.
+
+    Args:
+        work_items: _extract_one() argument tuples (file path at index 1)
 
-    # Attempt to get environment info and effective spaCy status for a clear summary
-    env_info = None
-    effective_spacy = None
+    Yields:
+        Tuples of (work_item, bytes or None if the read failed)
+    """
+    items = iter(work_items)
+    with ThreadPoolExecutor(max_workers=PREFETCH_THREADS, thread_name_prefix='extract-read') as pool:
+        window = deque()
+        for item in items:
+            window.append((item, pool.submit(Path(item[1]).read_bytes)))
+            if len(window) >= PREFETCH_DEPTH:
+                break
+        while window:
+            item, future = window.popleft()
+            next_item = next(items, None)
+            if next_item is not None:
+                window.append((next_item, pool.submit(Path(next_item[1]).read_bytes)))
+            try:
+                data = future.result()
+            except OSError:
+                data = None  # _extract_one() re-reads and reports the error
+            yield item, data
+
+def _extractor_config() -> bytes:
+    """
+    Describe the optional extractors MetadataExtractor will use (folded into extracted_hash)
+    
+    Read from the extractor's module, so a reload after installing YAKE or
+    spaCy is reflected.
+    
+    Returns:
+        Extractor availability flags as bytes
+    """
+    extract_metadata = sys.modules[MetadataExtractor.__module__]
+    return f"yake={extract_metadata.YAKE_AVAILABLE};spacy={extract_metadata.SPACY_AVAILABLE}".encode()
+
+def _extract_one(doc_id: str, file_path: str, url: str, metadata: dict, skip_existing: bool, data: bytes | None = None) -> tuple:
+    """
+    Extract metadata for a single document and decide which fields to update
+
+    Defined at module level so it can be pickled and run in a process pool.
+
+    Args:
+        doc_id: Document ID
+        file_path: Absolute path to the document file
+        url: Source URL for the document
+        metadata: Current index entry for the document (not modified)
+        skip_existing: Whether existing metadata should be preserved
+        data: File bytes if already read (the file is read here otherwise)
+
+    Returns:
+        Tuple of (doc_id, update_dict or None, stats or None, error or None)
+    """
     try:
-        from setup.setup_dependencies import get_python_environment_info, get_effective_spacy_status  # type: ignore
-        env_info = get_python_environment_info()
-        effective_spacy = get_effective_spacy_status()
-    except Exception:
-        env_info = None
-        effective_spacy = None
+        # Read once; the same bytes feed the hash and the extractor
+        if data is None:
+            data = Path(file_path).read_bytes()
+        # Covers the extractor setup as well as the bytes, so metadata extracted
+        # before YAKE or spaCy became available is extracted again
+        hasher = hashlib.blake2b(_extractor_config(), digest_size=16)
+        hasher.update(data)
+        file_hash = hasher.hexdigest()
+        # Metadata was already extracted from these exact bytes by the same extractors
+        if skip_existing and metadata.get('extracted_hash') == file_hash:
+            return doc_id, None, None, None
+        extractor = MetadataExtractor.from_bytes(Path(file_path), data, url)
+        extracted = extractor.extract_all(track_stats=True)
+    except Exception as e:
+        return doc_id, None, None, str(e)
 
-    print("🔍 Extracting metadata from all documents...")
-    print()
-    print("📦 Dependency Status:")
-    print("=" * 60)
+    stats = extracted.pop('_stats', None)  # Remove stats from metadata
 
-    print("   Required Dependencies: ✅ All installed")
-    print()
-    print("   Optional Dependencies:")
-    print(f"      YAKE: {'✅ Available' if YAKE_AVAILABLE else '❌ Missing'}")
-    if YAKE_AVAILABLE:
-        print("         → Enhanced keyword extraction enabled")
+    # Collect updates (only new fields, or if existing field is empty/not useful)
+    # When skip_existing=False (--no-skip-existing), force update keywords and tags
+    # Gather (key, value) pairs and build the update dict once, only if non-empty
+    md_get = metadata.get
+    decide_get = _SHOULD_UPDATE.get
+    pending = [
+        (key, extracted[key])
+        for key in EXTRACT_KEYS
+        if key in extracted and decide_get(key, _decide_default)(md_get(key), skip_existing)
+    ]
+    if md_get('extracted_hash') != file_hash:
+        pending.append(('extracted_hash', file_hash))
+
+    return doc_id, dict(pending) if pending else None, stats, None
+
+def _print_dependency_banner(env_info: dict | None, effective_spacy: dict | None, yake_available: bool) -> None:
+    """
+    Print the extract-keywords dependency and environment summary
+
+    Args:
+        env_info: Interpreter/pip diagnostics (or None if unavailable)
+        effective_spacy: Effective spaCy status (or None if unknown)
+        yake_available: Whether YAKE is importable
+    """
+    lines = []
+    lines.append("📦 Dependency Status:")
+    lines.append("=" * 60)
+
+    lines.append("   Required Dependencies: ✅ All installed")
+    lines.append("")
+    lines.append("   Optional Dependencies:")
+    lines.append(f"      YAKE: {'✅ Available' if yake_available else '❌ Missing'}")
+    if yake_available:
+        lines.append("         → Enhanced keyword extraction enabled")
     else:
-        print("         → Using heading/content analysis (still effective)")
+        lines.append("         → Using heading/content analysis (still effective)")
 
     # For spaCy, distinguish clearly between current-interpreter importability
     # and overall usage (which may come via a separate Python 3.13 process).
@@ -459,63 +661,135 @@ def cmd_extract_keywords(manager: IndexManager, base_dir: Path, skip_existing: b
         effective_python = effective_spacy.get("effective_python")
 
         if current_importable:
-            print("      spaCy (current interpreter): ✅ Importable")
+            lines.append("      spaCy (current interpreter): ✅ Importable")
             if current_model:
-                print("      spaCy Model (current): ✅ Available")
+                lines.append("      spaCy Model (current): ✅ Available")
             else:
-                print("      spaCy Model (current): ⚠️  Not loadable")
+                lines.append("      spaCy Model (current): ⚠️  Not loadable")
         else:
-            print("      spaCy (current interpreter): ❌ Not importable")
+            lines.append("      spaCy (current interpreter): ❌ Not importable")
 
         if effective_available:
             if effective_python and effective_python != sys.executable:
-                print(f"      spaCy (effective): ✅ Available via {effective_python}")
+                lines.append(f"      spaCy (effective): ✅ Available via {effective_python}")
             else:
-                print("      spaCy (effective): ✅ Available in current interpreter")
+                lines.append("      spaCy (effective): ✅ Available in current interpreter")
         else:
-            print("      spaCy (effective): ❌ Not available in any supported interpreter")
+            lines.append("      spaCy (effective): ❌ Not available in any supported interpreter")
 
         if effective_model_available:
             loc = effective_spacy.get("model_location")
             if loc:
-                print(f"      spaCy Model (effective): ✅ Available at {loc}")
+                lines.append(f"      spaCy Model (effective): ✅ Available at {loc}")
         else:
-            print("      spaCy Model (effective): ⚠️  Not loadable in any interpreter")
+            lines.append("      spaCy Model (effective): ⚠️  Not loadable in any interpreter")
     else:
-        print("      spaCy: ⚠️  Status unknown (could not determine effective spaCy availability)")
+        lines.append("      spaCy: ⚠️  Status unknown (could not determine effective spaCy availability)")
 
     # Show interpreter details for context
     if env_info is not None:
-        print()
-        print("   Python Environment (for this extraction run):")
-        print(f"      Version:    {env_info['python_version']}")
-        print(f"      Executable: {env_info['python_executable']}")
+        lines.append("")
+        lines.append("   Python Environment (for this extraction run):")
+        lines.append(f"      Version:    {env_info['python_version']}")
+        lines.append(f"      Executable: {env_info['python_executable']}")
         if env_info.get('pip_location'):
             match = "matches" if env_info.get('pip_python_match') else "may not match"
-            print(f"      pip:        {env_info['pip_location']} ({match} this interpreter)")
+            lines.append(f"      pip:        {env_info['pip_location']} ({match} this interpreter)")
 
-    print("=" * 60)
-    print()
+    lines.append("=" * 60)
+    lines.append("")
+    # One write instead of a print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def cmd_extract_keywords(manager: IndexManager, base_dir: Path, skip_existing: bool = True, verbose: bool = False, auto_install: bool = True, json_output: bool = False, workers: int | None = None, flush_every: int = BATCH_FLUSH_SIZE, validation_stats: dict | None = None, only: list[str] | None = None) -> list[str]:
+    """
+    Extract keywords from all documents (uses batch updates for efficiency)
+    
+    Args:
+        manager: IndexManager instance
+        base_dir: Base directory for references
+        skip_existing: Skip files that already have all metadata fields (default: True)
+        verbose: Print detailed progress (default: False)
+        auto_install: Auto-install optional dependencies if missing (default: True)
+        workers: Number of extraction processes (default: os.cpu_count(); 1 runs serially)
+        flush_every: Persist queued updates every N entries (default: BATCH_FLUSH_SIZE)
+        validation_stats: If given, counters from _new_validation_stats() that are
+            updated with each entry's final metadata during the same pass
+        only: If given, restrict extraction to these doc_ids (e.g. the ids
+            changed by the last rebuild); unknown ids are ignored
+    
+    Returns:
+        Sorted doc_ids whose extraction or index update failed
+    """
+    if not MetadataExtractor:
+        print("❌ Error: extract_metadata module not available")
+        sys.exit(1)
+    
+    # Auto-install optional dependencies if missing (before checking status)
+    installed_something = False
+    if auto_install:
+        if verbose:
+            print("🔧 Auto-install enabled - checking for missing dependencies...")
+        installed_something = _auto_install_optional_dependencies(verbose=verbose)
+    
+    # Check and report dependency status (after potential auto-install)
+    # Reload the canonical module (the one MetadataExtractor comes from) only
+    # when packages were just installed, to get current constants
+    import management.extract_metadata as extract_metadata
+    if installed_something:
+        from importlib import reload
+        reload(extract_metadata)
+    YAKE_AVAILABLE = getattr(extract_metadata, 'YAKE_AVAILABLE', False)
+    SPACY_AVAILABLE = getattr(extract_metadata, 'SPACY_AVAILABLE', False)
+
+    # Effective spaCy status for a clear summary (cached per process)
+    effective_spacy = _get_effective_spacy_status()
+
+    print("🔍 Extracting metadata from all documents...")
+    # Full banner for interactive/verbose runs; one line when piped to a log
+    if verbose or sys.stdout.isatty():
+        print()
+        _print_dependency_banner(_get_environment_info(), effective_spacy, YAKE_AVAILABLE)
+    else:
+        spacy_effective = bool(effective_spacy and effective_spacy.get('effective_available'))
+        print(f"   (YAKE={YAKE_AVAILABLE}, spaCy={spacy_effective}; use --verbose for dependency details)")
+        print()
     if skip_existing:
         print("   (Skipping files that already have metadata)")
     print("   (Using batch updates for efficiency)")
     
-    # Count total entries first for progress
-    total_count = manager.get_entry_count()
+    # Count and iterate from one snapshot view (no second pass over the index)
+    entries = manager.entries_view()
+    if only is not None:
+        only_ids = set(only)
+        entries = [(doc_id, metadata) for doc_id, metadata in entries if doc_id in only_ids]
+        print(f"   (Incremental: {len(entries)} of {len(only_ids)} requested documents in index)")
+    total_count = len(entries)
     processed = 0
     skipped = 0
-    updates = {}  # Batch all updates
+    updates = {}  # Pending updates, flushed every flush_every entries
+    updated_count = 0
     error_count = 0
+    failed_ids = []  # Doc_ids to retry (extraction error or failed batch)
     
-    # Progress tracking for time estimates
-    import time
-    start_time = time.time()
-    progress_interval = 50  # Show progress every N files
+    # Results computed since the last successful flush are also appended to a
+    # checkpoint so a killed run can resume without re-extracting them
+    checkpoint_path = get_cache_dir(base_dir) / CHECKPOINT_FILENAME
+    checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+    resumed = _load_extract_checkpoint(checkpoint_path)
+    if resumed:
+        print(f"   (Resuming: {len(resumed)} extracted entries recovered from checkpoint)")
+    checkpoint = open(checkpoint_path, 'a', encoding='utf-8', buffering=1)
+    checkpoint_clean = True  # False once a batch fails; its entries stay checkpointed
+    
+    # Progress tracking for time estimates (rate-limited; stderr when stdout is piped)
+    last_print = monotonic()
+    last_print_count = 0
+    rate = 0.0  # Smoothed docs/second over recent progress windows
+    progress_stream = sys.stdout if sys.stdout.isatty() else sys.stderr
 
     def _format_eta(processed_count: int) -> str:
-        """Return a human-friendly ETA string based on current progress."""
-        elapsed = time.time() - start_time
-        rate = processed_count / elapsed if elapsed > 0 else 0
+        """Return a human-friendly ETA string based on the smoothed processing rate."""
         remaining = total_count - processed_count
         eta_seconds = remaining / rate if rate > 0 else 0
         eta_minutes = eta_seconds / 60
@@ -537,122 +811,174 @@ def cmd_extract_keywords(manager: IndexManager, base_dir: Path, skip_existing: b
         'total_filename_keywords': 0,
     }
     
-    for doc_id, metadata in manager.list_entries():
+    def _maybe_print_progress() -> None:
+        """Print progress at most every PROGRESS_MIN_INTERVAL seconds (and at completion)."""
+        nonlocal last_print, last_print_count, rate
+        if verbose:
+            return
+        now = monotonic()
+        elapsed = now - last_print
+        if elapsed < PROGRESS_MIN_INTERVAL and processed != total_count:
+            return
+        if elapsed > 0:
+            sample = (processed - last_print_count) / elapsed
+            rate = sample if rate == 0 else PROGRESS_RATE_SMOOTHING * sample + (1 - PROGRESS_RATE_SMOOTHING) * rate
+        last_print, last_print_count = now, processed
+        pct = processed * 100 // total_count
+        print(
+            f"  [{processed}/{total_count}] Progress: {skipped} skipped, {updated_count + len(updates)} queued for update... "
+            f"({pct}% complete, ~{_format_eta(processed)} remaining)",
+            file=progress_stream,
+        )
+
+    def _flush_updates() -> None:
+        """Persist pending updates in one batch and start a new chunk."""
+        nonlocal updated_count, error_count, checkpoint_clean
+        if not updates:
+            return
+        if verbose:
+            print(f"  💾 Applying {len(updates)} updates in batch...")
+        if manager.batch_update_entries(updates):
+            updated_count += len(updates)
+            if checkpoint_clean:
+                # Everything checkpointed so far is now in the index
+                checkpoint.seek(0)
+                checkpoint.truncate()
+        else:
+            error_count += len(updates)
+            failed_ids.extend(updates)
+            checkpoint_clean = False
+            print(f"   ❌ Failed to apply batch update ({len(updates)} entries)")
+        updates.clear()
+
+    def _validate(metadata: dict) -> None:
+        """Count an entry's final metadata when running extract-and-validate."""
+        if validation_stats is not None:
+            _update_validation_stats(validation_stats, metadata, existing_files)
+
+    def _collect(result: tuple) -> None:
+        """Merge one _extract_one() result into the aggregate stats and pending updates."""
+        nonlocal processed, skipped, error_count
+        doc_id, update_dict, stats, error = result
         processed += 1
+        if validation_stats is not None:
+            metadata = entries_by_id[doc_id]
+            _validate({**metadata, **update_dict} if update_dict else metadata)
+        if error is not None:
+            error_count += 1
+            failed_ids.append(doc_id)
+            if verbose:
+                print(f"  [{processed}/{total_count}] ⚠️  Error processing {doc_id}: {error}")
+            return
+
+        if stats:
+            if stats.get('yake_used'):
+                stats_aggregate['yake_used_count'] += 1
+                stats_aggregate['total_yake_keywords'] += stats.get('yake_keywords_count', 0)
+            if stats.get('spacy_used'):
+                stats_aggregate['spacy_used_count'] += 1
+            stats_aggregate['total_frontmatter_keywords'] += stats.get('frontmatter_keywords_count', 0)
+            stats_aggregate['total_heading_keywords'] += stats.get('heading_keywords_count', 0)
+            stats_aggregate['total_title_desc_keywords'] += stats.get('title_desc_keywords_count', 0)
+            stats_aggregate['total_body_keywords'] += stats.get('body_content_keywords_count', 0)
+            stats_aggregate['total_filename_keywords'] += stats.get('filename_keywords_count', 0)
+
+        if update_dict:
+            # Only pass the new fields to update, not the entire metadata dict
+            # This prevents overwriting critical fields like 'path', 'url', 'hash'
+            updates[doc_id] = update_dict
+            checkpoint.write(json.dumps({'id': doc_id, 'u': update_dict}) + '\n')
+            if verbose:
+                print(f"  [{processed}/{total_count}] ✅ Queued {doc_id}")
+            if len(updates) >= flush_every:
+                _flush_updates()
+        else:
+            skipped += 1
+        _maybe_print_progress()
+
+    # Single pass over the index: resolve paths and apply skip checks up front so
+    # only documents that actually need extraction are dispatched to workers
+    work_items = []
+    entries_by_id = {}  # Metadata of dispatched entries (only kept for validation)
+    existing_files = _snapshot_existing_files(base_dir)
+    if skip_existing and validation_stats is None and only is None:
+        # Let the manager drop complete entries; they only count as skipped
+        scan_entries = manager.list_entries_missing(REQUIRED_KEYS)
+        skipped = total_count - manager.count_missing(REQUIRED_KEYS)
+        processed = skipped
+    else:
+        scan_entries = entries
+    for doc_id, metadata in scan_entries:
+        # Already extracted by an interrupted run (still in the checkpoint file)
+        if doc_id in resumed:
+            processed += 1
+            update_dict = resumed.pop(doc_id)
+            updates[doc_id] = update_dict
+            _validate({**metadata, **update_dict})
+            if len(updates) >= flush_every:
+                _flush_updates()
+            continue
+
         path_str = metadata.get('path')
         if not path_str:
+            processed += 1
+            _validate(metadata)
             continue
-        
+
         file_path = base_dir / path_str
-        if not file_path.exists():
+        if path_str.replace('\\', '/') not in existing_files:
+            processed += 1
+            _validate(metadata)
             if verbose:
                 print(f"  [{processed}/{total_count}] ⚠️  File not found: {doc_id}")
             continue
-        
+
         # Check if we should skip (already has all metadata)
         if skip_existing:
-            has_all_metadata = all(key in metadata for key in ['title', 'description', 'keywords', 'tags', 'category', 'domain'])
-            if has_all_metadata:
+            if REQUIRED_KEY_SET <= metadata.keys():
+                processed += 1
                 skipped += 1
-                # Show progress periodically (every progress_interval files or at milestones)
-                if not verbose and (processed % progress_interval == 0 or processed == total_count):
-                    eta_str = _format_eta(processed)
-                    print(
-                        f"  [{processed}/{total_count}] Progress: {skipped} skipped, {len(updates)} queued for update... "
-                        f"({processed*100//total_count}% complete, ~{eta_str} remaining)"
-                    )
+                _validate(metadata)
+                _maybe_print_progress()
                 continue
-        
-        try:
-            url = metadata.get('url', '')
-            extractor = MetadataExtractor(file_path, url)
-            extracted = extractor.extract_all(track_stats=True)
-            
-            # Collect statistics
-            if '_stats' in extracted:
-                stats = extracted.pop('_stats')  # Remove stats from metadata
-                if stats.get('yake_used'):
-                    stats_aggregate['yake_used_count'] += 1
-                    stats_aggregate['total_yake_keywords'] += stats.get('yake_keywords_count', 0)
-                if stats.get('spacy_used'):
-                    stats_aggregate['spacy_used_count'] += 1
-                stats_aggregate['total_frontmatter_keywords'] += stats.get('frontmatter_keywords_count', 0)
-                stats_aggregate['total_heading_keywords'] += stats.get('heading_keywords_count', 0)
-                stats_aggregate['total_title_desc_keywords'] += stats.get('title_desc_keywords_count', 0)
-                stats_aggregate['total_body_keywords'] += stats.get('body_content_keywords_count', 0)
-                stats_aggregate['total_filename_keywords'] += stats.get('filename_keywords_count', 0)
-            
-            # Collect updates (only new fields, or if existing field is empty/not useful)
-            # When skip_existing=False (--no-skip-existing), force update all fields
-            update_dict = {}
-            for key in ['title', 'description', 'keywords', 'tags', 'category', 'domain', 'subsections']:
-                if key in extracted:
-                    # Update if field doesn't exist, is empty, or for keywords if it's not useful (empty or too short)
-                    existing_value = metadata.get(key)
-                    should_update = False
-
-                    # When --no-skip-existing is used, force update keywords and tags
-                    # FIX 2025-11-25: Previously ignored skip_existing for per-field decisions
-                    if not skip_existing and key in ['keywords', 'tags']:
-                        should_update = True
-                    elif existing_value is None:
-                        should_update = True
-                    elif key == 'keywords':
-                        # Update keywords if empty, empty string, or has fewer than 3 meaningful keywords
-                        if not existing_value or (isinstance(existing_value, list) and len([k for k in existing_value if k and len(str(k)) >= 4]) < 3):
-                            should_update = True
-                    elif key == 'subsections':
-                        # Always update subsections (new feature, always extract)
-                        should_update = True
-                    elif key == 'tags':
-                        # Always re-extract tags to pick up config changes (threshold, term list updates)
-                        should_update = True
-                    elif not existing_value:  # Empty string or empty list
-                        should_update = True
-
-                    if should_update:
-                        update_dict[key] = extracted[key]
-            
-            if update_dict:
-                # Only pass the new fields to update, not the entire metadata dict
-                # This prevents overwriting critical fields like 'path', 'url', 'hash'
-                updates[doc_id] = update_dict
-                
-                if verbose:
-                    print(f"  [{processed}/{total_count}] ✅ Queued {doc_id}")
-                # Show progress periodically (every progress_interval files or at milestones)
-                elif processed % progress_interval == 0 or processed == total_count:
-                    eta_str = _format_eta(processed)
-                    print(
-                        f"  [{processed}/{total_count}] Progress: {skipped} skipped, {len(updates)} queued for update... "
-                        f"({processed*100//total_count}% complete, ~{eta_str} remaining)"
-                    )
-            else:
-                skipped += 1
-                # Show progress periodically
-                if not verbose and (processed % progress_interval == 0 or processed == total_count):
-                    eta_str = _format_eta(processed)
-                    print(
-                        f"  [{processed}/{total_count}] Progress: {skipped} skipped, {len(updates)} queued for update... "
-                        f"({processed*100//total_count}% complete, ~{eta_str} remaining)"
-                    )
-        except Exception as e:
-            error_count += 1
-            if verbose:
-                print(f"  [{processed}/{total_count}] ⚠️  Error processing {doc_id}: {e}")
-    
-    # Batch update all entries at once (much faster!)
+
+        if validation_stats is not None:
+            entries_by_id[doc_id] = metadata
+        work_items.append((doc_id, str(file_path), metadata.get('url', ''), metadata, skip_existing))
+
+    # Checkpointed results the scan never reached (dropped by the fast path or
+    # outside --only) are applied as well; truncating the checkpoint would lose them
+    for doc_id, update_dict in resumed.items():
+        if manager.get_entry(doc_id) is not None:
+            updates[doc_id] = update_dict
+    resumed.clear()
+    if len(updates) >= flush_every:
+        _flush_updates()
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(work_items) <= 1:
+        # Serial path (kept for debuggability and tiny workloads); reads overlap extraction
+        for item, data in _iter_prefetched(work_items):
+            _collect(_extract_one(*item, data=data))
+    else:
+        # Each worker warms the extractor caches once, not once per task
+        with ProcessPoolExecutor(max_workers=min(workers, len(work_items)),
+                                 initializer=MetadataExtractor.preload) as executor:
+            futures = [executor.submit(_extract_one, *item) for item in work_items]
+            for future in as_completed(futures):
+                _collect(future.result())
+
+    # Flush the final partial chunk
     if updates:
         print(f"\n💾 Applying {len(updates)} updates in batch...")
-        if manager.batch_update_entries(updates):
-            updated_count = len(updates)
-            print(f"   ✅ Successfully updated {updated_count} entries")
-        else:
-            error_count += len(updates)
-            print(f"   ❌ Failed to apply batch update")
-            updated_count = 0
-    else:
-        updated_count = 0
+    _flush_updates()
+    checkpoint.close()
+    if checkpoint_clean:
+        checkpoint_path.unlink(missing_ok=True)
+    if updated_count:
+        print(f"   ✅ Successfully updated {updated_count} entries")
     
     print(f"\n📊 Extraction complete:")
     print(f"   Processed: {processed}/{total_count}")
@@ -711,7 +1037,7 @@ def cmd_extract_keywords(manager: IndexManager, base_dir: Path, skip_existing: b
                 print()
                 print("      To install or repair spaCy + model:")
                 try:
-                    from setup_dependencies import install_spacy_with_model, detect_package_manager
+                    from setup.setup_dependencies import install_spacy_with_model, detect_package_manager
                     _ = install_spacy_with_model  # type: ignore[unused-ignore]
                     _ = detect_package_manager()  # Called to verify import works
                     print("      Auto-install (recommended): python setup_dependencies.py --install-all")
@@ -726,6 +1052,81 @@ def cmd_extract_keywords(manager: IndexManager, base_dir: Path, skip_existing: b
             print()
             print("   Note: Scripts work with fallbacks, but enhanced features require these dependencies")
 
+    return sorted(failed_ids)
+
+def _new_validation_stats() -> dict:
+    """Return zeroed metadata validation counters."""
+    return {
+        'total': 0,
+        'has_title': 0,
+        'has_description': 0,
+        'has_keywords': 0,
+        'has_tags': 0,
+        'has_category': 0,
+        'has_domain': 0,
+        'has_all_metadata': 0,
+        'empty_keywords': 0,
+        'minimal_keywords': 0,  # Less than 3 keywords
+        'missing_files': 0,
+        'coverage': {}
+    }
+
+def _update_validation_stats(stats: dict, metadata: dict, existing_files: frozenset[str]) -> None:
+    """
+    Count one entry's metadata into validation stats (each field read once)
+    
+    Args:
+        stats: Counters from _new_validation_stats()
+        metadata: Final metadata for the entry
+        existing_files: Snapshot from _snapshot_existing_files()
+    """
+    md_get = metadata.get
+    title = bool(md_get(TITLE))
+    description = bool(md_get(DESCRIPTION))
+    keywords = md_get(KEYWORDS)
+    tags = bool(md_get(TAGS))
+    category = bool(md_get(CATEGORY))
+    domain = bool(md_get(DOMAIN))
+
+    stats['total'] += 1
+    stats['has_title'] += title
+    stats['has_description'] += description
+    stats['has_tags'] += tags
+    stats['has_category'] += category
+    stats['has_domain'] += domain
+    if keywords:
+        stats['has_keywords'] += 1
+        if not _has_min_meaningful_keywords(keywords):
+            stats['minimal_keywords'] += 1
+    elif KEYWORDS in metadata:
+        stats['empty_keywords'] += 1
+    if keywords and title and description and tags and category and domain:
+        stats['has_all_metadata'] += 1
+
+    # Check if file exists
+    path_str = md_get('path')
+    if path_str and path_str.replace('\\', '/') not in existing_files:
+        stats['missing_files'] += 1
+
+def cmd_extract_and_validate(manager: IndexManager, base_dir: Path, json_output: bool = False, **extract_kwargs) -> None:
+    """
+    Extract metadata and validate it in a single pass over the index
+    
+    Equivalent to extract-keywords followed by validate-metadata, but the
+    validation counters are updated from each entry's final metadata while
+    extracting instead of re-reading the index afterwards.
+    
+    Args:
+        manager: IndexManager instance
+        base_dir: Base directory for references
+        json_output: Output the validation results as JSON
+        **extract_kwargs: Options passed through to cmd_extract_keywords()
+    """
+    stats = _new_validation_stats()
+    cmd_extract_keywords(manager, base_dir, validation_stats=stats, **extract_kwargs)
+    print()
+    _report_validation_stats(stats, json_output=json_output)
+
 def cmd_validate_metadata(manager: IndexManager, base_dir: Path, json_output: bool = False) -> None:
     """
     Validate metadata quality after extraction
@@ -740,56 +1141,23 @@ def cmd_validate_metadata(manager: IndexManager, base_dir: Path, json_output: bo
         base_dir: Base directory for references
         json_output: Output results as JSON
     """
-    total_count = manager.get_entry_count()
+    stats = _new_validation_stats()
+    existing_files = _snapshot_existing_files(base_dir)
+    for _doc_id, metadata in manager.entries_view():
+        _update_validation_stats(stats, metadata, existing_files)
+    _report_validation_stats(stats, json_output=json_output)
+
+def _report_validation_stats(stats: dict, json_output: bool = False) -> None:
+    """
+    Compute coverage and print the validation report
     
-    # Statistics
-    stats = {
-        'total': total_count,
-        'has_title': 0,
-        'has_description': 0,
-        'has_keywords': 0,
-        'has_tags': 0,
-        'has_category': 0,
-        'has_domain': 0,
-        'has_all_metadata': 0,
-        'empty_keywords': 0,
-        'minimal_keywords': 0,  # Less than 3 keywords
-        'missing_files': 0,
-        'coverage': {}
-    }
+    Exits with status 1 (text mode only) when entries reference missing files.
     
-    for doc_id, metadata in manager.list_entries():
-        # Check required fields
-        if metadata.get('title'):
-            stats['has_title'] += 1
-        if metadata.get('description'):
-            stats['has_description'] += 1
-        if metadata.get('keywords'):
-            stats['has_keywords'] += 1
-            keywords = metadata.get('keywords', [])
-            if not keywords:
-                stats['empty_keywords'] += 1
-            elif len([k for k in keywords if k and len(str(k)) >= 4]) < 3:
-                stats['minimal_keywords'] += 1
-        if metadata.get('tags'):
-            stats['has_tags'] += 1
-        if metadata.get('category'):
-            stats['has_category'] += 1
-        if metadata.get('domain'):
-            stats['has_domain'] += 1
-        
-        # Check if has all metadata
-        has_all = all(key in metadata and metadata[key] 
-                     for key in ['title', 'description', 'keywords', 'tags', 'category', 'domain'])
-        if has_all:
-            stats['has_all_metadata'] += 1
-        
-        # Check if file exists
-        path_str = metadata.get('path')
-        if path_str:
-            file_path = base_dir / path_str
-            if not file_path.exists():
-                stats['missing_files'] += 1
+    Args:
+        stats: Counters filled by _update_validation_stats()
+        json_output: Output results as JSON
+    """
+    total_count = stats['total']
     
     # Calculate coverage percentages
     if total_count > 0:
@@ -804,8 +1172,7 @@ def cmd_validate_metadata(manager: IndexManager, base_dir: Path, json_output: bo
         }
     
     if json_output:
-        import json
-        print(json.dumps(stats, indent=2))
+        print(_dumps_json(stats))
         # For JSON mode, treat all issues as informational so callers can decide.
         return
     
@@ -939,16 +1306,33 @@ Examples:
     update_metadata_parser.add_argument('field', help='Field name to update')
     update_metadata_parser.add_argument('value', help='Value to set (JSON for lists/objects)')
     
+    # Options shared by extract-keywords and extract-and-validate
+    extract_options = argparse.ArgumentParser(add_help=False)
+    extract_options.add_argument('--no-skip-existing', action='store_true', 
+                                 help='Re-extract metadata even if already present (default: skip existing)')
+    extract_options.add_argument('--verbose', '-v', action='store_true',
+                                 help='Print detailed progress for each file')
+    extract_options.add_argument('--no-auto-install', action='store_true',
+                                 help='Skip auto-installation of optional dependencies (default: auto-install if missing)')
+    extract_options.add_argument('--json', action='store_true',
+                                 help='Output results as JSON (for machine-readable output)')
+    extract_options.add_argument('--flush-every', type=int, default=BATCH_FLUSH_SIZE, metavar='N',
+                                 help=f'Persist extracted metadata every N updated entries (default: {BATCH_FLUSH_SIZE})')
+    extract_options.add_argument('--workers', type=int, default=os.cpu_count(), metavar='N',
+                                 help='Number of parallel extraction processes (default: CPU count; 1 = serial)')
+    
     # Extract keywords command
-    extract_parser = subparsers.add_parser('extract-keywords', help='Extract keywords from all documents')
-    extract_parser.add_argument('--no-skip-existing', action='store_true', 
-                               help='Re-extract metadata even if already present (default: skip existing)')
-    extract_parser.add_argument('--verbose', '-v', action='store_true',
-                               help='Print detailed progress for each file')
-    extract_parser.add_argument('--no-auto-install', action='store_true',
-                               help='Skip auto-installation of optional dependencies (default: auto-install if missing)')
-    extract_parser.add_argument('--json', action='store_true',
-                               help='Output results as JSON (for machine-readable output)')
+    extract_parser = subparsers.add_parser('extract-keywords', parents=[extract_options],
+                                           help='Extract keywords from all documents')
+    extract_parser.add_argument('--only', nargs='*', metavar='DOC_ID',
+                               help='Only extract metadata for these doc_ids (e.g. those changed by rebuild_index)')
+    extract_parser.add_argument('--changed', action='store_true',
+                               help='Only extract metadata for the doc_ids recorded by rebuild_index (all if none are '
+                                    'recorded); afterwards only the ids that failed stay recorded')
+    
+    # Extract and validate command (single pass; validation always covers the whole index)
+    subparsers.add_parser('extract-and-validate', parents=[extract_options],
+                          help='Extract keywords and validate metadata in one pass over the index')
     
     args = parser.parse_args()
     
@@ -1002,13 +1386,29 @@ Examples:
             cmd_set_alias(manager, args.doc_id, args.alias)
         elif args.command == 'update-metadata':
             cmd_update_metadata(manager, args.doc_id, args.field, args.value)
-        elif args.command == 'extract-keywords':
+        elif args.command in ('extract-keywords', 'extract-and-validate'):
             skip_existing = not getattr(args, 'no_skip_existing', False)
             verbose = getattr(args, 'verbose', False)
             auto_install = not getattr(args, 'no_auto_install', False)
             json_output = getattr(args, 'json', False)
-            with logger.time_operation('extract_keywords'):
-                cmd_extract_keywords(manager, base_dir, skip_existing=skip_existing, verbose=verbose, auto_install=auto_install, json_output=json_output)
+            workers = getattr(args, 'workers', None)
+            flush_every = max(1, getattr(args, 'flush_every', BATCH_FLUSH_SIZE))
+            if args.command == 'extract-keywords':
+                only = getattr(args, 'only', None)
+                changed = None
+                if getattr(args, 'changed', False):
+                    from management.rebuild_index import load_changed_ids, save_changed_ids
+                    changed = load_changed_ids(base_dir)
+                    if changed is not None:
+                        only = changed
+                with logger.time_operation('extract_keywords'):
+                    failed = cmd_extract_keywords(manager, base_dir, skip_existing=skip_existing, verbose=verbose, auto_install=auto_install, json_output=json_output, workers=workers, flush_every=flush_every, only=only)
+                if changed is not None:
+                    # Consumed; keep the failed ids so the next run retries them
+                    save_changed_ids(base_dir, failed)
+            else:
+                with logger.time_operation('extract_and_validate'):
+                    cmd_extract_and_validate(manager, base_dir, json_output=json_output, skip_existing=skip_existing, verbose=verbose, auto_install=auto_install, workers=workers, flush_every=flush_every)
         else:
             parser.print_help()
             exit_code = 1
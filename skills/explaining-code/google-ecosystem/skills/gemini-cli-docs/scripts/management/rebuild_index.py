@@ -23,9 +23,17 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import argparse
+import functools
 import hashlib
+import json
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
+from itertools import repeat
 
+from utils.path_config import get_cache_dir
 from utils.script_utils import configure_utf8_output, ensure_yaml_installed, EXIT_SUCCESS, EXIT_INDEX_ERROR
 
 # Configure UTF-8 output for Windows console compatibility
@@ -48,6 +56,30 @@ try:
 except ImportError:
     MetadataExtractor = None
 
+# Optional faster hashers for the local "content unchanged" check (no security
+# requirement); the index itself always stores sha256
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+    # Note: Agents can install with: pip install blake3
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Hash constructors by the prefix of a hash ("<prefix>:<hex>")
+HASHERS = {'sha256': hashlib.sha256}
+if XXHASH_AVAILABLE:
+    HASHERS['xxh3'] = xxhash.xxh3_128
+if BLAKE3_AVAILABLE:
+    HASHERS['blake3'] = blake3.blake3
+HASH_ALGORITHM = 'sha256'  # Stored in the index (same format as scrape_docs), identical on every machine
+FAST_HASH_ALGORITHM = 'blake3' if BLAKE3_AVAILABLE else 'xxh3' if XXHASH_AVAILABLE else None  # Local cache only
+
 def strip_frontmatter(content: str) -> str:
     """Strip YAML frontmatter from content, returning body only.
 
@@ -58,26 +90,106 @@ def strip_frontmatter(content: str) -> str:
         Content body without frontmatter
     """
     if content.startswith('---'):
-        parts = content.split('---', 2)
-        if len(parts) >= 3:
-            return parts[2].strip()
+        # Same split point as content.split('---', 2) without building the list
+        end = content.find('---', 3)
+        if end != -1:
+            return content[end + 3:].strip()
     return content
 
-def calculate_hash(content: str, body_only: bool = True) -> str:
-    """Calculate SHA-256 hash of content.
+def frontmatter_end(data: bytes) -> int:
+    """Return the offset of the closing '---' of the frontmatter in data, or -1.
+
+    Matches the split point used by strip_frontmatter, so data[3:end] is the
+    frontmatter and data[end + 3:] the (unstripped) body.
+    """
+    if data.startswith(b'---'):
+        return data.find(b'---', 3)
+    return -1
+
+# ASCII characters str.strip() removes (CR is handled by the text fallback)
+STRIP_WHITESPACE = b' \t\n\x0b\x0c\x1c\x1d\x1e\x1f'
+LEADING_WHITESPACE_PATTERN = re.compile(rb'[ \t\n\x0b\x0c\x1c-\x1f]*')
+
+def strip_frontmatter_bytes(data: bytes, fm_end: int | None = None) -> tuple[int, int]:
+    """Return (body_start, body_end) offsets of the body in data.
+
+    Byte-level counterpart of strip_frontmatter: without frontmatter the whole
+    buffer is the body; otherwise the body follows the closing '---' with ASCII
+    whitespace trimmed from both ends. Callers slice a memoryview instead of
+    copying the body.
+
+    Args:
+        data: Raw file bytes
+        fm_end: Precomputed frontmatter_end(data), to avoid scanning twice
+
+    Returns:
+        Tuple of (body_start, body_end)
+    """
+    end = frontmatter_end(data) if fm_end is None else fm_end
+    if end == -1:
+        return 0, len(data)
+    start = LEADING_WHITESPACE_PATTERN.match(data, end + 3).end()
+    stop = len(data)
+    while stop > start and data[stop - 1] in STRIP_WHITESPACE:
+        stop -= 1
+    return start, stop
+
+def calculate_hash(content: str, body_only: bool = True, algorithm: str | None = None) -> str:
+    """Calculate the content fingerprint of content.
 
     Args:
         content: Full file content
         body_only: If True, strip frontmatter before hashing (default: True)
                    This prevents timestamp-only changes from triggering hash updates
+        algorithm: Key of HASHERS (default: HASH_ALGORITHM)
 
     Returns:
-        SHA-256 hash with sha256: prefix
+        Hex digest with the algorithm prefix, e.g. "sha256:<hex>"
     """
+    algorithm = algorithm or HASH_ALGORITHM
     if body_only:
         content = strip_frontmatter(content)
-    hash_obj = hashlib.sha256(content.encode('utf-8'))
-    return f"sha256:{hash_obj.hexdigest()}"
+    hash_obj = HASHERS[algorithm](content.encode('utf-8'))
+    return f"{algorithm}:{hash_obj.hexdigest()}"
+
+def _calculate_hash_text(data: bytes, body_only: bool, algorithm: str | None) -> str:
+    """Hash bytes via the text path, applying read_text's newline translation."""
+    content = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    return calculate_hash(content, body_only, algorithm)
+
+def calculate_hash_bytes(data: bytes, body_only: bool = True, fm_end: int | None = None,
+                         algorithm: str | None = None) -> str:
+    """Calculate the content fingerprint of raw file bytes without decoding them.
+
+    Produces the same digest as calculate_hash(path.read_text(encoding='utf-8')).
+    Falls back to the text path for the cases where bytes and text differ: CR
+    line endings (read_text translates them) and a body edge that str.strip()
+    might trim but the ASCII scan below would not (non-ASCII whitespace).
+
+    Args:
+        data: Raw file bytes
+        body_only: If True, skip frontmatter before hashing (default: True)
+        fm_end: Precomputed frontmatter_end(data), to avoid scanning twice
+        algorithm: Key of HASHERS (default: HASH_ALGORITHM)
+
+    Returns:
+        Hex digest with the algorithm prefix, e.g. "sha256:<hex>"
+    """
+    algorithm = algorithm or HASH_ALGORITHM
+    if b'\r' in data:
+        return _calculate_hash_text(data, body_only, algorithm)
+    view = memoryview(data)
+    if body_only:
+        start, stop = strip_frontmatter_bytes(data, fm_end)
+        if start:  # Frontmatter found (its body starts after '---')
+            if start < stop and (data[start] >= 0x80 or data[stop - 1] >= 0x80):
+                return _calculate_hash_text(data, body_only, algorithm)
+            view = view[start:stop]
+    return f"{algorithm}:{HASHERS[algorithm](view).hexdigest()}"
+
+# Single-pass character maps for path normalization (one C-level scan each)
+PATH_SEP_TABLE = str.maketrans({'\\': '/'})
+DOC_ID_TABLE = str.maketrans({'\\': '-', '/': '-'})
 
 def extract_doc_id_from_path(path: Path, base_dir: Path) -> str:
     """Generate doc_id from file path"""
@@ -87,34 +199,301 @@ def extract_doc_id_from_path(path: Path, base_dir: Path) -> str:
         # Path is not relative to base_dir, use filename only
         relative = Path(path.name)
     
-    # Remove .md extension and convert to kebab-case
-    # Normalize path separators first, then replace with hyphens
-    relative_str = str(relative).replace('\\', '/')
-    doc_id = relative_str.replace('.md', '').replace('/', '-')
-    return doc_id
+    return _doc_id_from_relative(str(relative))
+
+@functools.lru_cache(maxsize=None)
+def _doc_id_from_relative(relative_str: str) -> str:
+    """Generate doc_id from a path relative to base_dir (cached across rebuilds)"""
+    # Remove .md extension and convert either path separator to hyphens
+    return relative_str.replace('.md', '').translate(DOC_ID_TABLE)
+
+# Top-level `source_url: <url>` line (plain, single- or double-quoted scalar);
+# anything else falls back to a full YAML parse
+SOURCE_URL_PATTERN = re.compile(
+    rb'^source_url:[ \t]+(?:"([^"\\\n]+)"|\'([^\'\n]+)\'|([^\s"\'#&*!|>%@`{\[][^\s]*))[ \t]*(?:#[^\n]*)?$',
+    re.MULTILINE,
+)
+
+def extract_source_url(frontmatter: bytes) -> str | None:
+    """
+    Read source_url from raw frontmatter bytes
+
+    Uses SOURCE_URL_PATTERN for the common one-line form and only parses the
+    frontmatter as YAML when the key is present in some other form.
+
+    Args:
+        frontmatter: Bytes between the opening and closing '---'
+
+    Returns:
+        The URL, or None if absent or unparseable
+    """
+    match = SOURCE_URL_PATTERN.search(frontmatter)
+    if match:
+        return next(group for group in match.groups() if group is not None).decode('utf-8')
+    if b'source_url' not in frontmatter:
+        return None
+    try:
+        data = yaml.safe_load(frontmatter.decode('utf-8'))
+        return data.get('source_url', '') if isinstance(data, dict) else None
+    except Exception:
+        return None
+
+PROCESS_CHUNKSIZE = 16  # Files handed to a worker process per task
+PREFETCH_THREADS = 8  # Reader threads prefetching file bytes on the serial path
+PREFETCH_DEPTH = 64  # Max files read ahead of the hasher (bounds memory)
+WALK_SKIP_DIRS = frozenset({'.git', 'node_modules', '__pycache__'})  # Never contain docs
+CHANGED_FILENAME = 'rebuild_changed.json'  # doc_ids changed since the last extraction (in the cache dir)
+FINGERPRINTS_FILENAME = 'rebuild_fingerprints.json'  # Stat fingerprints of indexed files (in the cache dir)
+
+def load_fingerprints(base_dir: Path) -> dict[str, dict]:
+    """
+    Load the stat fingerprints recorded by the previous rebuild on this machine
+
+    File mtimes and sizes are local to a checkout (sizes differ e.g. with
+    CRLF checkouts), so they are kept in the cache directory rather than in
+    the committed index.
+
+    Args:
+        base_dir: Base directory for canonical documentation storage
+
+    Returns:
+        Mapping of relative path -> {'mtime': ns, 'size': bytes, 'hash': indexed
+        hash, optional 'fast': FAST_HASH_ALGORITHM hash of the same content}
+        (empty if nothing was recorded or the file is unreadable)
+    """
+    fingerprints_path = get_cache_dir(base_dir) / FINGERPRINTS_FILENAME
+    try:
+        fingerprints = json.loads(fingerprints_path.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️  Ignoring unreadable fingerprint cache {fingerprints_path}: {e}")
+        return {}
+    return fingerprints if isinstance(fingerprints, dict) else {}
+
+def save_fingerprints(base_dir: Path, fingerprints: dict[str, dict]) -> None:
+    """
+    Record stat fingerprints of the files whose content matches the index
+
+    Args:
+        base_dir: Base directory for canonical documentation storage
+        fingerprints: Mapping of relative path -> {'mtime': ns, 'size': bytes, 'hash': indexed hash,
+                      optional 'fast': FAST_HASH_ALGORITHM hash}
+    """
+    fingerprints_path = get_cache_dir(base_dir) / FINGERPRINTS_FILENAME
+    try:
+        fingerprints_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = fingerprints_path.with_name(fingerprints_path.name + '.tmp')
+        tmp_path.write_text(json.dumps(fingerprints, sort_keys=True), encoding='utf-8')
+        os.replace(tmp_path, fingerprints_path)
+    except OSError as e:
+        # Only costs re-hashing on the next run
+        logger.warning(f"⚠️  Could not save fingerprint cache {fingerprints_path}: {e}")
+
+def load_changed_ids(base_dir: Path) -> list[str] | None:
+    """
+    Load the doc_ids recorded as changed by previous rebuilds
+
+    Args:
+        base_dir: Base directory for canonical documentation storage
+
+    Returns:
+        Sorted list of doc_ids, or None if nothing was recorded (or the file is
+        unreadable), meaning downstream steps must process every document
+    """
+    changed_path = get_cache_dir(base_dir) / CHANGED_FILENAME
+    if not changed_path.exists():
+        return None
+    try:
+        doc_ids = json.loads(changed_path.read_text(encoding='utf-8'))['doc_ids']
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"⚠️  Ignoring unreadable changed-ids file {changed_path}: {e}")
+        return None
+    if not isinstance(doc_ids, list):
+        return None
+    return sorted(str(doc_id) for doc_id in doc_ids)
+
+def _write_changed_ids(base_dir: Path, doc_ids) -> None:
+    """Atomically write the changed-ids file (an empty list means nothing to process)."""
+    changed_path = get_cache_dir(base_dir) / CHANGED_FILENAME
+    changed_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = changed_path.with_name(changed_path.name + '.tmp')
+    tmp_path.write_text(json.dumps({'doc_ids': sorted(doc_ids)}), encoding='utf-8')
+    os.replace(tmp_path, changed_path)
+
+def save_changed_ids(base_dir: Path, doc_ids) -> None:
+    """
+    Replace the recorded doc_ids (an empty set removes the record)
+
+    Used by the consumer (manage_index.py extract-keywords --changed) to keep
+    only the ids it failed to process, so they are retried next time.
+
+    Args:
+        base_dir: Base directory for canonical documentation storage
+        doc_ids: Iterable of doc_ids still to be processed
+    """
+    doc_ids = set(doc_ids)
+    if doc_ids:
+        _write_changed_ids(base_dir, doc_ids)
+    else:
+        (get_cache_dir(base_dir) / CHANGED_FILENAME).unlink(missing_ok=True)
+
+def record_changed_ids(base_dir: Path, doc_ids) -> None:
+    """
+    Record doc_ids changed by a rebuild for incremental downstream steps
+
+    Ids left over from an earlier rebuild whose extraction never ran (or failed)
+    are kept, so the recorded set covers every change since the last successful
+    extraction of each document.
+
+    Args:
+        base_dir: Base directory for canonical documentation storage
+        doc_ids: Iterable of new, updated and renamed doc_ids
+    """
+    changed = set(doc_ids)
+    previous = load_changed_ids(base_dir)
+    if previous:
+        changed.update(previous)
+    _write_changed_ids(base_dir, changed)
+
+def _walk_md(base_dir: Path):
+    """
+    Yield markdown files under base_dir (excluding README.md) using os.scandir
+
+    Avoids building a Path per directory entry; DirEntry keeps its stat result
+    so the fingerprint check does not need a second lookup.
+
+    Args:
+        base_dir: Base directory for canonical documentation storage
+
+    Yields:
+        Tuples of (DirEntry, relative_path_str) with forward-slash paths
+    """
+    stack = [(str(base_dir), '')]
+    while stack:
+        dir_path, prefix = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in WALK_SKIP_DIRS:
+                                stack.append((entry.path, f"{prefix}{entry.name}/"))
+                        elif entry.name.endswith('.md') and entry.name != 'README.md' and entry.is_file():
+                            yield entry, f"{prefix}{entry.name}"
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.warning(f"  ⚠️  Cannot scan {dir_path}: {e}")
+
+def _iter_prefetched(md_files: list[Path]):
+    """
+    Yield files with their bytes, read ahead by a small thread pool
+
+    File reads release the GIL, so the next files are loaded while the
+    current one is being hashed. At most PREFETCH_DEPTH reads are in flight.
+
+    Args:
+        md_files: Files to read, in processing order
+
+    Yields:
+        Tuples of (md_file, bytes or None if the read failed)
+    """
+    files = iter(md_files)
+    with ThreadPoolExecutor(max_workers=PREFETCH_THREADS, thread_name_prefix='rebuild-read') as pool:
+        window = deque()
+        for md_file in files:
+            window.append((md_file, pool.submit(md_file.read_bytes)))
+            if len(window) >= PREFETCH_DEPTH:
+                break
+        while window:
+            md_file, future = window.popleft()
+            next_file = next(files, None)
+            if next_file is not None:
+                window.append((next_file, pool.submit(next_file.read_bytes)))
+            try:
+                data = future.result()
+            except OSError:
+                data = None  # _process_file() re-reads and reports the error
+            yield md_file, data
+
+def _process_file(md_file: Path, base_dir: Path, extract: bool, data: bytes | None = None,
+                  known: tuple | None = None) -> tuple:
+    """
+    Read, hash and (for new entries) extract metadata from one markdown file
+
+    Defined at module level so it can be pickled and run in a process pool.
+
+    Args:
+        md_file: Markdown file to process
+        base_dir: Base directory for canonical documentation storage
+        extract: Run MetadataExtractor (only needed for entries not yet indexed)
+        data: File bytes if already read (e.g. by _iter_prefetched)
+        known: (fast hash, indexed hash) cached for this file; when the fast
+            hash still matches, the indexed hash is reused instead of computed
 
-def rebuild_index(base_dir: Path, dry_run: bool = False) -> dict:
+    Returns:
+        Tuple of (doc_id, content_hash, relative_path_str, url, extracted or None,
+        error or None, fast_hash) where fast_hash is None without FAST_HASH_ALGORITHM
+    """
+    try:
+        if data is None:
+            data = md_file.read_bytes()
+        # One scan for the frontmatter boundary, shared by the hash and URL lookup
+        fm_end = frontmatter_end(data)
+        fast_hash = calculate_hash_bytes(data, fm_end=fm_end, algorithm=FAST_HASH_ALGORITHM) if FAST_HASH_ALGORITHM else None
+        if known is not None and fast_hash is not None and fast_hash == known[0]:
+            content_hash = known[1]  # Same content as indexed (only the stat changed)
+        else:
+            content_hash = calculate_hash_bytes(data, fm_end=fm_end)
+        
+        # Extract URL from frontmatter (only the frontmatter is decoded)
+        url = extract_source_url(data[3:fm_end]) if fm_end != -1 else None
+        
+        # Generate doc_id from path (use forward slashes for cross-platform)
+        doc_id = extract_doc_id_from_path(md_file, base_dir)
+        relative_path = md_file.relative_to(base_dir)
+        # Normalize path to use forward slashes for cross-platform compatibility
+        relative_path_str = str(relative_path).translate(PATH_SEP_TABLE)
+        
+        # Extract metadata if available (from the bytes already read)
+        extracted = None
+        if extract and MetadataExtractor:
+            try:
+                extractor = MetadataExtractor.from_bytes(md_file, data, url)
+                extracted = extractor.extract_all()
+            except Exception:
+                pass
+        
+        return doc_id, content_hash, relative_path_str, url, extracted, None, fast_hash
+    except Exception as e:
+        return None, None, None, None, None, str(e), None
+
+def rebuild_index(base_dir: Path, dry_run: bool = False, workers: int | None = None,
+                  use_fingerprints: bool = True) -> dict:
     """
     Rebuild index from filesystem
     
     Args:
         base_dir: Base directory for canonical documentation storage
         dry_run: If True, don't write changes
+        workers: Number of processes for reading/hashing/extracting files
+                 (default: os.cpu_count(); 1 runs serially)
+        use_fingerprints: Trust the local fingerprint cache to skip or shortcut
+                          files; False reads and hashes every file
     
     Returns:
-        Dictionary with statistics
+        Dictionary with statistics, plus 'changed': sorted new/updated/renamed
+        doc_ids and 'index': the resulting index (what was written, or would
+        be written on a dry run)
     """
     logger.info("🔍 Scanning filesystem for markdown files...")
 
     # Find all markdown files (excluding README.md)
-    # Sort the glob results to ensure deterministic processing order
-    md_files = []
-    for md_file in sorted(base_dir.rglob("*.md")):
-        if md_file.name == "README.md":
-            continue
-        md_files.append(md_file)
+    # Sort the walk results to ensure deterministic processing order
+    md_entries = sorted(_walk_md(base_dir), key=lambda item: item[1])
 
-    logger.info(f"   Found {len(md_files)} markdown files")
+    logger.info(f"   Found {len(md_entries)} markdown files")
     
     # Load existing index (may be empty on first run)
     manager = IndexManager(base_dir)
@@ -123,45 +502,113 @@ def rebuild_index(base_dir: Path, dry_run: bool = False) -> dict:
         not existing_index
         and manager.index_path.exists()
         and manager.index_path.stat().st_size > 0
-        and md_files
+        and md_entries
     ):
         logger.warning("⚠️  Existing index.yaml is non-empty but loaded as empty.")
         logger.warning("    Skipping writes to avoid accidental data loss – investigate index format.")
     
-    # Build hash -> doc_id mapping for rename detection
+    # One pass over the index: hash -> doc_id for rename detection, path -> doc_id
+    # and orphan candidates (entries with a path). A candidate is discarded when a
+    # file exists at its path, or when its path is repointed at a found file, so
+    # the leftovers are exactly the entries whose path has no file - set
+    # arithmetic instead of an exists() call per entry
     hash_to_doc_id: dict[str, str] = {}
+    path_to_doc_id: dict[str, str] = {}
+    orphan_candidates: set[str] = set()
     for doc_id, metadata in existing_index.items():
         content_hash = metadata.get('hash')
         if content_hash:
             hash_to_doc_id[content_hash] = doc_id
+        path_str = metadata.get('path')
+        if path_str:
+            path_to_doc_id[path_str.translate(PATH_SEP_TABLE)] = doc_id
+            orphan_candidates.add(doc_id)
     
-    # Process each file
-    new_entries = {}
-    updated_entries = {}
+    # Process each file (one date for the whole run)
+    today_str = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+    # Append-only accumulators (each doc_id is seen once); existing entries are
+    # edited in place, so updates only need their doc_id
+    new_entries: list[tuple[str, dict]] = []
+    updated_entries: list[str] = []
     renamed_entries = []
     unchanged_entries = []
     
-    for md_file in md_files:
+    # Files whose cached mtime and size match and whose index entry still has
+    # the cached hash and path are unchanged without reading them; only the
+    # rest are hashed
+    cached_fingerprints = load_fingerprints(base_dir) if use_fingerprints else {}
+    seen_fingerprints: dict[str, tuple[str, dict]] = {}  # relative path -> (doc_id, local fingerprint)
+    to_process = []
+    extract_flags = []
+    known_flags = []  # Cached (fast hash, indexed hash) for files whose stat changed
+    for entry, relative_path_str in md_entries:
+        doc_id = _doc_id_from_relative(relative_path_str)
+        existing = existing_index.get(doc_id)
+        path_owner = path_to_doc_id.get(relative_path_str)
+        if path_owner is not None:
+            orphan_candidates.discard(path_owner)
         try:
-            content = md_file.read_text(encoding='utf-8')
-            content_hash = calculate_hash(content)
-            
-            # Extract URL from frontmatter
-            url = None
-            if content.startswith('---'):
-                try:
-                    parts = content.split('---', 2)
-                    if len(parts) >= 3:
-                        frontmatter = yaml.safe_load(parts[1])
-                        url = frontmatter.get('source_url', '')
-                except Exception:
-                    pass
-            
-            # Generate doc_id from path (use forward slashes for cross-platform)
-            doc_id = extract_doc_id_from_path(md_file, base_dir)
-            relative_path = md_file.relative_to(base_dir)
-            # Normalize path to use forward slashes for cross-platform compatibility
-            relative_path_str = str(relative_path).replace('\\', '/')
+            st = entry.stat()
+            local_fingerprint = {'mtime': st.st_mtime_ns, 'size': st.st_size}
+        except OSError:
+            local_fingerprint = None
+        if local_fingerprint:
+            seen_fingerprints[relative_path_str] = (doc_id, local_fingerprint)
+        cached = cached_fingerprints.get(relative_path_str)
+        if (
+            existing is not None
+            and local_fingerprint
+            and isinstance(cached, dict)
+            and cached.get('mtime') == local_fingerprint['mtime']
+            and cached.get('size') == local_fingerprint['size']
+            and cached.get('hash') == existing.get('hash')
+            and existing.get('path', '').translate(PATH_SEP_TABLE) == relative_path_str
+        ):
+            if cached.get('fast'):
+                local_fingerprint['fast'] = cached['fast']
+            unchanged_entries.append(doc_id)
+            continue
+        to_process.append(base_dir / relative_path_str)
+        extract_flags.append(existing is None)
+        if (
+            existing is not None
+            and isinstance(cached, dict)
+            and cached.get('fast')
+            and cached.get('hash') == existing.get('hash')
+        ):
+            known_flags.append((cached['fast'], cached['hash']))
+        else:
+            known_flags.append(None)
+    
+    # Read/hash/extract in parallel; results come back in to_process order so the
+    # classification below stays deterministic and single-threaded
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(to_process) <= 1:
+        # Serial: hash on this thread while reader threads fetch the next files
+        results = (
+            _process_file(md_file, base_dir, extract, data, known)
+            for (md_file, data), extract, known in zip(_iter_prefetched(to_process), extract_flags, known_flags)
+        )
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(
+            max_workers=min(workers, len(to_process)),
+            initializer=MetadataExtractor.preload if MetadataExtractor else None,
+        )
+        results = executor.map(_process_file, to_process, repeat(base_dir), extract_flags,
+                               repeat(None), known_flags, chunksize=PROCESS_CHUNKSIZE)
+    
+    try:
+        for md_file, (doc_id, content_hash, relative_path_str, url, extracted, error, fast_hash) in zip(
+            to_process, results
+        ):
+            if error is not None:
+                logger.warning(f"  ⚠️  Error processing {md_file}: {error}")
+                seen_fingerprints.pop(str(md_file.relative_to(base_dir)).translate(PATH_SEP_TABLE), None)
+                continue
+            if fast_hash is not None and relative_path_str in seen_fingerprints:
+                seen_fingerprints[relative_path_str][1]['fast'] = fast_hash
             
             # Check if this hash exists in old index (rename detection)
             old_doc_id = hash_to_doc_id.get(content_hash)
@@ -177,15 +624,16 @@ def rebuild_index(base_dir: Path, dry_run: bool = False) -> dict:
                 existing_path = existing.get('path', '')
                 
                 # Check if path changed (normalize for comparison)
-                existing_path_normalized = existing_path.replace('\\', '/')
+                existing_path_normalized = existing_path.translate(PATH_SEP_TABLE)
                 if existing_path_normalized != relative_path_str:
                     existing['path'] = relative_path_str
-                    updated_entries[doc_id] = existing
+                    orphan_candidates.discard(doc_id)
+                    updated_entries.append(doc_id)
                 elif existing.get('hash') != content_hash:
                     # Content changed, update hash and date
                     existing['hash'] = content_hash
-                    existing['last_fetched'] = datetime.now(timezone.utc).strftime('%Y-%m-%d')
-                    updated_entries[doc_id] = existing
+                    existing['last_fetched'] = today_str
+                    updated_entries.append(doc_id)
                 else:
                     unchanged_entries.append(doc_id)
             else:
@@ -193,35 +641,22 @@ def rebuild_index(base_dir: Path, dry_run: bool = False) -> dict:
                 new_entry = {
                     'path': relative_path_str,
                     'hash': content_hash,
-                    'last_fetched': datetime.now(timezone.utc).strftime('%Y-%m-%d'),
+                    'last_fetched': today_str,
                 }
                 
                 if url:
                     new_entry['url'] = url
                 
-                # Extract metadata if available
-                if MetadataExtractor:
-                    try:
-                        extractor = MetadataExtractor(md_file, url)
-                        extracted = extractor.extract_all()
-                        new_entry.update(extracted)
-                    except Exception:
-                        pass
+                if extracted:
+                    new_entry.update(extracted)
                 
-                new_entries[doc_id] = new_entry
-        
-        except Exception as e:
-            logger.warning(f"  ⚠️  Error processing {md_file}: {e}")
-            continue
+                new_entries.append((doc_id, new_entry))
+    finally:
+        if executor is not None:
+            executor.shutdown()
     
     # Find orphaned entries (in index but not in filesystem)
-    orphaned = []
-    for doc_id, metadata in existing_index.items():
-        path_str = metadata.get('path')
-        if path_str:
-            file_path = base_dir / path_str
-            if not file_path.exists():
-                orphaned.append(doc_id)
+    orphaned = sorted(orphan_candidates)
     
     # Log summary
     logger.info(f"\n📊 Rebuild Summary:")
@@ -245,50 +680,68 @@ def rebuild_index(base_dir: Path, dry_run: bool = False) -> dict:
         if len(orphaned) > 10:
             logger.warning(f"   ... and {len(orphaned) - 10} more")
 
+    # Assemble the resulting index (also returned for the determinism check).
+    # Entries in updated_entries are the existing_index dicts, already edited
+    # in place above
+    final_index = dict(existing_index)
+    final_index.update(new_entries)
+    
+    # Handle renamed files: OLD doc_id becomes alias of NEW doc_id
+    for old_id, new_id in renamed_entries:
+        new_entry = final_index.get(new_id)
+        if new_entry:
+            # Add old doc_id as alias for backward compatibility
+            aliases = new_entry.get('aliases', [])
+            if isinstance(aliases, str):
+                aliases = [aliases]
+            elif not isinstance(aliases, list):
+                aliases = []
+            if old_id not in aliases:
+                aliases.append(old_id)
+                new_entry['aliases'] = aliases
+
+        # Remove the old entry if it still exists
+        final_index.pop(old_id, None)
+
+    # Doc_ids whose content or location changed (what incremental steps process)
+    changed = sorted(
+        {doc_id for doc_id, _ in new_entries}
+        .union(updated_entries, (new_id for _, new_id in renamed_entries))
+    )
+
     # Apply changes if not dry run
     # (existing_index may be empty for first-time builds or after deletion)
     if not dry_run and (existing_index or new_entries):
         logger.info(f"\n💾 Applying changes...")
         
-        # Add new entries
-        for doc_id, entry in new_entries.items():
-            manager.update_entry(doc_id, entry)
-        
-        # Update existing entries
-        for doc_id, entry in updated_entries.items():
-            manager.update_entry(doc_id, entry)
-        
-        # Handle renamed files: OLD doc_id becomes alias of NEW doc_id
-        for old_id, new_id in renamed_entries:
-            # Get the new entry (just created or updated above)
-            new_entry = manager.get_entry(new_id)
-            if new_entry:
-                # Add old doc_id as alias for backward compatibility
-                aliases = new_entry.get('aliases', [])
-                if isinstance(aliases, str):
-                    aliases = [aliases]
-                elif not isinstance(aliases, list):
-                    aliases = []
-                if old_id not in aliases:
-                    aliases.append(old_id)
-                    new_entry['aliases'] = aliases
-                    manager.update_entry(new_id, new_entry)
-
-            # Remove the old entry if it still exists
-            if manager.get_entry(old_id):
-                manager.remove_entry(old_id)
+        # One write of index.yaml/index.json for the whole rebuild
+        written = True
+        if new_entries or updated_entries or renamed_entries:
+            written = manager.write_all(final_index)
         
-        logger.info(f"✅ Index rebuilt successfully")
+        if written:
+            logger.info(f"✅ Index rebuilt successfully")
+            record_changed_ids(base_dir, changed)
+            # Fingerprints of files whose content the written index now reflects
+            save_fingerprints(base_dir, {
+                relative_path_str: {**local_fingerprint, 'hash': final_index[doc_id]['hash']}
+                for relative_path_str, (doc_id, local_fingerprint) in seen_fingerprints.items()
+                if final_index.get(doc_id, {}).get('hash')
+            })
+        else:
+            logger.error(f"❌ Failed to write index")
     else:
         logger.info(f"\n🔍 Dry run - no changes applied")
     
     return {
-        'scanned': len(md_files),
+        'scanned': len(md_entries),
         'added': len(new_entries),
         'updated': len(updated_entries),
         'renamed': len(renamed_entries),
         'unchanged': len(unchanged_entries),
-        'orphaned': len(orphaned)
+        'orphaned': len(orphaned),
+        'changed': changed,
+        'index': final_index,
     }
 
 def main() -> None:
@@ -304,6 +757,8 @@ def main() -> None:
                        help='Show what would be changed without applying')
     parser.add_argument('--verify-determinism', action='store_true',
                        help='Run rebuild twice and verify outputs are identical (self-test)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), metavar='N',
+                       help='Number of parallel processes for reading/hashing files (default: CPU count; 1 = serial)')
 
     args = parser.parse_args()
 
@@ -331,7 +786,7 @@ def main() -> None:
 
         # Rebuild index
         with logger.time_operation('rebuild_index'):
-            stats = rebuild_index(base_dir, dry_run=args.dry_run)
+            stats = rebuild_index(base_dir, dry_run=args.dry_run, workers=args.workers)
 
         if stats['orphaned'] > 0 and not args.dry_run:
             logger.warning(f"\n⚠️  Warning: {stats['orphaned']} orphaned entries found. Review and remove manually if needed.")
@@ -342,29 +797,25 @@ def main() -> None:
             logger.info(f"DETERMINISM VERIFICATION")
             logger.info(f"{'='*60}")
 
-            # Read first index content
-            index_path = base_dir / "index.yaml"
-            first_content = index_path.read_text(encoding='utf-8') if index_path.exists() else ""
-
-            # Rebuild again
+            # Rebuild again in memory (nothing to write) and compare the
+            # resulting index dicts entry by entry. The fingerprint cache was
+            # just written from the first pass, so bypass it to re-hash every file
             logger.info("Running second rebuild for comparison...")
             with logger.time_operation('determinism_verify_rebuild'):
-                rebuild_index(base_dir, dry_run=False)
-
-            # Read second index content
-            second_content = index_path.read_text(encoding='utf-8') if index_path.exists() else ""
+                second = rebuild_index(base_dir, dry_run=True, workers=args.workers, use_fingerprints=False)
 
-            # Compare
-            if first_content == second_content:
+            first_index = stats['index']
+            second_index = second['index']
+            if first_index == second_index:
                 logger.info(f"\n✅ DETERMINISM VERIFIED: Index outputs are identical")
             else:
-                # Calculate diff size
-                first_lines = first_content.splitlines()
-                second_lines = second_content.splitlines()
-                diff_count = sum(1 for a, b in zip(first_lines, second_lines) if a != b)
-                diff_count += abs(len(first_lines) - len(second_lines))
-
-                logger.warning(f"\n❌ DETERMINISM FAILED: Index outputs differ by {diff_count} lines")
+                differing = sorted(
+                    doc_id for doc_id in first_index.keys() | second_index.keys()
+                    if first_index.get(doc_id) != second_index.get(doc_id)
+                )
+                logger.warning(f"\n❌ DETERMINISM FAILED: Index outputs differ in {len(differing)} entries")
+                for doc_id in differing[:10]:
+                    logger.warning(f"   {doc_id}")
                 logger.warning(f"   This indicates non-deterministic behavior that needs investigation.")
                 exit_code = 2  # Special exit code for determinism failure
 
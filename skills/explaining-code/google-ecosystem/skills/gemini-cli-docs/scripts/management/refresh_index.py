@@ -28,8 +28,10 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 import bootstrap; scripts_dir = bootstrap.scripts_dir
 
 import argparse
+import importlib
 import os
 import subprocess
+import time
 from datetime import datetime, timezone
 
 from utils.script_utils import format_duration, EXIT_SUCCESS
@@ -46,14 +48,33 @@ except ImportError:
         repo_root = find_repo_root(start)
         return repo_root / ".claude" / "skills" / "docs-management" / "canonical"
 
-def run_step(description: str, cmd: list) -> bool:
-    """Run a subprocess step with simple logging (ASCII-only)."""
+
+def _print_step_header(description: str, cmd: list) -> None:
+    """Print the banner shown before each step (ASCII-only)."""
     print()
     print("=" * 80)
     print(f">>> {description}")
     print(f"    Command: {' '.join(cmd)}")
     print("=" * 80)
-    start = datetime.now()
+
+def _finish_step(description: str, returncode: int, start: float) -> bool:
+    """Log the result of a step (start is a time.monotonic() reading) and return whether it succeeded."""
+    duration = time.monotonic() - start
+    status = "OK" if returncode == 0 else "FAIL"
+    print()
+    print(f"[{status}] Finished: {description} (exit code {returncode}, {format_duration(duration)})")
+
+    # Log structured metrics for step
+    logger.info(f"Step completed: {description} [{status}]")
+    logger.track_metric(f"step_{description.lower().replace(' ', '_')}_duration", duration)
+    logger.track_metric(f"step_{description.lower().replace(' ', '_')}_exit_code", returncode)
+
+    return returncode == 0
+
+def run_step(description: str, cmd: list) -> bool:
+    """Run a subprocess step with simple logging (ASCII-only)."""
+    _print_step_header(description, cmd)
+    start = time.monotonic()
     logger.debug(f"Starting step: {description}")
 
     try:
@@ -68,60 +89,125 @@ def run_step(description: str, cmd: list) -> bool:
         logger.warning(f"Step aborted by user: {description}")
         return False
 
-    duration = (datetime.now() - start).total_seconds()
-    status = "OK" if result.returncode == 0 else "FAIL"
-    print()
-    print(f"[{status}] Finished: {description} (exit code {result.returncode}, {format_duration(duration)})")
+    return _finish_step(description, result.returncode, start)
 
-    # Log structured metrics for step
-    logger.info(f"Step completed: {description} [{status}]")
-    logger.track_metric(f"step_{description.lower().replace(' ', '_')}_duration", duration)
-    logger.track_metric(f"step_{description.lower().replace(' ', '_')}_exit_code", result.returncode)
+def _exit_code(code) -> int:
+    """Translate a SystemExit code / main() return value into a process exit code."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code)  # sys.exit("message") prints the message and exits 1
+    return 1
+
+def run_step_in_process(description: str, module_name: str, script_path: Path, args: list | None = None) -> bool:
+    """
+    Run a step script's main() in this interpreter (ASCII-only logging)
 
-    return result.returncode == 0
+    Avoids a Python startup and re-importing yaml/utils for every step. The
+    script sees the same sys.argv it would get as a subprocess, and
+    SystemExit is translated into the step's exit code. Falls back to
+    run_step() if the module cannot be imported.
+
+    Args:
+        description: Step name for logging
+        module_name: Importable module, e.g. 'management.rebuild_index'
+        script_path: Script file (for sys.argv[0] and the subprocess fallback)
+        args: Command-line arguments for the script
+
+    Returns:
+        True if the step exited with code 0
+    """
+    args = list(args or [])
+    try:
+        module = importlib.import_module(module_name)
+    except (ImportError, SystemExit) as e:
+        logger.debug(f"Cannot import {module_name} ({e}); running as subprocess")
+        return run_step(description, [sys.executable, str(script_path), *args])
+
+    _print_step_header(description, [Path(sys.executable).name, str(script_path), *args])
+    start = time.monotonic()
+    logger.debug(f"Starting step (in-process): {description}")
+
+    saved_argv = sys.argv
+    sys.argv = [str(script_path), *args]
+    try:
+        returncode = _exit_code(module.main())
+    except SystemExit as e:
+        returncode = _exit_code(e.code)
+    except KeyboardInterrupt:
+        print("\n[ERROR] Aborted by user (KeyboardInterrupt)")
+        logger.warning(f"Step aborted by user: {description}")
+        return False
+    except Exception as e:
+        print(f"[ERROR] {description} raised {type(e).__name__}: {e}")
+        logger.log_error(f"Step failed: {description}", error=e)
+        returncode = 1
+    finally:
+        sys.argv = saved_argv
+        sys.stdout.flush()
+
+    return _finish_step(description, returncode, start)
 
 # Individual step functions for modular execution
 def step_check_dependencies(root_scripts_dir: Path) -> bool:
     """Step 1: Check dependencies"""
-    return run_step(
+    return run_step_in_process(
         "Check dependencies",
-        [sys.executable, str(root_scripts_dir / "setup" / "check_dependencies.py")],
+        "setup.check_dependencies",
+        root_scripts_dir / "setup" / "check_dependencies.py",
     )
 
 def step_rebuild_index(scripts_dir: Path) -> bool:
     """Step 2: Rebuild index from filesystem"""
-    return run_step(
+    return run_step_in_process(
         "Rebuild index from filesystem",
-        [sys.executable, str(scripts_dir / "management" / "rebuild_index.py")],
+        "management.rebuild_index",
+        scripts_dir / "management" / "rebuild_index.py",
     )
 
-def step_extract_keywords(scripts_dir: Path) -> bool:
-    """Step 3: Extract keywords and metadata for all documents"""
-    return run_step(
-        "Extract keywords and metadata for all documents",
-        [
-            sys.executable,
-            str(scripts_dir / "management" / "manage_index.py"),
-            "extract-keywords",
-        ],
+def step_extract_keywords(scripts_dir: Path, base_dir: Path | None = None) -> bool:
+    """Step 3: Extract keywords and metadata (only for doc_ids changed by rebuild, if recorded)"""
+    if base_dir is None:
+        base_dir = get_base_dir()
+    try:
+        from management.rebuild_index import load_changed_ids
+    except (ImportError, SystemExit):
+        changed = None
+    else:
+        changed = load_changed_ids(base_dir)
+
+    if changed is None:
+        # Nothing recorded: full pass
+        description, args = "Extract keywords and metadata for all documents", ["extract-keywords"]
+    else:
+        # extract-keywords reads the recorded ids itself and keeps only those
+        # that failed, so they are retried on the next run
+        description = f"Extract keywords and metadata for {len(changed)} changed documents"
+        args = ["extract-keywords", "--changed"]
+
+    return run_step_in_process(
+        description,
+        "management.manage_index",
+        scripts_dir / "management" / "manage_index.py",
+        args,
     )
 
 def step_validate_metadata(scripts_dir: Path) -> bool:
     """Step 4: Validate metadata coverage"""
-    return run_step(
+    return run_step_in_process(
         "Validate metadata coverage",
-        [
-            sys.executable,
-            str(scripts_dir / "management" / "manage_index.py"),
-            "validate-metadata",
-        ],
+        "management.manage_index",
+        scripts_dir / "management" / "manage_index.py",
+        ["validate-metadata"],
     )
 
 def step_generate_report(scripts_dir: Path) -> bool:
     """Step 5: Generate index metadata report"""
-    return run_step(
+    return run_step_in_process(
         "Generate index metadata report",
-        [sys.executable, str(scripts_dir / "management" / "generate_report.py")],
+        "management.generate_report",
+        scripts_dir / "management" / "generate_report.py",
     )
 
 def check_missing_files(scripts_dir: Path, base_dir: Path, cleanup: bool = False) -> bool:
@@ -327,7 +413,7 @@ def main() -> int:
         return 1
     
     # scripts_dir already set by setup_python_path() at top of file
-    start_time = datetime.now()
+    start_time = time.monotonic()  # Durations only; the report takes its own UTC timestamp
     base_dir = get_base_dir()
 
     # Clear cache if requested
@@ -379,7 +465,7 @@ def main() -> int:
         elif args.step == 'rebuild-index':
             step_ok = step_rebuild_index(scripts_dir)
         elif args.step == 'extract-keywords':
-            step_ok = step_extract_keywords(scripts_dir)
+            step_ok = step_extract_keywords(scripts_dir, base_dir)
         elif args.step == 'validate-metadata':
             step_ok = step_validate_metadata(scripts_dir)
         elif args.step == 'generate-report':
@@ -420,8 +506,8 @@ def main() -> int:
         return 1
 
     # 3) Extract keywords / metadata (foreground, no background jobs)
-    #    This typically completes in under 30 seconds for ~500 docs.
-    step3_ok = step_extract_keywords(scripts_dir)
+    #    Only the doc_ids changed by step 2 are processed when it recorded them.
+    step3_ok = step_extract_keywords(scripts_dir, base_dir)
     if not step3_ok:
         print("❌ Keyword/metadata extraction failed. See output above.")
         logger.end(exit_code=1, summary={'failed_step': 'extract_keywords'})
@@ -459,7 +545,8 @@ def main() -> int:
         print()
 
     # Calculate total duration
-    total_duration = (datetime.now() - start_time).total_seconds()
+    total_duration = time.monotonic() - start_time
+    formatted_duration = format_duration(total_duration)
     
     print()
     print("Index refresh complete.")
@@ -471,7 +558,7 @@ def main() -> int:
     if args.check_drift:
         print("  - Drift detection completed" + (" (drift detected)" if drift_detected else " (no drift)"))
     print()
-    print(f"Total duration: {format_duration(total_duration)}")
+    print(f"Total duration: {formatted_duration}")
     print()
     print("Expected runtime: ~20-30 seconds for ~500 documents on a typical dev machine.")
     print("This command is designed to be run in the foreground (no background job needed).")
@@ -488,18 +575,29 @@ def main() -> int:
             now_utc = datetime.now(timezone.utc)
             timestamp = now_utc.strftime("%Y-%m-%d_%H%M%S")
             report_path = temp_dir / f"{timestamp}-docs-management-refresh-report.md"
+            step_lines = [
+                f"- {name}: {'OK' if ok else 'FAIL'}"
+                for name, ok in (
+                    ("Check dependencies", step1_ok),
+                    ("Rebuild index", step2_ok),
+                    ("Extract keywords/metadata", step3_ok),
+                    ("Validate metadata", step4_ok),
+                    ("Generate report", step5_ok),
+                )
+            ]
+            header = (
+                "# Claude Docs Index Refresh Report\n\n"
+                f"- **Timestamp (UTC)**: {now_utc.isoformat().replace('+00:00', 'Z')}\n"
+                f"- **Python**: `{sys.version.split()[0]}`\n"
+                f"- **Executable**: `{sys.executable}`\n"
+                "\n## Step Status\n\n"
+            )
+            body = (
+                "\n".join(step_lines) + "\n"
+                "\n> This file is generated by `refresh_index.py` when `CLAUDE_DOCS_RUN_REPORT=1`.\n"
+            )
             with report_path.open("w", encoding="utf-8") as f:
-                f.write("# Claude Docs Index Refresh Report\n\n")
-                f.write(f"- **Timestamp (UTC)**: {now_utc.isoformat().replace('+00:00', 'Z')}\n")
-                f.write(f"- **Python**: `{sys.version.split()[0]}`\n")
-                f.write(f"- **Executable**: `{sys.executable}`\n")
-                f.write("\n## Step Status\n\n")
-                f.write(f"- Check dependencies: {'OK' if step1_ok else 'FAIL'}\n")
-                f.write(f"- Rebuild index: {'OK' if step2_ok else 'FAIL'}\n")
-                f.write(f"- Extract keywords/metadata: {'OK' if step3_ok else 'FAIL'}\n")
-                f.write(f"- Validate metadata: {'OK' if step4_ok else 'FAIL'}\n")
-                f.write(f"- Generate report: {'OK' if step5_ok else 'FAIL'}\n")
-                f.write("\n> This file is generated by `refresh_index.py` when `CLAUDE_DOCS_RUN_REPORT=1`.\n")
+                f.write(header + body)
             print(f"Run report written to: {report_path}")
         except Exception as e:
             print(f"⚠️  Failed to write run report: {e}")
@@ -517,20 +615,20 @@ def main() -> int:
     if validation_failed:
         logger.end(exit_code=1, summary={
             'status': 'validation_failed',
-            'total_duration': format_duration(total_duration),
+            'total_duration': formatted_duration,
             'drift_detected': drift_detected,
         })
         return 1
     elif drift_detected:
         logger.end(exit_code=2, summary={
             'status': 'drift_detected',
-            'total_duration': format_duration(total_duration),
+            'total_duration': formatted_duration,
         })
         return 2
     else:
         logger.end(exit_code=EXIT_SUCCESS, summary={
             'status': 'success',
-            'total_duration': format_duration(total_duration),
+            'total_duration': formatted_duration,
             'steps_completed': 5,
         })
         return EXIT_SUCCESS
@@ -16,23 +16,46 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import argparse
+import functools
+import importlib.util
+import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import PackageNotFoundError, distribution
 from typing import Any
 
 from utils.script_utils import configure_utf8_output, suppress_pydantic_v1_warning
 configure_utf8_output()
-suppress_pydantic_v1_warning()  # Must be called before spacy import
 
 from utils.logging_utils import get_or_setup_logger
 logger = get_or_setup_logger(__file__, log_category="diagnostics")
 
-def check_import(module_name: str, package_name: str = None) -> tuple[bool, str]:
+# Pipeline components not needed to verify the model loads (skips deserializing their weights)
+SPACY_PROBE_EXCLUDE = ['tok2vec', 'tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'ner']
+IMPORT_CHECK_WORKERS = 8  # Threads checking modules concurrently (lookups and imports are disk-bound)
+LOAD_CHECK_MODULES = frozenset({'spacy'})  # Can be installed but fail to import (e.g. Python 3.14+)
+
+_spacy_import_ready = False  # suppress_pydantic_v1_warning() already called
+
+def _ensure_spacy_import_ready() -> None:
+    """Install the spaCy import warning filter once, right before spaCy is first imported."""
+    global _spacy_import_ready
+    if not _spacy_import_ready:
+        suppress_pydantic_v1_warning()
+        _spacy_import_ready = True
+
+def check_import(module_name: str, package_name: str = None, load: bool = False) -> tuple[bool, str]:
     """
     Check if a module can be imported
     
+    By default the module is only located (importlib.util.find_spec), without
+    running its package initialization.
+    
     Args:
         module_name: Name of module to import
         package_name: Name of package (for pip install), defaults to module_name
+        load: Actually import the module, for packages that may be present
+              but fail to import
     
     Returns:
         Tuple of (is_available, error_message)
@@ -40,6 +63,17 @@ def check_import(module_name: str, package_name: str = None) -> tuple[bool, str]
     if package_name is None:
         package_name = module_name
     
+    if not load:
+        try:
+            spec = importlib.util.find_spec(module_name)
+        except (ImportError, ValueError):
+            spec = None
+        if spec is None:
+            return False, f"Module '{module_name}' not found"
+        if spec.has_location and spec.origin:
+            return True, f"Found at {Path(spec.origin).parent}"
+        return True, ""
+    
     try:
         mod = __import__(module_name)
         # Try to get location if available
@@ -53,16 +87,53 @@ def check_import(module_name: str, package_name: str = None) -> tuple[bool, str]
         # Catch other errors (e.g., type inference issues on Python 3.14+)
         return False, f"Module '{module_name}' failed to import: {e}"
 
-def check_spacy_model() -> tuple[bool, str, dict[str, Any]]:
+def _write_lines(lines: list[str]) -> None:
+    """Write buffered report lines to stdout in one call and clear the buffer."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+
+@functools.lru_cache(maxsize=1)
+def _pip_list_packages() -> frozenset[str]:
+    """
+    Get the distributions pip reports for this interpreter (one pip run per process)
+    
+    Returns:
+        Normalized names (lowercase, '-' separated); empty if pip could not be run
+    """
+    try:
+        from utils.config_helpers import get_subprocess_default_timeout
+        result = subprocess.run(
+            [sys.executable, '-m', 'pip', 'list', '--format=json', '--disable-pip-version-check'],
+            capture_output=True,
+            text=True,
+            timeout=get_subprocess_default_timeout()
+        )
+        if result.returncode != 0:
+            return frozenset()
+        return frozenset(pkg['name'].lower().replace('_', '-') for pkg in json.loads(result.stdout))
+    except Exception:
+        return frozenset()
+
+def check_spacy_model(deep: bool = False) -> tuple[bool, str, dict[str, Any]]:
     """
     Check if spaCy English model is installed using multiple verification methods
     
+    By default the model counts as available when its package metadata is
+    installed (a few KB read). Loading the model is only attempted when deep
+    is True.
+    
+    Args:
+        deep: Also load the model to verify it is usable (slow; for --diagnose)
+    
     Returns:
         Tuple of (is_available, error_message, diagnostic_info)
     """
     diagnostic_info = {
         'spacy_importable': False,
         'spacy_version': None,
+        'model_installed': False,
+        'model_version': None,
         'model_loadable': False,
         'model_location': None,
         'pip_list_has_spacy': False,
@@ -70,6 +141,7 @@ def check_spacy_model() -> tuple[bool, str, dict[str, Any]]:
     }
     
     # Method 1: Try direct import
+    _ensure_spacy_import_ready()
     try:
         import spacy
         diagnostic_info['spacy_importable'] = True
@@ -79,57 +151,45 @@ def check_spacy_model() -> tuple[bool, str, dict[str, Any]]:
             pass
     except ImportError:
         # Check if spaCy is installed via pip list (might be in different Python)
-        try:
-            from config_helpers import get_subprocess_default_timeout
-            timeout = get_subprocess_default_timeout()
-            result = subprocess.run(
-                [sys.executable, '-m', 'pip', 'list'],
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
-            if result.returncode == 0:
-                output = result.stdout.lower()
-                if 'spacy' in output:
-                    diagnostic_info['pip_list_has_spacy'] = True
-        except Exception:
-            pass
+        diagnostic_info['pip_list_has_spacy'] = 'spacy' in _pip_list_packages()
         return False, "spaCy not installed (cannot import)", diagnostic_info
     except Exception as e:
         # Catch other errors (e.g., type inference issues on Python 3.14+)
         diagnostic_info['import_error'] = str(e)
         return False, f"spaCy failed to import: {e}", diagnostic_info
     
-    # Method 2: Try to load the model
+    # Method 2: Look up the installed model distribution (metadata only)
+    try:
+        dist = distribution('en_core_web_sm')
+    except PackageNotFoundError:
+        if not deep:
+            return False, "Model 'en_core_web_sm' not found", diagnostic_info
+    else:
+        diagnostic_info['model_installed'] = True
+        diagnostic_info['model_version'] = dist.version
+        diagnostic_info['model_location'] = str(dist.locate_file('en_core_web_sm'))
+        if not deep:
+            return True, "", diagnostic_info
+    
+    # Method 3: Try to load the model (config and vocab only)
     try:
-        nlp = spacy.load('en_core_web_sm')
+        nlp = spacy.load('en_core_web_sm', exclude=SPACY_PROBE_EXCLUDE)
         diagnostic_info['model_loadable'] = True
         try:
             # Try to get model location
-            if hasattr(nlp, 'path'):
-                diagnostic_info['model_location'] = str(nlp.path)
-            elif hasattr(nlp, '_path'):
-                diagnostic_info['model_location'] = str(nlp._path)
+            model_path = getattr(nlp, 'path', None) or getattr(nlp, '_path', None)
+            if model_path is None:
+                spec = importlib.util.find_spec('en_core_web_sm')
+                if spec is not None and spec.origin:
+                    model_path = Path(spec.origin).parent
+            if model_path is not None:
+                diagnostic_info['model_location'] = str(model_path)
         except Exception:
             pass
         return True, "", diagnostic_info
     except OSError as e:
         # Model not found - check if it's listed in pip
-        try:
-            from config_helpers import get_subprocess_default_timeout
-            timeout = get_subprocess_default_timeout()
-            result = subprocess.run(
-                [sys.executable, '-m', 'pip', 'list'],
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
-            if result.returncode == 0:
-                output = result.stdout.lower()
-                if 'en-core-web-sm' in output or 'en_core_web_sm' in output:
-                    diagnostic_info['pip_list_has_model'] = True
-        except Exception:
-            pass
+        diagnostic_info['pip_list_has_model'] = 'en-core-web-sm' in _pip_list_packages()
         
         error_msg = f"Model 'en_core_web_sm' not found"
         if 'en-core-web-sm' in str(e).lower() or 'en_core_web_sm' in str(e).lower():
@@ -169,6 +229,14 @@ Examples:
     
     args = parser.parse_args()
     
+    # Interpreter facts used throughout the report
+    platform = sys.platform
+    executable = sys.executable
+    py_major, py_minor = sys.version_info[:2]
+    python_version = f"{py_major}.{py_minor}"
+    # spaCy supports Python 3.7-3.13 (compare tuples; '3.9' > '3.14' as strings)
+    spacy_python_supported = (3, 7) <= (py_major, py_minor) <= (3, 13)
+    
     # Log script start
     logger.start({
         'install_optional': args.install_optional,
@@ -178,7 +246,7 @@ Examples:
     
     # Import environment detection functions
     try:
-        from setup_dependencies import (
+        from setup.setup_dependencies import (
             get_python_environment_info,
             diagnose_environment,
             print_environment_info,
@@ -194,6 +262,18 @@ Examples:
             print("⚠️  Warning: Could not import environment detection functions")
             print("   Make sure setup_dependencies.py is in the same directory")
     
+    # The interpreter and spaCy probes may each spawn a subprocess and are
+    # independent, so start them now and only wait where the results are used.
+    # get_effective_spacy_status() reuses the cached Python 3.13 detection once
+    # it has finished. The build-tool probe is only needed when spaCy is
+    # missing everywhere, so it runs there instead.
+    fut_py313 = fut_effective_spacy = None
+    if env_info_available:
+        probe_executor = ThreadPoolExecutor(max_workers=2)
+        fut_py313 = probe_executor.submit(detect_python_for_spacy)
+        fut_effective_spacy = probe_executor.submit(get_effective_spacy_status)
+        probe_executor.shutdown(wait=False)
+    
     # Show environment info if requested or if diagnosing
     if args.diagnose and env_info_available:
         print()
@@ -245,274 +325,292 @@ Examples:
             'all_optional': True,
         }
         
-        # Check required dependencies
-        print("📦 Checking Required Dependencies:")
-        print("=" * 60)
-        all_required_ok = True
-        
-        for module, package in required_deps.items():
-            available, error = check_import(module, package)
-            results['required'][package] = available
-            status = "✅" if available else "❌"
-            print(f"  {status} {package:20s}", end="")
-            if available:
-                print(" ✓ Installed")
-            else:
-                print(f" ✗ Missing: {error}")
-                all_required_ok = False
-                if not args.json:
-                    print(f"      Install with: pip install {package}")
-        
-        results['all_required'] = all_required_ok
-        print()
-        
-        # Check optional dependencies
-        print("📦 Checking Optional Dependencies (Recommended):")
-        print("=" * 60)
-        all_optional_ok = True
-        
-        # Check Python version compatibility for spaCy
-        python_version = f"{sys.version_info.major}.{sys.version_info.minor}"
+        # Python 3.13 fallback interpreter for spaCy
         python313_available = None
-        if env_info_available:
+        if fut_py313 is not None:
             try:
-                python313_available = detect_python_for_spacy()
+                python313_available = fut_py313.result()
             except Exception:
                 pass
         
         # Check effective spaCy status first (before checking current interpreter)
         effective_spacy_precheck = None
-        if env_info_available:
+        if fut_effective_spacy is not None:
             try:
-                effective_spacy_precheck = get_effective_spacy_status()
+                effective_spacy_precheck = fut_effective_spacy.result()
             except Exception:
                 pass
         
-        for module, package in optional_deps.items():
-            available, error = check_import(module, package)
-            results['optional'][package] = available
-            
-            # Special handling for spaCy - show effective status if available
-            if package == 'spacy' and effective_spacy_precheck:
-                effective_available = effective_spacy_precheck.get('effective_available', False)
-                effective_model_available = effective_spacy_precheck.get('effective_model_available', False)
-                effective_python = effective_spacy_precheck.get('effective_python')
-                
-                if effective_available and effective_model_available:
-                    status = "✅"
-                    print(f"  {status} {package:20s}", end="")
-                    if available:
-                        print(" ✓ Installed (current interpreter)")
-                    else:
-                        print(" ✓ Available (effective)")
-                        if effective_python and effective_python != sys.executable:
-                            print(f"      Available via: {effective_python}")
-                    # Don't mark as missing if effective is available
-                    if not available:
-                        all_optional_ok = False  # Still mark as not OK for current interpreter
-                else:
-                    status = "⚠️ " if available else "⚠️ "
-                    print(f"  {status} {package:20s}", end="")
-                    if available:
-                        print(" ✓ Installed")
-                    else:
-                        print(f" ✗ Missing (optional)")
-                        all_optional_ok = False
-                        if not args.json:
-                            print(f"      Install with: pip install {package}")
-                            if python_version >= '3.14' or python_version < '3.7':
-                                print(f"      ⚠️  Note: spaCy requires Python 3.7-3.13, but Python {python_version} is being used")
-                                if python313_available:
-                                    print(f"      ✅ Python 3.13 is available - will be used automatically for spaCy")
-                                    print(f"      Recommended: {'py -3.13' if sys.platform == 'win32' else 'python3.13'} -m pip install spacy")
-                                else:
-                                    print(f"      ❌ Python 3.13 not found - install it first:")
-                                    if sys.platform == 'win32':
-                                        print(f"         winget install --id Python.Python.3.13 -e --source winget")
-                                    elif sys.platform == 'darwin':
-                                        print(f"         brew install python@3.13")
-                                    else:
-                                        print(f"         sudo apt install python3.13 python3.13-venv python3.13-dev")
-            else:
-                status = "✅" if available else "⚠️ "
-                print(f"  {status} {package:20s}", end="")
-                if available:
-                    print(" ✓ Installed")
-                else:
-                    print(f" ✗ Missing (optional)")
-                    all_optional_ok = False
-                    if not args.json:
-                        print(f"      Install with: pip install {package}")
+        # spaCy already failed to import here if another interpreter provides it
+        # (the precheck probes the current interpreter first); importing it
+        # again is the slowest check, so only --diagnose repeats it
+        spacy_python = (effective_spacy_precheck or {}).get('effective_python')
+        spacy_current_skipped = bool(spacy_python and spacy_python != executable and not args.diagnose)
+        results['spacy_current_skipped'] = spacy_current_skipped
+        
+        # Check all modules concurrently; results are read back in declaration
+        # order below, so the report stays deterministic
+        all_deps = {**required_deps, **optional_deps}
+        if spacy_current_skipped:
+            del all_deps['spacy']
+        else:
+            _ensure_spacy_import_ready()
+        with ThreadPoolExecutor(max_workers=min(IMPORT_CHECK_WORKERS, len(all_deps))) as executor:
+            import_checks = {
+                module: executor.submit(check_import, module, package, module in LOAD_CHECK_MODULES)
+                for module, package in all_deps.items()
+            }
+        
+        # Collect all results first; the human-readable report below is only
+        # formatted when it will be shown (not for --json)
+        for module, package in required_deps.items():
+            results['required'][package] = import_checks[module].result()[0]
+        all_required_ok = all(results['required'].values())
+        results['all_required'] = all_required_ok
         
-        results['all_optional'] = all_optional_ok  # will be refined after spaCy effective status
+        for module, package in optional_deps.items():
+            # A skipped import (spaCy provided by another interpreter) counts as missing here
+            results['optional'][package] = module in import_checks and import_checks[module].result()[0]
+        yake_available = results['optional']['yake']
+        spacy_available_current = results['optional']['spacy']
+        missing_required = [pkg for pkg, avail in results['required'].items() if not avail]
+        missing_optional = [pkg for pkg, avail in results['optional'].items() if not avail]
         results['python_version'] = python_version
         results['python313_available'] = python313_available is not None
-        print()
         
         # Check spaCy model (with enhanced detection across interpreters)
-        print("📦 Checking spaCy Model:")
-        print("=" * 60)
-        model_available, model_error, model_diag = check_spacy_model()
+        if spacy_current_skipped:
+            model_available, model_error = False, "spaCy not importable in current interpreter"
+            model_diag = effective_spacy_precheck.get('current', {})
+        else:
+            model_available, model_error, model_diag = check_spacy_model(deep=args.diagnose)
         results['spacy_model'] = model_available
         results['spacy_diagnostics'] = model_diag
 
-        effective_spacy = get_effective_spacy_status()
+        # Reuse the precheck (the probe may spawn another interpreter)
+        effective_spacy = effective_spacy_precheck or {}
         results['spacy_effective'] = effective_spacy
 
         effective_available = effective_spacy.get('effective_available', False)
         effective_model_available = effective_spacy.get('effective_model_available', False)
         effective_python = effective_spacy.get('effective_python')
-
-        # Report per-interpreter and effective status
-        status = "✅" if effective_model_available else "⚠️ "
-        print(f"  {status} en_core_web_sm (effective)", end="")
-        if effective_model_available:
-            print(" ✓ Installed")
-            loc = effective_spacy.get('model_location')
-            if loc and not args.json:
-                print(f"      Location: {loc}")
-        else:
-            print(" ✗ Missing (optional)")
-            if not args.json and model_error:
-                print(f"      Error (current interpreter): {model_error}")
-        print()
-
-        # Summary
-        print("📊 Summary:")
-        print("=" * 60)
-
-        if all_required_ok:
-            print("  ✅ All required dependencies are installed")
-        else:
-            print("  ❌ Some required dependencies are missing")
-            print("\n  Install missing required dependencies:")
-            missing_required = [pkg for pkg, avail in results['required'].items() if not avail]
-            print(f"     pip install {' '.join(missing_required)}")
         
         # Determine effective optional status (for human and JSON summary):
-        yake_available = results['optional'].get('yake', False)
         effective_optional_ok = bool(yake_available and effective_model_available)
         results['all_optional'] = effective_optional_ok
-
-        if all_required_ok and effective_optional_ok:
-            print("  ✅ All optional dependencies are installed")
-            print("     (YAKE and spaCy+model available via at least one Python interpreter)")
+        
+        if args.json:
+            print(json.dumps(results, indent=2))
         else:
-            print("  ⚠️  Optional dependencies status:")
+            # Lines are buffered and written once per section
+            out: list[str] = []
+        
+            # Required dependencies
+            out.append("📦 Checking Required Dependencies:")
+            out.append("=" * 60)
+            for module, package in required_deps.items():
+                available, error = import_checks[module].result()
+                status = "✅" if available else "❌"
+                row = f"  {status} {package:20s}"
+                if available:
+                    out.append(row + " ✓ Installed")
+                else:
+                    out.append(row + f" ✗ Missing: {error}")
+                    out.append(f"      Install with: pip install {package}")
+        
+            out.append("")
+            _write_lines(out)
+        
+            # Optional dependencies
+            out.append("📦 Checking Optional Dependencies (Recommended):")
+            out.append("=" * 60)
+        
+            for package, available in results['optional'].items():
+                # Special handling for spaCy - show effective status if available
+                if package == 'spacy' and effective_spacy:
+                    if effective_available and effective_model_available:
+                        status = "✅"
+                        row = f"  {status} {package:20s}"
+                        if available:
+                            out.append(row + " ✓ Installed (current interpreter)")
+                        else:
+                            out.append(row + " ✓ Available (effective)")
+                            if effective_python and effective_python != executable:
+                                out.append(f"      Available via: {effective_python}")
+                    else:
+                        status = "⚠️ " if available else "⚠️ "
+                        row = f"  {status} {package:20s}"
+                        if available:
+                            out.append(row + " ✓ Installed")
+                        else:
+                            out.append(row + " ✗ Missing (optional)")
+                            out.append(f"      Install with: pip install {package}")
+                            if not spacy_python_supported:
+                                out.append(f"      ⚠️  Note: spaCy requires Python 3.7-3.13, but Python {python_version} is being used")
+                                if python313_available:
+                                    out.append(f"      ✅ Python 3.13 is available - will be used automatically for spaCy")
+                                    out.append(f"      Recommended: {'py -3.13' if platform == 'win32' else 'python3.13'} -m pip install spacy")
+                                else:
+                                    out.append(f"      ❌ Python 3.13 not found - install it first:")
+                                    if platform == 'win32':
+                                        out.append(f"         winget install --id Python.Python.3.13 -e --source winget")
+                                    elif platform == 'darwin':
+                                        out.append(f"         brew install python@3.13")
+                                    else:
+                                        out.append(f"         sudo apt install python3.13 python3.13-venv python3.13-dev")
+                else:
+                    status = "✅" if available else "⚠️ "
+                    row = f"  {status} {package:20s}"
+                    if available:
+                        out.append(row + " ✓ Installed")
+                    else:
+                        out.append(row + " ✗ Missing (optional)")
+                        out.append(f"      Install with: pip install {package}")
+        
+            out.append("")
+            _write_lines(out)
+        
+            # spaCy model (with enhanced detection across interpreters)
+            out.append("📦 Checking spaCy Model:")
+            out.append("=" * 60)
+            # Report per-interpreter and effective status
+            status = "✅" if effective_model_available else "⚠️ "
+            row = f"  {status} en_core_web_sm (effective)"
+            if effective_model_available:
+                out.append(row + " ✓ Installed")
+                loc = effective_spacy.get('model_location')
+                if loc:
+                    out.append(f"      Location: {loc}")
+            else:
+                out.append(row + " ✗ Missing (optional)")
+                if model_error:
+                    out.append(f"      Error (current interpreter): {model_error}")
+            out.append("")
+            _write_lines(out)
 
-            # Show detailed status for each optional dependency
-            spacy_available_current = results['optional'].get('spacy', False)
+            # Summary
+            out.append("📊 Summary:")
+            out.append("=" * 60)
 
-            if not yake_available:
-                print("     ❌ YAKE - Missing")
-                print("        Install: pip install yake")
+            if all_required_ok:
+                out.append("  ✅ All required dependencies are installed")
             else:
-                print("     ✅ YAKE - Installed")
+                out.append("  ❌ Some required dependencies are missing")
+                out.append("\n  Install missing required dependencies:")
+                out.append(f"     pip install {' '.join(missing_required)}")
 
-            # spaCy: current vs effective
-            if effective_available:
-                if spacy_available_current:
-                    print("     ✅ spaCy (current interpreter) - Installed")
-                else:
-                    if effective_python and effective_python != sys.executable:
-                        print(f"     ✅ spaCy (effective) - Available via {effective_python}")
-                        print(f"     ⚠️  spaCy (current interpreter) - Not importable (will use {effective_python} automatically)")
-                    else:
-                        print("     ⚠️  spaCy (current interpreter) - Not importable")
-                if effective_python and effective_python != sys.executable and spacy_available_current:
-                    print(f"     ✅ spaCy (effective) - Also available via {effective_python}")
-                if effective_model_available:
-                    loc = effective_spacy.get('model_location')
-                    if loc:
-                        print(f"        Model location: {loc}")
-                else:
-                    print("     ⚠️  spaCy model - Not loadable in any interpreter")
+
+            if all_required_ok and effective_optional_ok:
+                out.append("  ✅ All optional dependencies are installed")
+                out.append("     (YAKE and spaCy+model available via at least one Python interpreter)")
             else:
-                print("     ❌ spaCy - Missing in all supported interpreters")
+                out.append("  ⚠️  Optional dependencies status:")
+
+                # Show detailed status for each optional dependency
+                if not yake_available:
+                    out.append("     ❌ YAKE - Missing")
+                    out.append("        Install: pip install yake")
+                else:
+                    out.append("     ✅ YAKE - Installed")
 
-                # Check Python version compatibility
-                if python_version >= '3.14' or python_version < '3.7':
-                    print(f"        ⚠️  spaCy requires Python 3.7-3.13, but Python {python_version} is being used")
-                    if python313_available:
-                        print(f"        ✅ Python 3.13 is available - will be used automatically")
-                        python_cmd = 'py -3.13' if sys.platform == 'win32' else 'python3.13'
-                        print(f"        Recommended: {python_cmd} -m pip install spacy")
-                        print(f"        (Pre-built wheels available, no compilation needed)")
+                # spaCy: current vs effective
+                if effective_available:
+                    if spacy_available_current:
+                        out.append("     ✅ spaCy (current interpreter) - Installed")
                     else:
-                        print(f"        ❌ Python 3.13 not found - install it first:")
-                        if sys.platform == 'win32':
-                            print(f"           winget install --id Python.Python.3.13 -e --source winget")
-                        elif sys.platform == 'darwin':
-                            print(f"           brew install python@3.13")
+                        if effective_python and effective_python != executable:
+                            out.append(f"     ✅ spaCy (effective) - Available via {effective_python}")
+                            out.append(f"     ⚠️  spaCy (current interpreter) - Not importable (will use {effective_python} automatically)")
                         else:
-                            print(f"           sudo apt install python3.13 python3.13-venv python3.13-dev")
-                    print()
-                    print(f"        Alternative: Install spaCy with current Python (requires C++ build tools)")
+                            out.append("     ⚠️  spaCy (current interpreter) - Not importable")
+                    if effective_python and effective_python != executable and spacy_available_current:
+                        out.append(f"     ✅ spaCy (effective) - Also available via {effective_python}")
+                    if effective_model_available:
+                        loc = effective_spacy.get('model_location')
+                        if loc:
+                            out.append(f"        Model location: {loc}")
+                    else:
+                        out.append("     ⚠️  spaCy model - Not loadable in any interpreter")
                 else:
-                    print(f"        Install: {sys.executable} -m pip install spacy")
+                    out.append("     ❌ spaCy - Missing in all supported interpreters")
+
+                    # Check Python version compatibility
+                    if not spacy_python_supported:
+                        out.append(f"        ⚠️  spaCy requires Python 3.7-3.13, but Python {python_version} is being used")
+                        if python313_available:
+                            out.append(f"        ✅ Python 3.13 is available - will be used automatically")
+                            python_cmd = 'py -3.13' if platform == 'win32' else 'python3.13'
+                            out.append(f"        Recommended: {python_cmd} -m pip install spacy")
+                            out.append(f"        (Pre-built wheels available, no compilation needed)")
+                        else:
+                            out.append(f"        ❌ Python 3.13 not found - install it first:")
+                            if platform == 'win32':
+                                out.append(f"           winget install --id Python.Python.3.13 -e --source winget")
+                            elif platform == 'darwin':
+                                out.append(f"           brew install python@3.13")
+                            else:
+                                out.append(f"           sudo apt install python3.13 python3.13-venv python3.13-dev")
+                        out.append("")
+                        out.append(f"        Alternative: Install spaCy with current Python (requires C++ build tools)")
+                    else:
+                        out.append(f"        Install: {executable} -m pip install spacy")
 
-                # Import setup_dependencies for build tools instructions
-                try:
-                    from setup_dependencies import (
-                        get_build_tools_install_instructions, detect_package_manager,
-                        check_compiler_accessible, locate_vcvarsall_bat
-                    )
+                    # Import setup_dependencies for build tools instructions
+                    try:
+                        from setup.setup_dependencies import (
+                            get_build_tools_install_instructions, detect_package_manager,
+                            check_compiler_accessible, locate_vcvarsall_bat
+                        )
 
-                    # Check compiler accessibility
-                    compiler_accessible = check_compiler_accessible()
-                    vcvarsall_path = locate_vcvarsall_bat() if sys.platform == 'win32' else None
+                        # Check compiler accessibility
+                        compiler_accessible = check_compiler_accessible()
 
-                    if not compiler_accessible:
-                        build_instructions = get_build_tools_install_instructions()
-                        pkg_mgr = detect_package_manager()
-                        if build_instructions['auto'] and pkg_mgr:
-                            print(f"        Build tools auto-install via {pkg_mgr}:")
-                            print(f"          {build_instructions['command']}")
-                        if sys.platform == 'win32' and vcvarsall_path:
-                            print(f"        ✅ VS Build Tools detected at: {vcvarsall_path}")
-                            print(f"        The script will automatically configure VS environment")
-                        print("        Manual installation:")
-                        for line in build_instructions['manual']:
-                            print(f"          {line}")
-                except Exception:
-                    print("        Windows: Install Visual Studio Build Tools")
-                    print("        macOS: xcode-select --install")
-                    print("        Linux: sudo apt install build-essential")
+                        if not compiler_accessible:
+                            vcvarsall_path = locate_vcvarsall_bat() if platform == 'win32' else None
+                            build_instructions = get_build_tools_install_instructions()
+                            pkg_mgr = detect_package_manager()
+                            if build_instructions['auto'] and pkg_mgr:
+                                out.append(f"        Build tools auto-install via {pkg_mgr}:")
+                                out.append(f"          {build_instructions['command']}")
+                            if platform == 'win32' and vcvarsall_path:
+                                out.append(f"        ✅ VS Build Tools detected at: {vcvarsall_path}")
+                                out.append(f"        The script will automatically configure VS environment")
+                            out.append("        Manual installation:")
+                            for line in build_instructions['manual']:
+                                out.append(f"          {line}")
+                    except Exception:
+                        out.append("        Windows: Install Visual Studio Build Tools")
+                        out.append("        macOS: xcode-select --install")
+                        out.append("        Linux: sudo apt install build-essential")
 
-                # Show diagnostic info if available
-                if env_info_available:
-                    env_info = get_python_environment_info()
-                    if not env_info['pip_python_match']:
-                        print(f"        ⚠️  Warning: pip may not match current Python")
-                        print(f"        Current Python: {env_info['python_executable']}")
-                        print(f"        pip Location: {env_info['pip_location'] or 'Not found'}")
+                    # Show diagnostic info if available
+                    if env_info_available:
+                        env_info = get_python_environment_info()
+                        if not env_info['pip_python_match']:
+                            out.append(f"        ⚠️  Warning: pip may not match current Python")
+                            out.append(f"        Current Python: {env_info['python_executable']}")
+                            out.append(f"        pip Location: {env_info['pip_location'] or 'Not found'}")
             
-            print("\n  Note: Scripts work fine with fallbacks if optional deps are missing")
-            print("        Enhanced features (YAKE keyword extraction, spaCy stop words) require these")
+                out.append("\n  Note: Scripts work fine with fallbacks if optional deps are missing")
+                out.append("        Enhanced features (YAKE keyword extraction, spaCy stop words) require these")
             
-            if args.install_optional:
-                missing_optional = [pkg for pkg, avail in results['optional'].items() if not avail]
-                if missing_optional:
-                    print("\n  Quick install all optional dependencies:")
-                    print(f"     {sys.executable} -m pip install {' '.join(missing_optional)}")
-                    print(f"     Or: python setup_dependencies.py --install-all")
+                if args.install_optional and missing_optional:
+                    out.append("\n  Quick install all optional dependencies:")
+                    out.append(f"     {executable} -m pip install {' '.join(missing_optional)}")
+                    out.append(f"     Or: python setup_dependencies.py --install-all")
             
-            if args.diagnose and env_info_available:
-                print("\n  💡 For more detailed diagnostics, run:")
-                print(f"     python check_dependencies.py --diagnose")
-        
-        print()
+                if args.diagnose and env_info_available:
+                    out.append("\n  💡 For more detailed diagnostics, run:")
+                    out.append(f"     python check_dependencies.py --diagnose")
         
-        # Exit code
-        if args.json:
-            import json
-            print(json.dumps(results, indent=2))
+            out.append("")
+            _write_lines(out)
         
         summary = {
             'required_ok': all_required_ok,
             'optional_ok': effective_optional_ok,
-            'missing_required': len([pkg for pkg, avail in results['required'].items() if not avail]),
-            'missing_optional': len([pkg for pkg, avail in results['optional'].items() if not avail])
+            'missing_required': len(missing_required),
+            'missing_optional': len(missing_optional)
         }
         
         logger.end(exit_code=0 if all_required_ok else 1, summary=summary)
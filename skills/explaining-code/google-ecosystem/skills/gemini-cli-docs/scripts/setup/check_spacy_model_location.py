@@ -3,6 +3,7 @@
 """Quick script to check spaCy model location and info"""
 
 import sys
+from importlib.metadata import PackageNotFoundError, distribution
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
@@ -17,18 +18,19 @@ def main() -> None:
     logger.start()
     exit_code = 0
     try:
+        # Locate the model from its package metadata (importing it imports spaCy)
         try:
-            import en_core_web_sm
-            model_path = Path(en_core_web_sm.__file__)
-            print(f"Model installed at: {model_path}")
-            print(f"Model directory: {model_path.parent}")
-            logger.track_metric('model_found', True)
-            logger.track_metric('model_path', str(model_path))
-        except ImportError:
+            dist = distribution('en_core_web_sm')
+        except PackageNotFoundError:
             print("Model not installed")
             logger.track_metric('model_found', False)
             exit_code = 1
             raise SystemExit(1)
+        model_path = Path(dist.locate_file('en_core_web_sm'))
+        print(f"Model installed at: {model_path}")
+        print(f"Model version: {dist.version}")
+        logger.track_metric('model_found', True)
+        logger.track_metric('model_path', str(model_path))
 
         try:
             from spacy.lang.en.stop_words import STOP_WORDS
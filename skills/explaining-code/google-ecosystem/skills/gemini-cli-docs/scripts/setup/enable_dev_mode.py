@@ -13,6 +13,7 @@ Usage:
 The output can be copied to your shell profile or run directly in your terminal.
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -27,8 +28,8 @@ def main():
     """Generate and print shell commands for enabling dev mode."""
     # Determine skill directory
     if len(sys.argv) > 1:
-        # Custom path provided
-        skill_dir = Path(sys.argv[1]).resolve()
+        # Custom path provided (made absolute only; symlinks are kept as given)
+        skill_dir = Path(os.path.abspath(sys.argv[1]))
     else:
         # Auto-detect from this script's location
         skill_dir = bootstrap.skill_dir
@@ -43,67 +44,70 @@ def main():
     # Generate commands
     commands = format_shell_commands(skill_dir)
 
-    print("=" * 70)
-    print("Development Mode Setup for docs-management Plugin")
-    print("=" * 70)
-    print()
-    print(f"Skill directory: {skill_dir}")
-    print()
-    print("-" * 70)
-    print("POWERSHELL (Windows)")
-    print("-" * 70)
-    print()
-    print("# Enable dev mode (run in terminal or add to $PROFILE):")
-    print(f"  {commands['powershell']}")
-    print()
-    print("# Verify:")
-    print(f"  echo $env:{DEV_ROOT_ENV_VAR}")
-    print()
-    print("# Disable:")
-    print(f"  {commands['powershell_unset']}")
-    print()
-    print("-" * 70)
-    print("BASH / ZSH (macOS, Linux, Git Bash)")
-    print("-" * 70)
-    print()
-    print("# Enable dev mode (run in terminal or add to ~/.bashrc / ~/.zshrc):")
-    print(f"  {commands['bash']}")
-    print()
-    print("# Verify:")
-    print(f"  echo ${DEV_ROOT_ENV_VAR}")
-    print()
-    print("# Disable:")
-    print(f"  {commands['bash_unset']}")
-    print()
-    print("-" * 70)
-    print("CMD (Windows Command Prompt)")
-    print("-" * 70)
-    print()
-    print("# Enable dev mode:")
-    print(f"  {commands['cmd']}")
-    print()
-    print("# Verify:")
-    print(f"  echo %{DEV_ROOT_ENV_VAR}%")
-    print()
-    print("# Disable:")
-    print(f"  {commands['cmd_unset']}")
-    print()
-    print("=" * 70)
-    print("USAGE")
-    print("=" * 70)
-    print()
-    print("After setting the environment variable, running any script will")
-    print("show a [DEV MODE] banner and write files to your dev repo instead")
-    print("of the installed plugin location.")
-    print()
-    print("Example workflow:")
-    print("  1. Set the environment variable (see above)")
-    print("  2. Run: python scripts/core/scrape_all_sources.py --parallel")
-    print("  3. Check changes: git diff canonical/")
-    print("  4. Commit and push when ready")
-    print()
-    print("=" * 70)
+    rule, sep = "=" * 70, "-" * 70
+    # Built as one string and written once (instead of a print() per line)
+    sys.stdout.write(f"""\
+{rule}
+Development Mode Setup for docs-management Plugin
+{rule}
 
+Skill directory: {skill_dir}
+
+{sep}
+POWERSHELL (Windows)
+{sep}
+
+# Enable dev mode (run in terminal or add to $PROFILE):
+  {commands['powershell']}
+
+# Verify:
+  echo $env:{DEV_ROOT_ENV_VAR}
+
+# Disable:
+  {commands['powershell_unset']}
+
+{sep}
+BASH / ZSH (macOS, Linux, Git Bash)
+{sep}
+
+# Enable dev mode (run in terminal or add to ~/.bashrc / ~/.zshrc):
+  {commands['bash']}
+
+# Verify:
+  echo ${DEV_ROOT_ENV_VAR}
+
+# Disable:
+  {commands['bash_unset']}
+
+{sep}
+CMD (Windows Command Prompt)
+{sep}
+
+# Enable dev mode:
+  {commands['cmd']}
+
+# Verify:
+  echo %{DEV_ROOT_ENV_VAR}%
+
+# Disable:
+  {commands['cmd_unset']}
+
+{rule}
+USAGE
+{rule}
+
+After setting the environment variable, running any script will
+show a [DEV MODE] banner and write files to your dev repo instead
+of the installed plugin location.
+
+Example workflow:
+  1. Set the environment variable (see above)
+  2. Run: python scripts/core/scrape_all_sources.py --parallel
+  3. Check changes: git diff canonical/
+  4. Commit and push when ready
+
+{rule}
+""")
 
 if __name__ == "__main__":
     main()
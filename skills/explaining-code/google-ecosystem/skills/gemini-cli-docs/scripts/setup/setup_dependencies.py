@@ -17,16 +17,26 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import argparse
+import functools
+import hashlib
+import importlib.util
 import os
+import re
+import platform
 import subprocess
 import shutil
 import site
+import sysconfig
+import time
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Any
 
 from utils.script_utils import configure_utf8_output, suppress_pydantic_v1_warning
 from utils.logging_utils import get_or_setup_logger
+from utils.path_config import get_cache_dir
 
 # Configure UTF-8 output for Windows console compatibility
 configure_utf8_output()
@@ -52,11 +62,70 @@ except ImportError:
     def get_subprocess_build_timeout(): return 600.0
     def get_subprocess_long_timeout(): return 600.0
 
+# Optional faster JSON decoder for probe output
+try:
+    import orjson
+
+    def _loads_json(text: str) -> Any:
+        return orjson.loads(text)
+except ImportError:
+    def _loads_json(text: str) -> Any:
+        return json.loads(text)
+
+SETUP_CACHE_DIR = get_cache_dir()  # Skill-level cache (also holds the search index)
+PLATFORM_CACHE_PATH = SETUP_CACHE_DIR / "platform.json"  # Build-tool detection reused across runs
+PLATFORM_CACHE_TTL_SECONDS = 24 * 60 * 60  # Re-detect at least daily
+
+def _platform_cache_key() -> str:
+    """Key for PLATFORM_CACHE_PATH: detection results are only valid for the same OS release and PATH."""
+    raw = f"{sys.platform}|{platform.release()}|{os.environ.get('PATH', '')}"
+    return hashlib.blake2b(raw.encode('utf-8', 'surrogateescape'), digest_size=8).hexdigest()
+
+@functools.lru_cache(maxsize=1)
+def _load_platform_cache() -> dict[str, Any]:
+    """
+    Load build-tool detection results saved by an earlier run
+    
+    Returns:
+        Cached values (e.g. vcvarsall_path, build_tools_installed), or an
+        empty dict if the cache is missing, expired or for another PATH
+    """
+    try:
+        data = json.loads(PLATFORM_CACHE_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if (not isinstance(data, dict) or data.get('key') != _platform_cache_key()
+            or time.time() - data.get('cached_at', 0) > PLATFORM_CACHE_TTL_SECONDS):
+        return {}
+    return data
+
+def _save_platform_cache(**values: Any) -> None:
+    """Add detection results to the on-disk platform cache (failures are ignored)."""
+    data = _load_platform_cache()
+    if not data:
+        data.update(key=_platform_cache_key(), cached_at=time.time())
+    data.update(values)
+    try:
+        PLATFORM_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        PLATFORM_CACHE_PATH.write_text(json.dumps(data), encoding='utf-8')
+    except OSError:
+        pass
+
+def _clear_platform_cache() -> None:
+    """Forget detection results saved by earlier runs."""
+    _load_platform_cache.cache_clear()
+    try:
+        PLATFORM_CACHE_PATH.unlink()
+    except OSError:
+        pass
+
 # Global installation log for reporting
-_installation_log: list[Dict] = []
+INSTALLATION_LOG_MAX_ENTRIES = 2048  # Oldest records are dropped beyond this (bounds memory in long sessions)
+_installation_log: deque[Dict] = deque(maxlen=INSTALLATION_LOG_MAX_ENTRIES)
 
+@functools.lru_cache(maxsize=1)
 def detect_package_manager():
-    """Detect available package manager for the current platform"""
+    """Detect available package manager for the current platform (probed once per process)"""
     if sys.platform == 'win32':
         # Check for winget
         if shutil.which('winget'):
@@ -80,6 +149,26 @@ def detect_package_manager():
             return 'pacman'
         return None
 
+@functools.lru_cache(maxsize=1)
+def _site_packages() -> tuple[str, ...]:
+    """Site-packages directories for this interpreter, user site last (fixed for the process)."""
+    try:
+        site_packages = list(site.getsitepackages())
+        # Also check user site-packages
+        user_site = site.getusersitepackages()
+        if user_site:
+            site_packages.append(user_site)
+    except Exception:
+        # Fallback (e.g. site.getsitepackages missing in old virtualenvs): ask sysconfig
+        paths = sysconfig.get_paths()
+        site_packages = [paths['purelib'], paths['platlib']]
+    return tuple(dict.fromkeys(site_packages))
+
+@functools.lru_cache(maxsize=1)
+def _pip_on_path() -> str | None:
+    """Locate the pip executable on PATH (looked up once per process)."""
+    return shutil.which('pip')
+
 def get_python_environment_info() -> dict[str, Any]:
     """
     Get comprehensive information about the current Python environment
@@ -118,87 +207,67 @@ def get_python_environment_info() -> dict[str, Any]:
             info['venv_path'] = sys.prefix
     
     # Get site-packages locations
-    try:
-        info['site_packages'] = site.getsitepackages()
-        # Also check user site-packages
-        user_site = site.getusersitepackages()
-        if user_site:
-            info['site_packages'].append(user_site)
-    except Exception:
-        # Fallback: try to find site-packages manually
-        lib_path = Path(sys.executable).parent / 'lib'
-        if lib_path.exists():
-            for py_dir in lib_path.glob('python*'):
-                site_pkg = py_dir / 'site-packages'
-                if site_pkg.exists():
-                    info['site_packages'].append(str(site_pkg))
+    info['site_packages'] = list(_site_packages())
     
     # Find pip location
-    pip_exe = shutil.which('pip')
+    pip_exe = _pip_on_path()
     if pip_exe:
         info['pip_location'] = pip_exe
-        # Check if pip's Python matches current interpreter
-        try:
-            result = subprocess.run(
-                [pip_exe, '--version'],
-                capture_output=True,
-                text=True,
-                timeout=get_subprocess_quick_timeout()
-            )
-            # Try to extract Python path from pip output or check pip's shebang
-            pip_python = None
-            if sys.platform != 'win32':
-                # On Unix, check shebang (validation only, result not used)
-                try:
-                    with open(pip_exe, 'r') as f:
-                        first_line = f.readline()
-                        # Verify shebang format is valid
-                        if first_line.startswith('#!'):
-                            _ = first_line[2:].strip().split()[0]
-                except Exception:
-                    pass
-            else:
-                # On Windows, pip is a .exe or launcher, check via pip show
-                try:
-                    result = subprocess.run(
-                        [pip_exe, 'show', 'pip'],
-                        capture_output=True,
-                        text=True,
-                        timeout=int(get_subprocess_quick_timeout())
-                    )
-                    # Pip show doesn't directly show Python, but we can infer
-                    # by checking if pip can import from same site-packages
-                except Exception:
-                    pass
-            
-            # Simple check: if pip is in same directory as Python or in Scripts/bin
-            pip_path = Path(pip_exe)
-            python_dir = Path(sys.executable).parent
-            if pip_path.parent == python_dir or pip_path.parent.name in ['Scripts', 'bin']:
-                # Likely matches, but verify by trying to get pip's Python
-                try:
-                    # Use pip to check its Python
-                    result = subprocess.run(
-                        [pip_exe, '--python-version'],
-                        capture_output=True,
-                        text=True,
-                        timeout=int(get_subprocess_quick_timeout())
-                    )
-                    if result.returncode == 0:
-                        pip_version = result.stdout.strip()
-                        current_version = f"{sys.version_info.major}.{sys.version_info.minor}"
-                        info['pip_python_match'] = pip_version.startswith(current_version)
-                    else:
-                        # Fallback: assume match if in same directory structure
-                        info['pip_python_match'] = True
-                except Exception:
-                    # If check fails, assume match based on location
-                    info['pip_python_match'] = True
-        except Exception:
-            pass
+        # pip matches the interpreter if it sits next to it or in a Scripts/bin dir
+        # (decided from paths alone; running pip costs a full Python startup)
+        pip_path = Path(pip_exe)
+        python_dir = Path(sys.executable).parent
+        info['pip_python_match'] = pip_path.parent == python_dir or pip_path.parent.name in ['Scripts', 'bin']
     
     return info
 
+PYTHON_EXE_NAMES = frozenset({'python', 'python3', 'python.exe', 'python3.exe'})  # Interpreter names looked for in directories
+
+def _python_names_in(directory: Path | str) -> set[str]:
+    """
+    List the Python interpreter names present in a directory (one scandir, no per-name stat)
+    
+    Args:
+        directory: Directory to look in
+    
+    Returns:
+        Subset of PYTHON_EXE_NAMES found there (empty if unreadable)
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.name in PYTHON_EXE_NAMES}
+    except OSError:
+        return set()
+
+def _registered_pythons() -> list[str]:
+    """
+    List interpreters registered under PythonCore in HKLM and HKCU (Windows only, PEP 514)
+    
+    Returns:
+        Paths to python.exe for each registered version that exists on disk
+    """
+    import winreg
+    
+    pythons = []
+    for hive in (winreg.HKEY_LOCAL_MACHINE, winreg.HKEY_CURRENT_USER):
+        try:
+            core = winreg.OpenKey(hive, r"Software\Python\PythonCore")
+        except OSError:
+            continue
+        with core:
+            for i in range(winreg.QueryInfoKey(core)[0]):
+                try:
+                    with winreg.OpenKey(core, rf"{winreg.EnumKey(core, i)}\InstallPath") as key:
+                        try:
+                            py_path = Path(winreg.QueryValueEx(key, 'ExecutablePath')[0])
+                        except OSError:
+                            py_path = Path(winreg.QueryValueEx(key, '')[0]) / 'python.exe'
+                except OSError:
+                    continue
+                if py_path.exists():
+                    pythons.append(str(py_path))
+    return pythons
+
 def diagnose_environment(verbose: bool = False) -> dict[str, Any]:
     """
     Perform comprehensive environment diagnosis
@@ -217,59 +286,38 @@ def diagnose_environment(verbose: bool = False) -> dict[str, Any]:
     }
     
     # Check PATH for Python-related entries
-    path_env = os.environ.get('PATH', '')
+    # (Windows system directories can't hold a user's interpreter and make up much of PATH)
+    system_root = os.path.normcase(os.environ.get('SystemRoot', '')) if sys.platform == 'win32' else ''
     python_related = []
-    for entry in path_env.split(os.pathsep):
+    for entry in dict.fromkeys(os.get_exec_path()):
+        if system_root and os.path.normcase(entry).startswith(system_root):
+            continue
+        # Check if it contains Python executables (one directory listing per entry)
         entry_path = Path(entry)
-        if entry_path.exists():
-            # Check if it contains Python executables
-            if (entry_path / 'python.exe').exists() or (entry_path / 'python').exists() or \
-               (entry_path / 'python3.exe').exists() or (entry_path / 'python3').exists():
-                python_related.append(str(entry_path))
+        if _python_names_in(entry_path):
+            python_related.append(str(entry_path))
     diagnosis['path_entries'] = python_related
     
     # Try to find other Python installations (if verbose)
     if verbose:
         other_pythons = []
-        common_paths = []
+        current_python = Path(sys.executable)
         
         if sys.platform == 'win32':
-            # Check common Windows Python locations
-            common_paths = [
-                Path('C:/Python*'),
-                Path('C:/Program Files/Python*'),
-                Path('C:/Program Files (x86)/Python*'),
-                Path(os.environ.get('LOCALAPPDATA', '')) / 'Programs' / 'Python',
-                Path(os.environ.get('APPDATA', '')) / 'Python',
-            ]
+            # Installed Pythons register themselves under PythonCore (what py.exe reads)
+            other_pythons = [py_path for py_path in _registered_pythons() if Path(py_path) != current_python]
         else:
-            # Unix-like systems
+            # Unix-like systems: one directory listing per location
             common_paths = [
                 Path('/usr/bin'),
                 Path('/usr/local/bin'),
                 Path.home() / '.local' / 'bin',
             ]
-        
-        for base_path in common_paths:
-            try:
-                if '*' in str(base_path):
-                    # Handle glob patterns
-                    parent = base_path.parent
-                    pattern = base_path.name
-                    if parent.exists():
-                        for py_dir in parent.glob(pattern):
-                            for py_exe in ['python', 'python3', 'python.exe', 'python3.exe']:
-                                py_path = py_dir / py_exe
-                                if py_path.exists() and py_path != Path(sys.executable):
-                                    other_pythons.append(str(py_path))
-                else:
-                    if base_path.exists():
-                        for py_exe in ['python', 'python3', 'python.exe', 'python3.exe']:
-                            py_path = base_path / py_exe
-                            if py_path.exists() and py_path != Path(sys.executable):
-                                other_pythons.append(str(py_path))
-            except Exception:
-                pass
+            for base_path in common_paths:
+                for py_exe in sorted(_python_names_in(base_path)):
+                    py_path = base_path / py_exe
+                    if py_path != current_python:
+                        other_pythons.append(str(py_path))
         
         diagnosis['other_pythons'] = sorted(set(other_pythons))[:10]  # Limit to 10, sorted for determinism
     
@@ -277,13 +325,15 @@ def diagnose_environment(verbose: bool = False) -> dict[str, Any]:
     if verbose:
         key_packages = ['spacy', 'yake', 'yaml', 'requests']
         for pkg in key_packages:
+            # Locate without importing (spaCy's package init alone takes seconds)
             try:
-                mod = __import__(pkg)
-                if hasattr(mod, '__file__'):
-                    pkg_path = Path(mod.__file__).parent
-                    diagnosis['package_locations'][pkg] = str(pkg_path)
-            except ImportError:
+                spec = importlib.util.find_spec(pkg)
+            except (ImportError, ValueError):
+                spec = None
+            if spec is None:
                 diagnosis['package_locations'][pkg] = None
+            elif spec.has_location and spec.origin:
+                diagnosis['package_locations'][pkg] = str(Path(spec.origin).parent)
     
     return diagnosis
 
@@ -320,6 +370,78 @@ def print_environment_info(info: dict[str, Any | None] = None, verbose: bool = F
             print(f"    ... and {len(info['site_packages']) - 3} more")
     print()
 
+def _first_existing(paths: list[Path]) -> Path | None:
+    """
+    Return the first candidate path that exists (plain os.stat per candidate)
+    
+    Args:
+        paths: Candidate paths in priority order
+    
+    Returns:
+        First existing path, None if none exist
+    """
+    for path in paths:
+        try:
+            os.stat(path)
+        except (OSError, ValueError):
+            continue
+        return path
+    return None
+
+PY_LAUNCHER_313_LINE = re.compile(r'^\s*-(?:V:)?3\.13(?:-\d+)?\s+(?:\*\s+)?(?P<path>\S.*?)\s*$')  # `py -0p` entry for 3.13
+
+def _python313_from_registry() -> str | None:
+    """
+    Find Python 3.13 from its PEP 514 registry entry (Windows only, no subprocess)
+
+    Returns:
+        Path to python.exe if registered and present, None otherwise
+    """
+    import winreg
+
+    key_path = r"Software\Python\PythonCore\3.13\InstallPath"
+    for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+        try:
+            with winreg.OpenKey(hive, key_path) as key:
+                try:
+                    python_path = Path(winreg.QueryValueEx(key, 'ExecutablePath')[0])
+                except OSError:
+                    python_path = Path(winreg.QueryValueEx(key, '')[0]) / 'python.exe'
+        except OSError:
+            continue
+        if python_path.exists():
+            return str(python_path)
+    return None
+
+def _python313_from_py_launcher() -> str | None:
+    """
+    Find Python 3.13 from a single `py -0p` listing (Windows only)
+
+    Returns:
+        Path to python.exe, 'py -3.13' if listed without a usable path, None otherwise
+    """
+    try:
+        result = subprocess.run(
+            ['py', '-0p'],
+            capture_output=True,
+            text=True,
+            timeout=int(get_subprocess_quick_timeout())
+        )
+    except Exception:
+        return None
+    if result.returncode != 0:
+        return None
+    for line in result.stdout.splitlines():
+        match = PY_LAUNCHER_313_LINE.match(line)
+        if match:
+            python_path = match.group('path')
+            if Path(python_path).exists():
+                return python_path
+            # Fallback: use py -3.13 as command
+            return 'py -3.13'
+    return None
+
+@functools.lru_cache(maxsize=1)
 def detect_python_for_spacy() -> str | None:
     """
     Detect Python 3.13 installation for spaCy (spaCy supports 3.7-3.13, not 3.14+)
@@ -328,33 +450,10 @@ def detect_python_for_spacy() -> str | None:
         Path to Python 3.13 executable if available, None otherwise
     """
     if sys.platform == 'win32':
-        # On Windows, use py launcher to find Python 3.13
-        try:
-            result = subprocess.run(
-                ['py', '-3.13', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=int(get_subprocess_quick_timeout())
-            )
-            if result.returncode == 0:
-                # Get the actual Python 3.13 executable path
-                try:
-                    result2 = subprocess.run(
-                        ['py', '-3.13', '-c', 'import sys; print(sys.executable)'],
-                        capture_output=True,
-                        text=True,
-                        timeout=int(get_subprocess_quick_timeout())
-                    )
-                    if result2.returncode == 0:
-                        python_path = result2.stdout.strip()
-                        if python_path and Path(python_path).exists():
-                            return python_path
-                except Exception:
-                    pass
-                # Fallback: use py -3.13 as command
-                return 'py -3.13'
-        except Exception:
-            pass
+        # On Windows, read the PEP 514 registration, then ask the py launcher once
+        python_path = _python313_from_registry() or _python313_from_py_launcher()
+        if python_path:
+            return python_path
 
         # Fallback: check common installation paths
         common_paths = [
@@ -364,9 +463,9 @@ def detect_python_for_spacy() -> str | None:
             Path('C:/Program Files/Python313/python.exe'),
             Path('C:/Program Files (x86)/Python313/python.exe'),
         ]
-        for python_path in common_paths:
-            if python_path.exists():
-                return str(python_path)
+        python_path = _first_existing(common_paths)
+        if python_path:
+            return str(python_path)
     else:
         # On Unix-like systems, check for python3.13
         python313_path = shutil.which('python3.13')
@@ -375,6 +474,41 @@ def detect_python_for_spacy() -> str | None:
 
     return None
 
+WINDOWS_COMPILERS = frozenset({'cl', 'gcc', 'g++'})  # MSVC or MinGW
+
+@functools.lru_cache(maxsize=4)
+def _path_executables(path_value: str) -> frozenset[str]:
+    """
+    Names of the files in the directories of a PATH value (one listing per directory)
+    
+    Replaces a shutil.which() per tool, which stats every PATHEXT suffix in
+    every directory on Windows. Keyed by the PATH value, so a changed PATH is
+    scanned again.
+    
+    Args:
+        path_value: os.pathsep-separated directory list
+    
+    Returns:
+        File names; on Windows lowercased and also without their PATHEXT
+        suffix ('cl.exe' is listed as 'cl')
+    """
+    names = set()
+    for entry in dict.fromkeys(path_value.split(os.pathsep)):
+        if not entry:
+            continue
+        try:
+            with os.scandir(entry) as entries:
+                names.update(dir_entry.name for dir_entry in entries)
+        except OSError:
+            continue
+    if sys.platform != 'win32':
+        return frozenset(names)
+    
+    pathext = tuple(ext.lower() for ext in os.environ.get('PATHEXT', '.COM;.EXE;.BAT;.CMD').split(os.pathsep) if ext)
+    lowered = {name.lower() for name in names}
+    return frozenset(lowered | {name[:-len(ext)] for name in lowered for ext in pathext if name.endswith(ext)})
+
+@functools.lru_cache(maxsize=1)
 def check_compiler_accessible() -> bool:
     """
     Check if C++ compiler is accessible in PATH
@@ -382,19 +516,20 @@ def check_compiler_accessible() -> bool:
     Returns:
         True if compiler (cl.exe, gcc, or g++) is accessible, False otherwise
     """
+    tools = _path_executables(os.environ.get('PATH', ''))
     if sys.platform == 'win32':
         # Check for MSVC compiler or MinGW
-        return bool(shutil.which('cl') or shutil.which('gcc') or shutil.which('g++'))
+        return bool(WINDOWS_COMPILERS & tools)
     elif sys.platform == 'darwin':
         # macOS: Check for clang/gcc
-        return bool(shutil.which('clang') or shutil.which('gcc'))
+        return 'clang' in tools or 'gcc' in tools
     else:
         # Linux: Check for gcc/g++
-        return bool(shutil.which('gcc') and shutil.which('g++'))
+        return 'gcc' in tools and 'g++' in tools
 
-def locate_vcvarsall_bat() -> Path | None:
+def _find_vcvarsall_bat() -> Path | None:
     """
-    Locate vcvarsall.bat using vswhere.exe or standard paths
+    Search for vcvarsall.bat in the standard paths, else via vswhere.exe
     
     Returns:
         Path to vcvarsall.bat if found, None otherwise
@@ -402,7 +537,28 @@ def locate_vcvarsall_bat() -> Path | None:
     if sys.platform != 'win32':
         return None
     
-    # Method 1: Use vswhere.exe (most reliable - official Microsoft tool)
+    # Method 1: Check standard installation paths (a few stats, no subprocess)
+    standard_paths = [
+        Path('C:/Program Files (x86)/Microsoft Visual Studio/2022/BuildTools/VC/Auxiliary/Build/vcvarsall.bat'),
+        Path('C:/Program Files/Microsoft Visual Studio/2022/BuildTools/VC/Auxiliary/Build/vcvarsall.bat'),
+        Path('C:/Program Files (x86)/Microsoft Visual Studio/2019/BuildTools/VC/Auxiliary/Build/vcvarsall.bat'),
+        Path('C:/Program Files/Microsoft Visual Studio/2019/BuildTools/VC/Auxiliary/Build/vcvarsall.bat'),
+        Path('C:/Program Files (x86)/Microsoft Visual Studio/2017/BuildTools/VC/Auxiliary/Build/vcvarsall.bat'),
+        Path('C:/Program Files/Microsoft Visual Studio/2017/BuildTools/VC/Auxiliary/Build/vcvarsall.bat'),
+        # Also check for full Visual Studio (not just Build Tools)
+        Path('C:/Program Files (x86)/Microsoft Visual Studio/2022/Community/VC/Auxiliary/Build/vcvarsall.bat'),
+        Path('C:/Program Files/Microsoft Visual Studio/2022/Community/VC/Auxiliary/Build/vcvarsall.bat'),
+        Path('C:/Program Files (x86)/Microsoft Visual Studio/2022/Professional/VC/Auxiliary/Build/vcvarsall.bat'),
+        Path('C:/Program Files/Microsoft Visual Studio/2022/Professional/VC/Auxiliary/Build/vcvarsall.bat'),
+        Path('C:/Program Files (x86)/Microsoft Visual Studio/2022/Enterprise/VC/Auxiliary/Build/vcvarsall.bat'),
+        Path('C:/Program Files/Microsoft Visual Studio/2022/Enterprise/VC/Auxiliary/Build/vcvarsall.bat'),
+    ]
+    
+    vcvarsall_path = _first_existing(standard_paths)
+    if vcvarsall_path:
+        return vcvarsall_path
+    
+    # Method 2: Use vswhere.exe (official Microsoft tool; finds non-default install locations)
     vswhere_paths = [
         Path('C:/Program Files (x86)/Microsoft Visual Studio/Installer/vswhere.exe'),
         Path('C:/Program Files/Microsoft Visual Studio/Installer/vswhere.exe'),
@@ -423,50 +579,102 @@ def locate_vcvarsall_bat() -> Path | None:
                 if result.returncode == 0 and result.stdout.strip():
                     vs_path = Path(result.stdout.strip())
                     # Check for vcvarsall.bat in this installation
-                    vcvarsall_paths = [
+                    vcvarsall_path = _first_existing([
                         vs_path / 'VC/Auxiliary/Build/vcvarsall.bat',
                         vs_path / 'VC/vcvarsall.bat',  # Older versions
-                    ]
-                    for vcvarsall_path in vcvarsall_paths:
-                        if vcvarsall_path.exists():
-                            return vcvarsall_path
+                    ])
+                    if vcvarsall_path:
+                        return vcvarsall_path
             except Exception:
                 pass
     
-    # Method 2: Check standard installation paths (fallback)
-    standard_paths = [
-        Path('C:/Program Files (x86)/Microsoft Visual Studio/2022/BuildTools/VC/Auxiliary/Build/vcvarsall.bat'),
-        Path('C:/Program Files/Microsoft Visual Studio/2022/BuildTools/VC/Auxiliary/Build/vcvarsall.bat'),
-        Path('C:/Program Files (x86)/Microsoft Visual Studio/2019/BuildTools/VC/Auxiliary/Build/vcvarsall.bat'),
-        Path('C:/Program Files/Microsoft Visual Studio/2019/BuildTools/VC/Auxiliary/Build/vcvarsall.bat'),
-        Path('C:/Program Files (x86)/Microsoft Visual Studio/2017/BuildTools/VC/Auxiliary/Build/vcvarsall.bat'),
-        Path('C:/Program Files/Microsoft Visual Studio/2017/BuildTools/VC/Auxiliary/Build/vcvarsall.bat'),
-        # Also check for full Visual Studio (not just Build Tools)
-        Path('C:/Program Files (x86)/Microsoft Visual Studio/2022/Community/VC/Auxiliary/Build/vcvarsall.bat'),
-        Path('C:/Program Files/Microsoft Visual Studio/2022/Community/VC/Auxiliary/Build/vcvarsall.bat'),
-        Path('C:/Program Files (x86)/Microsoft Visual Studio/2022/Professional/VC/Auxiliary/Build/vcvarsall.bat'),
-        Path('C:/Program Files/Microsoft Visual Studio/2022/Professional/VC/Auxiliary/Build/vcvarsall.bat'),
-        Path('C:/Program Files (x86)/Microsoft Visual Studio/2022/Enterprise/VC/Auxiliary/Build/vcvarsall.bat'),
-        Path('C:/Program Files/Microsoft Visual Studio/2022/Enterprise/VC/Auxiliary/Build/vcvarsall.bat'),
-    ]
+    return None
+
+@functools.lru_cache(maxsize=1)
+def locate_vcvarsall_bat() -> Path | None:
+    """
+    Locate vcvarsall.bat, reusing a location found by an earlier run while it still exists
     
-    for path in standard_paths:
-        if path.exists():
-            return path
+    Returns:
+        Path to vcvarsall.bat if found, None otherwise
+    """
+    if sys.platform != 'win32':
+        return None
     
+    cached_path = _load_platform_cache().get('vcvarsall_path')
+    if cached_path and os.path.isfile(cached_path):
+        return Path(cached_path)
+    
+    vcvarsall_path = _find_vcvarsall_bat()
+    if vcvarsall_path:
+        _save_platform_cache(vcvarsall_path=str(vcvarsall_path))
+    return vcvarsall_path
+
+def clear_probe_caches() -> None:
+    """Forget cached environment probes (after installing packages or changing PATH)."""
+    _path_executables.cache_clear()
+    detect_package_manager.cache_clear()
+    check_build_tools_installed.cache_clear()
+    _clear_platform_cache()
+    _pip_on_path.cache_clear()
+    detect_python_for_spacy.cache_clear()
+    check_compiler_accessible.cache_clear()
+    locate_vcvarsall_bat.cache_clear()
+    get_effective_spacy_status.cache_clear()
+
+SPACY_PROBE_SCRIPT = Path(__file__).resolve().parent / "spacy_probe.py"  # Run under the alternate Python
+
+def _probe_spacy(python_exe: str | None = None) -> dict[str, Any] | None:
+    """
+    Run spacy_probe in this interpreter or under another one
+
+    Args:
+        python_exe: None for the current interpreter, else an executable path
+            or launcher command such as 'py -3.13'. Either way spaCy is imported
+            and the model loaded, so a broken install is not reported as usable
+
+    Returns:
+        Probe dictionary (spacy_importable/spacy_version/model_loadable/model_location),
+        or None if the other interpreter could not be run
+    """
+    if python_exe is None:
+        from setup.spacy_probe import probe
+        return probe(deep=True)
+
+    # python_exe can be an executable path or 'py -3.13'
+    if " " in str(python_exe):
+        # Treat as launcher command (e.g., 'py -3.13')
+        cmd = str(python_exe).split() + [str(SPACY_PROBE_SCRIPT), '--deep']
+    else:
+        cmd = [str(python_exe), str(SPACY_PROBE_SCRIPT), '--deep']
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=int(get_subprocess_default_timeout()),
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return _loads_json(result.stdout.strip())
+    except Exception:
+        pass
     return None
 
+@functools.lru_cache(maxsize=1)
 def get_effective_spacy_status() -> dict[str, Any]:
     """
     Determine effective spaCy availability across current and compatible Pythons.
 
+    Probed once per process (see clear_probe_caches); treat the result as read-only.
+
     Returns:
         Dictionary with keys:
         - current: diagnostics for current interpreter (spacy_importable/model_loadable/etc.)
         - alt: diagnostics for an alternate compatible interpreter (e.g. Python 3.13), or None
         - effective_available: True if spaCy import is available in any supported interpreter
-        - effective_model_available: True if en_core_web_sm is loadable in any supported interpreter
+        - effective_model_available: True if en_core_web_sm is available in the interpreter providing spaCy
         - effective_python: Python executable used for spaCy if different from current, else None
+        - spacy_version / model_location: from the providing interpreter, when available
     """
     status: dict[str, Any] = {
         "current": {},
@@ -476,39 +684,10 @@ def get_effective_spacy_status() -> dict[str, Any]:
         "effective_python": None,
     }
 
-    # First, check current interpreter directly (without relying on check_spacy_model signature).
-    current_diag: dict[str, Any] = {
-        "spacy_importable": False,
-        "spacy_version": None,
-        "model_loadable": False,
-        "model_location": None,
-    }
-    try:
-        import spacy  # type: ignore
-
-        current_diag["spacy_importable"] = True
-        try:
-            current_diag["spacy_version"] = spacy.__version__
-        except Exception:
-            pass
-        try:
-            nlp = spacy.load("en_core_web_sm")  # type: ignore
-            current_diag["model_loadable"] = True
-            if hasattr(nlp, "path") and getattr(nlp, "path", None):
-                current_diag["model_location"] = str(nlp.path)
-            elif hasattr(nlp, "_path") and getattr(nlp, "_path", None):
-                current_diag["model_location"] = str(nlp._path)
-        except Exception:
-            pass
-    except Exception:
-        # spaCy not importable in current interpreter
-        pass
-
+    # First, check current interpreter directly (imports spaCy and loads the model).
+    current_diag = _probe_spacy()
     status["current"] = current_diag
 
-    current_has_spacy = bool(current_diag.get("spacy_importable"))
-    current_has_model = bool(current_diag.get("model_loadable"))
-
     python_version = f"{sys.version_info.major}.{sys.version_info.minor}"
     python313_path = None
     try:
@@ -516,87 +695,149 @@ def get_effective_spacy_status() -> dict[str, Any]:
     except Exception:
         python313_path = None
 
-    alt_diag: dict[str, Any | None] = None
+    # Only ask an alternate compatible Python (e.g., 3.13) when this one cannot import spaCy.
+    alt_diag = None
+    if python313_path and not current_diag["spacy_importable"]:
+        alt_diag = _probe_spacy(python313_path)
+        status["alt"] = alt_diag
 
-    # If an alternate compatible Python exists (e.g., 3.13), try diagnostics there as well.
-    if python313_path:
-        try:
-            # Build a small helper script that reports spaCy diagnostics as JSON.
-            helper_code = (
-                "import json\n"
-                "info = {\n"
-                "  'spacy_importable': False,\n"
-                "  'spacy_version': None,\n"
-                "  'model_loadable': False,\n"
-                "  'model_location': None,\n"
-                "}\n"
-                "try:\n"
-                "  import spacy\n"
-                "  info['spacy_importable'] = True\n"
-                "  try:\n"
-                "    info['spacy_version'] = spacy.__version__\n"
-                "  except Exception:\n"
-                "    pass\n"
-                "  try:\n"
-                "    nlp = spacy.load('en_core_web_sm')\n"
-                "    info['model_loadable'] = True\n"
-                "    if hasattr(nlp, 'path') and nlp.path:\n"
-                "      info['model_location'] = str(nlp.path)\n"
-                "    elif hasattr(nlp, '_path') and nlp._path:\n"
-                "      info['model_location'] = str(nlp._path)\n"
-                "  except Exception:\n"
-                "    pass\n"
-                "except Exception:\n"
-                "  pass\n"
-                "print(json.dumps(info))\n"
-            )
+    # The interpreter that provides spaCy also provides the model, version and location.
+    if current_diag["spacy_importable"]:
+        provider = current_diag
+    elif alt_diag and alt_diag.get("spacy_importable"):
+        provider = alt_diag
+        status["effective_python"] = python313_path
+    else:
+        provider = None
 
-            # python313_path can be an executable path or 'py -3.13'
-            if " " in str(python313_path):
-                # Treat as launcher command (e.g., 'py -3.13')
-                cmd = str(python313_path).split() + ["-c", helper_code]
-            else:
-                cmd = [str(python313_path), "-c", helper_code]
+    if provider:
+        status["effective_available"] = True
+        status["effective_model_available"] = bool(provider.get("model_loadable"))
+        status["spacy_version"] = provider.get("spacy_version")
+        if status["effective_model_available"]:
+            status["model_location"] = provider.get("model_location")
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=int(get_subprocess_default_timeout()),
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                alt_diag = json.loads(result.stdout.strip())
-        except Exception:
-            alt_diag = None
+    status["python_version"] = python_version
+    status["python313_available"] = python313_path is not None
+    return status
 
-    if alt_diag is not None:
-        status["alt"] = alt_diag
+VCVARS_SET_LINE = re.compile(rb'(?m)^([^=\r\n]+)=([^\r\n]*)')  # KEY=value lines printed by `set`
 
-    effective_available = current_has_spacy or bool(alt_diag and alt_diag.get("spacy_importable"))
-    effective_model_available = current_has_model or bool(alt_diag and alt_diag.get("model_loadable"))
+def _vcvars_cache_path(vcvarsall_path: Path, arch: str) -> Path:
+    """
+    Cache file for the environment delta produced by vcvarsall.bat
+    
+    Keyed by the batch file's path, modification time and architecture, so
+    updating or reinstalling Build Tools invalidates it.
+    
+    Args:
+        vcvarsall_path: Path to vcvarsall.bat
+        arch: Architecture passed to vcvarsall.bat
+    
+    Returns:
+        Path of the JSON cache file
+    """
+    raw = f"{vcvarsall_path}|{vcvarsall_path.stat().st_mtime_ns}|{arch}"
+    key = hashlib.blake2b(raw.encode('utf-8', 'surrogateescape'), digest_size=8).hexdigest()
+    return SETUP_CACHE_DIR / f"vcvars-{arch}-{key}.json"
 
-    status["effective_available"] = effective_available
-    status["effective_model_available"] = effective_model_available
+VS_ARCHES = ('x64', 'x86_amd64', 'x86')  # vcvarsall.bat architectures, in order of preference
 
-    # Decide which Python should be considered the effective spaCy provider.
-    if effective_available and not current_has_spacy and alt_diag and alt_diag.get("spacy_importable"):
-        status["effective_python"] = python313_path
+def _compiler_on_path(env_delta: dict[str, str]) -> bool:
+    """Check for cl/gcc/g++ on the PATH an environment delta would produce, without applying it."""
+    path_value = next((value for key, value in env_delta.items() if key.upper() == 'PATH'), os.environ.get('PATH', ''))
+    return bool(WINDOWS_COMPILERS & _path_executables(path_value))
 
-    # Attach version/model_location for convenience at top level when available.
-    if effective_available:
-        if current_has_spacy:
-            status["spacy_version"] = current_diag.get("spacy_version")
-        elif alt_diag:
-            status["spacy_version"] = alt_diag.get("spacy_version")
-    if effective_model_available:
-        if current_has_model:
-            status["model_location"] = current_diag.get("model_location")
-        elif alt_diag:
-            status["model_location"] = alt_diag.get("model_location")
+def _capture_vs_environment(vcvarsall_path: Path, arch: str) -> tuple[dict[str, str] | None, str]:
+    """
+    Get the environment changes vcvarsall.bat makes for an architecture, without applying them
+    
+    Reads os.environ only, so several architectures can be captured concurrently.
+    
+    Args:
+        vcvarsall_path: Path to vcvarsall.bat
+        arch: Architecture to set up ('x64', 'x86', 'x86_amd64', etc.)
+    
+    Returns:
+        Tuple of (changed variables or None on failure, outcome message)
+    """
+    # Reuse the environment captured by a previous run (vcvarsall.bat takes seconds)
+    cache_path = cached_env = None
+    try:
+        cache_path = _vcvars_cache_path(vcvarsall_path, arch)
+        cached_env = json.loads(cache_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        pass
+    if cached_env and _compiler_on_path(cached_env):
+        return cached_env, "VS Build Tools environment restored from cache"
+    
+    try:
+        # Run vcvarsall.bat and capture environment variables
+        # We use cmd.exe to run the batch file and capture the environment
+        # The trick is to run a command that outputs all environment variables after vcvarsall.bat runs
+        cmd = f'@echo off && call "{vcvarsall_path}" {arch} && set'
+        if cache_path:
+            # Same commands as a fixed helper script next to the cache, so cmd.exe
+            # runs a file instead of parsing the inline command line
+            helper_bat = cache_path.with_suffix('.bat')
+            try:
+                if not helper_bat.exists():
+                    helper_bat.parent.mkdir(parents=True, exist_ok=True)
+                    helper_bat.write_text(
+                        f'@echo off\ncall "{vcvarsall_path}" {arch} || exit /b 1\nset\n',
+                        encoding='mbcs'
+                    )
+                cmd = f'"{helper_bat}"'
+            except OSError:
+                pass  # Fall back to the inline command
+        
+        result = subprocess.run(
+            ['cmd.exe', '/c', cmd],
+            capture_output=True,
+            timeout=int(get_subprocess_long_timeout()),
+            shell=False
+        )
+    except subprocess.TimeoutExpired:
+        return None, "VS environment setup timed out"
+    except Exception as e:
+        return None, f"Error setting up VS environment: {e}"
+    
+    if result.returncode != 0:
+        return None, f"Failed to run vcvarsall.bat (exit code: {result.returncode})"
+    
+    # Parse KEY=value lines from the raw output, keeping only changed variables
+    # (the delta is applied by the caller and cached for next time)
+    delta = {
+        key: value
+        for key, value in (
+            (key.decode('mbcs'), value.decode('mbcs'))
+            for key, value in VCVARS_SET_LINE.findall(result.stdout)
+            if key != b'_'
+        )
+        if os.environ.get(key) != value
+    }
+    if cache_path:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps(delta), encoding='utf-8')
+        except OSError:
+            pass  # Non-fatal; the batch file runs again next time
+    return delta, "VS Build Tools environment set up successfully"
 
-    status["python_version"] = python_version
-    status["python313_available"] = python313_path is not None
-    return status
+def _apply_vs_environment(env_delta: dict[str, str]) -> bool:
+    """
+    Apply a captured VS environment to this process and verify the compiler
+    
+    Args:
+        env_delta: Variables returned by _capture_vs_environment()
+    
+    Returns:
+        True if a compiler is accessible afterwards
+    """
+    # Only write variables that differ (each assignment is a putenv call)
+    os.environ.update({key: value for key, value in env_delta.items() if os.environ.get(key) != value})
+    check_compiler_accessible.cache_clear()  # PATH changed
+    return check_compiler_accessible()
 
 def setup_vs_environment(arch: str = "x64", verbose: bool = False) -> bool:
     """
@@ -623,55 +864,20 @@ def setup_vs_environment(arch: str = "x64", verbose: bool = False) -> bool:
         print(f"     Using: {vcvarsall_path}")
         print(f"     Architecture: {arch}")
     
-    try:
-        # Run vcvarsall.bat and capture environment variables
-        # We use cmd.exe to run the batch file and capture the environment
-        # The trick is to run a command that outputs all environment variables after vcvarsall.bat runs
-        cmd = f'@echo off && call "{vcvarsall_path}" {arch} && set'
-        
-        result = subprocess.run(
-            ['cmd.exe', '/c', cmd],
-            capture_output=True,
-            text=True,
-            timeout=int(get_subprocess_long_timeout()),
-            shell=False
-        )
-        
-        if result.returncode != 0:
-            if verbose:
-                print(f"  ⚠️  Failed to run vcvarsall.bat (exit code: {result.returncode})")
-            return False
-        
-        # Parse environment variables from output
-        env_vars = {}
-        for line in result.stdout.split('\n'):
-            line = line.strip()
-            if '=' in line and not line.startswith('_='):
-                key, value = line.split('=', 1)
-                env_vars[key] = value
-        
-        # Apply environment variables to current process
-        for key, value in env_vars.items():
-            os.environ[key] = value
-        
-        # Verify compiler is now accessible
-        if check_compiler_accessible():
-            if verbose:
-                print("  ✅ VS Build Tools environment set up successfully")
-            return True
-        else:
-            if verbose:
-                print("  ⚠️  Environment set up but compiler still not accessible")
-            return False
-            
-    except subprocess.TimeoutExpired:
+    env_delta, message = _capture_vs_environment(vcvarsall_path, arch)
+    if env_delta is None:
         if verbose:
-            print("  ⚠️  VS environment setup timed out")
+            print(f"  ⚠️  {message}")
         return False
-    except Exception as e:
+    
+    # Verify compiler is now accessible
+    if _apply_vs_environment(env_delta):
         if verbose:
-            print(f"  ⚠️  Error setting up VS environment: {e}")
-        return False
+            print(f"  ✅ {message}")
+        return True
+    if verbose:
+        print("  ⚠️  Environment set up but compiler still not accessible")
+    return False
 
 def ensure_compiler_accessible(verbose: bool = False) -> tuple[bool, str]:
     """
@@ -692,17 +898,36 @@ def ensure_compiler_accessible(verbose: bool = False) -> tuple[bool, str]:
         if verbose:
             print("  🔍 Compiler not in PATH. Attempting to locate and configure VS Build Tools...")
         
-        # Try x64 first (most common)
-        if setup_vs_environment(arch='x64', verbose=verbose):
-            return True, "VS Build Tools environment configured successfully (x64)"
+        vcvarsall_path = locate_vcvarsall_bat()
+        if not vcvarsall_path:
+            if verbose:
+                print("  ⚠️  vcvarsall.bat not found - cannot set up VS environment")
+            return False, "Compiler not accessible and could not set up VS Build Tools environment"
         
-        # Try x86_amd64 (cross-compile)
-        if setup_vs_environment(arch='x86_amd64', verbose=verbose):
-            return True, "VS Build Tools environment configured successfully (x86_amd64)"
+        def _use_capture(arch: str, env_delta: dict[str, str] | None, message: str) -> bool:
+            """Apply a captured environment if it provides a compiler."""
+            if env_delta is not None and _compiler_on_path(env_delta) and _apply_vs_environment(env_delta):
+                if verbose:
+                    print(f"  ✅ {message} ({arch})")
+                return True
+            if verbose:
+                if env_delta is None:
+                    print(f"  ⚠️  {arch}: {message}")
+                else:
+                    print(f"  ⚠️  {arch}: Environment set up but compiler still not accessible")
+            return False
         
-        # Try x86
-        if setup_vs_environment(arch='x86', verbose=verbose):
-            return True, "VS Build Tools environment configured successfully (x86)"
+        # x64 (most common) works on almost every machine, so it is tried alone
+        # (one vcvarsall.bat run). Only when it fails are the fallbacks captured
+        # concurrently, x86_amd64 (cross-compile) preferred over x86
+        primary, *fallbacks = VS_ARCHES
+        if _use_capture(primary, *_capture_vs_environment(vcvarsall_path, primary)):
+            return True, f"VS Build Tools environment configured successfully ({primary})"
+        with ThreadPoolExecutor(max_workers=len(fallbacks)) as executor:
+            captures = {arch: executor.submit(_capture_vs_environment, vcvarsall_path, arch) for arch in fallbacks}
+            for arch in fallbacks:
+                if _use_capture(arch, *captures[arch].result()):
+                    return True, f"VS Build Tools environment configured successfully ({arch})"
         
         return False, "Compiler not accessible and could not set up VS Build Tools environment"
     else:
@@ -782,13 +1007,36 @@ def get_troubleshooting_guide(issue: str) -> list[str]:
     
     return steps
 
+@functools.lru_cache(maxsize=1)
 def check_build_tools_installed():
+    """Check if C++ build tools are already installed (probed once per process; a positive result is reused across runs)"""
+    if _load_platform_cache().get('build_tools_installed'):
+        return True
+    installed = _detect_build_tools_installed()
+    if installed:
+        _save_platform_cache(build_tools_installed=True)
+    return installed
+
+WINGET_VERSION = re.compile(r'\b\d+\.\d+')  # Version column of a `winget list` row
+
+def _detect_build_tools_installed():
     """Check if C++ build tools are already installed (package installation check, separate from compiler accessibility)"""
     if sys.platform == 'win32':
         # Note: This checks if package is installed, not if compiler is accessible
         # Use check_compiler_accessible() to verify compiler accessibility
         
-        # Also check if Visual Studio Build Tools package is installed (even if not in PATH yet)
+        # Check the filesystem first (a few stats); winget takes seconds to start
+        # VS Build Tools directory with an MSVC toolset (more reliable after install)
+        for vs_path in ('C:/Program Files (x86)/Microsoft Visual Studio/2022/BuildTools',
+                        'C:/Program Files/Microsoft Visual Studio/2022/BuildTools'):
+            if os.path.isdir(os.path.join(vs_path, 'VC', 'Tools', 'MSVC')):
+                return True
+        
+        # Check if vcvarsall.bat exists (indicates VS Build Tools are installed)
+        if locate_vcvarsall_bat():
+            return True
+        
+        # Last resort: check if Visual Studio Build Tools package is installed (even if not in PATH yet)
         # This handles cases where build tools were just installed but PATH hasn't been refreshed
         for package_id in ['Microsoft.VisualStudio.BuildTools', 'Microsoft.VisualStudio.2022.BuildTools']:
             try:
@@ -800,30 +1048,14 @@ def check_build_tools_installed():
                 )
                 # Check if package appears in the list (winget list shows installed packages)
                 if result.returncode == 0:
-                    # Package is listed - check if it's actually installed (not just available)
-                    lines = result.stdout.split('\n')
-                    for line in lines:
-                        if package_id.lower() in line.lower() and any(word in line.lower() for word in ['installed', 'installedversion']):
-                            return True
-                        # Simple check: if package_id appears and line has version-like pattern
-                        if package_id in line and any(char.isdigit() for char in line):
+                    # Package is listed - installed if its row carries a version
+                    package_pattern = re.compile(re.escape(package_id), re.IGNORECASE)
+                    for line in result.stdout.splitlines():
+                        if package_pattern.search(line) and WINGET_VERSION.search(line):
                             return True
             except Exception:
                 pass
         
-        # Also check if VS Build Tools directory exists (more reliable after install)
-        vs_paths = [
-            Path('C:/Program Files (x86)/Microsoft Visual Studio/2022/BuildTools'),
-            Path('C:/Program Files/Microsoft Visual Studio/2022/BuildTools'),
-        ]
-        for vs_path in vs_paths:
-            if vs_path.exists() and (vs_path / 'VC/Tools/MSVC').exists():
-                return True
-        
-        # Check if vcvarsall.bat exists (indicates VS Build Tools are installed)
-        if locate_vcvarsall_bat():
-            return True
-        
         return False
     elif sys.platform == 'darwin':  # macOS
         # Check if xcode-select tools are installed
@@ -839,7 +1071,7 @@ def check_build_tools_installed():
             return False
     else:  # Linux
         # Check if gcc is available
-        return shutil.which('gcc') is not None and shutil.which('g++') is not None
+        return {'gcc', 'g++'} <= _path_executables(os.environ.get('PATH', ''))
 
 def get_build_tools_install_instructions():
     """Get platform-specific instructions for installing C++ build tools"""
@@ -1028,6 +1260,7 @@ def try_install_build_tools(auto_install: bool = False, verbose: bool = False):
                 text=True,
                     timeout=get_subprocess_build_timeout()  # Configurable timeout for build tools
             )
+            clear_probe_caches()  # Even a failed run may have installed something
             
             # Check if command succeeded or if it's a "already installed" scenario
             if result.returncode != 0:
@@ -1046,13 +1279,14 @@ def try_install_build_tools(auto_install: bool = False, verbose: bool = False):
                     print(f"     Error output: {result.stderr[:200] if result.stderr else result.stdout[:200]}")
                 raise subprocess.CalledProcessError(result.returncode, cmd_parts, result.stdout, result.stderr)
         
-        # Verify installation
+        # Verify installation (probes cached before the install are stale)
+        clear_probe_caches()
         install_end_time = datetime.now()
         install_duration = (install_end_time - install_start_time).total_seconds()
         
         if check_build_tools_installed():
             # Check if compiler is actually accessible in PATH (vs just package installed)
-            compiler_accessible = shutil.which('cl') or shutil.which('gcc') or shutil.which('g++')
+            compiler_accessible = bool({'cl', 'gcc', 'g++'} & _path_executables(os.environ.get('PATH', '')))
             
             if compiler_accessible:
                 print("  ✅ Build tools installed successfully (compiler accessible)")
@@ -1804,6 +2038,7 @@ def install_spacy_with_model(
         'platform': sys.platform
     })
     
+    get_effective_spacy_status.cache_clear()  # spaCy status changed
     python_info = f"Python 3.13" if using_python313 else f"Python {python_version}"
     return True, f"spaCy and {model_name} installed successfully via {install_method or 'pre-built wheel'} using {python_info}"
 
@@ -1876,6 +2111,7 @@ def install_spacy_model(dry_run: bool = False, python_executable: str | None = N
             'platform': sys.platform
         })
         
+        get_effective_spacy_status.cache_clear()  # Model status changed
         return True
     except subprocess.CalledProcessError as e:
         install_end = datetime.now()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+spacy_probe.py - Report spaCy availability for an interpreter as JSON
+
+Run by get_effective_spacy_status() (with --deep) under an alternate Python
+(e.g. 3.13) to find out whether it can provide a working spaCy. Uses the
+standard library only, since it runs outside this skill's environment.
+
+By default spaCy and en_core_web_sm are only located (find_spec and package
+metadata), without running spaCy's import chain. --deep also imports spaCy
+and loads the model.
+
+Usage:
+    python spacy_probe.py          # Locate spaCy and the model
+    python spacy_probe.py --deep   # Also import spaCy and load the model
+"""
+
+import importlib.util
+import json
+import sys
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+MODEL_NAME = 'en_core_web_sm'
+
+
+def _find_spec(name: str):
+    """Locate a top-level module without importing it (None if missing)."""
+    try:
+        return importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+
+
+def probe(deep: bool = False) -> dict:
+    """
+    Check spaCy and the English model in this interpreter
+
+    Args:
+        deep: Import spaCy and load the model instead of only locating them
+
+    Returns:
+        Dictionary with spacy_importable, spacy_version, model_loadable and
+        model_location (model_loadable means "installed" unless deep)
+    """
+    info = {
+        'spacy_importable': False,
+        'spacy_version': None,
+        'model_loadable': False,
+        'model_location': None,
+    }
+
+    if not deep:
+        if _find_spec('spacy') is None:
+            return info
+        info['spacy_importable'] = True
+        try:
+            info['spacy_version'] = version('spacy')
+        except PackageNotFoundError:
+            pass
+        model_spec = _find_spec(MODEL_NAME)
+        if model_spec is not None:
+            info['model_loadable'] = True
+            if model_spec.origin:
+                info['model_location'] = str(Path(model_spec.origin).parent)
+        return info
+
+    try:
+        import spacy
+    except Exception:
+        return info
+    info['spacy_importable'] = True
+    info['spacy_version'] = getattr(spacy, '__version__', None)
+    try:
+        nlp = spacy.load(MODEL_NAME)
+    except Exception:
+        return info
+    info['model_loadable'] = True
+    model_path = getattr(nlp, 'path', None) or getattr(nlp, '_path', None)
+    if model_path:
+        info['model_location'] = str(model_path)
+    return info
+
+
+def main() -> None:
+    print(json.dumps(probe(deep='--deep' in sys.argv[1:])))
+
+
+if __name__ == '__main__':
+    main()
@@ -125,8 +125,10 @@ class CacheManager:
         self._llms_cache_dir = self.base_dir / LLMS_CACHE_DIR
         self._manifest_state_path = self._llms_cache_dir / MANIFEST_STATE_FILE
 
-        # Index file (source of truth for inverted index)
+        # Index file (source of truth for inverted index) and its write-ahead
+        # log (IndexManager updates not yet folded into index.yaml)
         self._index_path = self.base_dir / "index.yaml"
+        self._wal_path = self._index_path.with_suffix('.wal')
 
     def _load_cache_version(self) -> dict | None:
         """Load cache version info from disk."""
@@ -138,6 +140,14 @@ class CacheManager:
         except (json.JSONDecodeError, OSError):
             return None
 
+    def _wal_stamp(self) -> list[int] | None:
+        """Return [mtime_ns, size] of the index write-ahead log, or None if there is none."""
+        try:
+            st = self._wal_path.stat()
+        except OSError:
+            return None
+        return [st.st_mtime_ns, st.st_size]
+
     def _save_cache_version(self, index_hash: str) -> None:
         """
         Save cache version info to disk.
@@ -153,6 +163,7 @@ class CacheManager:
                 "plugin_fingerprint": compute_plugin_fingerprint(),
                 "index_yaml_hash": index_hash,
                 "index_yaml_mtime": self._index_path.stat().st_mtime if self._index_path.exists() else 0,
+                "index_wal_stamp": self._wal_stamp(),
                 "created_at": datetime.now(timezone.utc).isoformat(),
                 "source_path": str(self._index_path.relative_to(self._skill_dir))
             }
@@ -172,8 +183,10 @@ class CacheManager:
         Uses hybrid approach:
         1. Fast path: check if cache exists and version file exists
         2. Plugin fingerprint: invalidate if any script changed
-        3. mtime check: if index.yaml mtime unchanged, assume valid
-        4. Hash check: if mtime changed, verify content hash
+        3. WAL check: invalidate if the index write-ahead log changed (logged
+           updates do not touch index.yaml)
+        4. mtime check: if index.yaml mtime unchanged, assume valid
+        5. Hash check: if mtime changed, verify content hash
 
         Returns:
             True if cache is valid and can be used, False if rebuild needed
@@ -199,6 +212,10 @@ class CacheManager:
         if not self._index_path.exists():
             return False
 
+        # Logged updates are part of the index but leave index.yaml untouched
+        if version_info.get("index_wal_stamp") != self._wal_stamp():
+            return False
+
         # Fast path: mtime unchanged means content unchanged
         try:
             current_mtime = self._index_path.stat().st_mtime
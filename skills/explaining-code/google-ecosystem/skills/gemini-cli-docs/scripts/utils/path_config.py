@@ -7,7 +7,7 @@ Provides centralized path resolution using configuration from config_registry.
 All scripts should use these functions instead of hardcoding paths.
 
 Usage:
-    from path_config import get_base_dir, get_index_path, get_temp_dir
+    from path_config import get_base_dir, get_index_path, get_temp_dir, get_cache_dir
     
     base_dir = get_base_dir()
     index_path = get_index_path(base_dir)
@@ -127,6 +127,28 @@ def get_temp_dir(start: Path | None = None) -> Path:
 
     return temp_dir.resolve()
 
+def get_cache_dir(base_dir: Path | None = None) -> Path:
+    """
+    Get the cache directory for local state that is never committed.
+
+    Like the search index cache, it is the .cache directory next to the base
+    directory (at skill root level for the default layout).
+
+    Args:
+        base_dir: Optional base directory. If None, uses get_base_dir().
+
+    Returns:
+        Path to the cache directory (may not exist yet)
+
+    Example:
+        >>> cache_dir = get_cache_dir()
+        >>> print(cache_dir)
+        /path/to/skill/.cache
+    """
+    if base_dir is None:
+        base_dir = get_base_dir()
+    return Path(base_dir).parent / ".cache"
+
 if __name__ == '__main__':
     """Self-test for path_config module."""
     print("Path Configuration Self-Test")
@@ -25,6 +25,8 @@ import bootstrap; skill_dir = bootstrap.skill_dir; config_dir = bootstrap.config
 from collections import Counter, defaultdict
 from datetime import datetime, timezone
 
+from management.index_manager import IndexManager
+
 
 class GeminiTagConfigAuditor:
     """Audits tag configuration against Gemini CLI documentation corpus."""
@@ -35,18 +37,15 @@ class GeminiTagConfigAuditor:
         self.index_path = base_dir / 'index.yaml'
         self.tag_config_path = config_dir / 'tag_detection.yaml'
 
-        # Load data - read index directly since list_entries() may have issues
-        if self.index_path.exists():
-            with open(self.index_path, 'r', encoding='utf-8') as f:
-                index_data = yaml.safe_load(f) or {}
+        # Load data through IndexManager so updates still in the write-ahead
+        # log (not yet folded into index.yaml) are included
+        index_data = IndexManager(base_dir).load_all()
 
-            # Convert dict of doc_id -> entry to list of entries with doc_id included
-            self.entries = [
-                {**entry, 'doc_id': doc_id}
-                for doc_id, entry in index_data.items()
-            ]
-        else:
-            self.entries = []
+        # Convert dict of doc_id -> entry to list of entries with doc_id included
+        self.entries = [
+            {**entry, 'doc_id': doc_id}
+            for doc_id, entry in index_data.items()
+        ]
 
         if self.tag_config_path.exists():
             with open(self.tag_config_path, 'r', encoding='utf-8') as f:
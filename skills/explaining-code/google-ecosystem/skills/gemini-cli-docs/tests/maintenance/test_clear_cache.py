@@ -117,3 +117,27 @@ class TestCacheManager:
             assert manager.is_inverted_index_valid() is False
         finally:
             refs_dir.cleanup()
+
+    def test_logged_index_update_invalidates_inverted_index(self, temp_dir):
+        """Test an update kept in the index write-ahead log invalidates the cache"""
+        refs_dir = TempReferencesDir()
+        try:
+            from scripts.management.index_manager import IndexManager
+            from scripts.utils.cache_manager import CacheManager
+
+            refs_dir.create_index({'doc1': {'path': 'doc1.md', 'url': 'https://geminicli.com/doc1'}})
+            cache_dir = refs_dir.references_dir.parent / '.cache'
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            (cache_dir / 'inverted_index.json').write_text('{}', encoding='utf-8')
+            manager = CacheManager(refs_dir.references_dir)
+            manager.mark_inverted_index_built()
+            assert manager.is_inverted_index_valid() is True
+
+            # update_entry() appends to index.wal and leaves index.yaml as is
+            index_yaml = (refs_dir.references_dir / 'index.yaml').read_bytes()
+            IndexManager(refs_dir.references_dir).update_entry('doc1', {'path': 'doc1.md', 'title': 'New'})
+
+            assert (refs_dir.references_dir / 'index.yaml').read_bytes() == index_yaml
+            assert manager.is_inverted_index_valid() is False
+        finally:
+            refs_dir.cleanup()
@@ -0,0 +1,36 @@
+"""
+Tests for extract_metadata.py (MetadataExtractor).
+"""
+
+import pytest
+
+
+class TestFromBytes:
+    """Test building an extractor from already-read file bytes."""
+
+    def test_from_bytes_matches_file_constructor(self, refs_dir):
+        """Test from_bytes() extracts the same metadata as reading the file."""
+        # Arrange
+        from scripts.management.extract_metadata import MetadataExtractor
+        content = "---\r\ntitle: Sandboxing\r\n---\r\n# Sandboxing\r\n\r\nRun tools inside a sandbox container.\r\n"
+        doc_path = refs_dir.references_dir / 'sandbox.md'
+        doc_path.write_bytes(content.encode('utf-8'))
+
+        # Act
+        from_file = MetadataExtractor(doc_path, 'https://geminicli.com/docs/sandbox').extract_all()
+        from_bytes = MetadataExtractor.from_bytes(
+            doc_path, doc_path.read_bytes(), 'https://geminicli.com/docs/sandbox'
+        ).extract_all()
+
+        # Assert
+        assert from_bytes == from_file
+        assert from_bytes['title'] == 'Sandboxing'
+
+    def test_from_bytes_rejects_invalid_utf8(self, refs_dir):
+        """Test undecodable bytes raise ValueError like the file constructor."""
+        # Arrange
+        from scripts.management.extract_metadata import MetadataExtractor
+
+        # Act / Assert
+        with pytest.raises(ValueError):
+            MetadataExtractor.from_bytes(refs_dir.references_dir / 'bad.md', b'\xff\xfe\x00bad')
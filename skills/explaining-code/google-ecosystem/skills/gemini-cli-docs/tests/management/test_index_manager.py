@@ -0,0 +1,445 @@
+"""
+Tests for index_manager.py (IndexManager).
+
+Tests snapshot-based reads and the locked write paths.
+"""
+
+from tests.shared.test_utils import create_mock_index_entry
+
+
+class TestSnapshotReads:
+    """Test copy-on-write read snapshot behaviour."""
+
+    def test_reads_reuse_snapshot_until_file_changes(self, refs_dir):
+        """Test repeated reads do not reload an unchanged index."""
+        # Arrange
+        manager = refs_dir.create_index_manager({
+            'doc1': create_mock_index_entry('doc1', 'https://geminicli.com/doc1', 'doc1.md'),
+        })
+
+        # Act
+        manager.get_entry('doc1')
+        first_version = manager._snapshot[1]
+        list(manager.list_entries())
+        manager.search_entries(url='https://geminicli.com/doc1')
+
+        # Assert
+        assert manager._snapshot[1] == first_version
+
+    def test_get_entry_returns_private_copy(self, refs_dir):
+        """Test editing a returned entry does not leak into the snapshot."""
+        # Arrange
+        manager = refs_dir.create_index_manager({
+            'doc1': create_mock_index_entry('doc1', 'https://geminicli.com/doc1', 'doc1.md', tags=['a']),
+        })
+
+        # Act
+        entry = manager.get_entry('doc1')
+        entry['tags'].append('b')
+        entry['title'] = 'Edited'
+
+        # Assert
+        fresh = manager.get_entry('doc1')
+        assert fresh['tags'] == ['a']
+        assert 'title' not in fresh
+
+    def test_write_publishes_new_snapshot(self, refs_dir):
+        """Test readers see writes and previously taken snapshots stay unchanged."""
+        # Arrange
+        manager = refs_dir.create_index_manager({
+            'doc1': create_mock_index_entry('doc1', 'https://geminicli.com/doc1', 'doc1.md'),
+        })
+        old_snapshot = manager._read_snapshot()
+
+        # Act
+        assert manager.update_entry('doc2', create_mock_index_entry('doc2', 'https://geminicli.com/doc2', 'doc2.md'))
+
+        # Assert
+        assert manager.get_entry('doc2') is not None
+        assert 'doc2' not in old_snapshot
+
+    def test_external_change_triggers_reload(self, refs_dir):
+        """Test the snapshot is refreshed when another writer changes the file."""
+        # Arrange
+        manager = refs_dir.create_index_manager({
+            'doc1': create_mock_index_entry('doc1', 'https://geminicli.com/doc1', 'doc1.md'),
+        })
+        assert manager.get_entry('doc2') is None
+
+        # Act
+        from scripts.management.index_manager import IndexManager
+        other = IndexManager(refs_dir.references_dir)
+        assert other.update_entry('doc2', create_mock_index_entry('doc2', 'https://geminicli.com/doc2', 'doc2.md'))
+
+        # Assert
+        assert manager.get_entry('doc2') is not None
+
+
+    def test_entries_view_shares_snapshot(self, refs_dir):
+        """Test entries_view() counts and iterates the snapshot without copying."""
+        # Arrange
+        manager = refs_dir.create_index_manager({
+            'doc1': create_mock_index_entry('doc1', 'https://geminicli.com/doc1', 'doc1.md'),
+            'doc2': create_mock_index_entry('doc2', 'https://geminicli.com/doc2', 'doc2.md'),
+        })
+
+        # Act
+        entries = manager.entries_view()
+
+        # Assert
+        assert len(entries) == 2
+        assert dict(entries)['doc1'] is manager._read_snapshot()['doc1']
+
+    def test_list_entries_yields_copies(self, refs_dir):
+        """Test mutating an entry from list_entries() does not leak into the snapshot."""
+        # Arrange
+        manager = refs_dir.create_index_manager({
+            'doc1': create_mock_index_entry('doc1', 'https://geminicli.com/doc1', 'doc1.md', keywords=['cli']),
+        })
+
+        # Act
+        for _doc_id, metadata in manager.list_entries():
+            metadata['title'] = 'Changed'
+            metadata['keywords'].append('leak')
+
+        # Assert
+        entry = manager.get_entry('doc1')
+        assert entry.get('title') != 'Changed'
+        assert entry['keywords'] == ['cli']
+        assert dict(manager.entries_view())['doc1'] == entry
+
+class TestSearchEntries:
+    """Test search_entries with and without the secondary index."""
+
+    def _index(self):
+        return {
+            'doc1': create_mock_index_entry('doc1', 'https://geminicli.com/doc1', 'doc1.md',
+                                            source_type='llms-txt', category='cli'),
+            'doc2': create_mock_index_entry('doc2', 'https://geminicli.com/doc2', 'doc2.md',
+                                            source_type='llms-txt', category='core'),
+            'doc3': create_mock_index_entry('doc3', 'https://geminicli.com/doc3', 'doc3.md',
+                                            source_type='sitemap', category='cli'),
+        }
+
+    def test_indexed_field_filter(self, refs_dir):
+        """Test filtering on an indexed field returns matches in index order."""
+        manager = refs_dir.create_index_manager(self._index())
+
+        results = manager.search_entries(source_type='llms-txt')
+
+        assert [doc_id for doc_id, _ in results] == ['doc1', 'doc2']
+
+    def test_mixed_indexed_and_plain_filters(self, refs_dir):
+        """Test non-indexed filters are applied to indexed candidates."""
+        manager = refs_dir.create_index_manager(self._index())
+
+        results = manager.search_entries(source_type='llms-txt', category='core')
+
+        assert [doc_id for doc_id, _ in results] == ['doc2']
+
+    def test_plain_field_filter_and_no_match(self, refs_dir):
+        """Test linear-scan fallback and empty results."""
+        manager = refs_dir.create_index_manager(self._index())
+
+        assert [d for d, _ in manager.search_entries(category='cli')] == ['doc1', 'doc3']
+        assert manager.search_entries(url='https://geminicli.com/missing') == []
+
+    def test_secondary_index_tracks_writes(self, refs_dir):
+        """Test the secondary index is rebuilt for a newly published snapshot."""
+        manager = refs_dir.create_index_manager(self._index())
+        assert len(manager.search_entries(source_type='sitemap')) == 1
+
+        manager.update_entry('doc4', create_mock_index_entry(
+            'doc4', 'https://geminicli.com/doc4', 'doc4.md', source_type='sitemap'))
+
+        assert [d for d, _ in manager.search_entries(source_type='sitemap')] == ['doc3', 'doc4']
+
+
+    def test_list_entries_missing_required_keys(self, refs_dir):
+        """Test only entries lacking a required key are listed and counted."""
+        # Arrange
+        manager = refs_dir.create_index_manager({
+            'done': create_mock_index_entry('done', 'https://geminicli.com/a', 'a.md', title='A', tags=['x']),
+            'partial': create_mock_index_entry('partial', 'https://geminicli.com/b', 'b.md', title='B'),
+            'bare': create_mock_index_entry('bare', 'https://geminicli.com/c', 'c.md'),
+        })
+
+        # Act
+        missing = [doc_id for doc_id, _ in manager.list_entries_missing(('title', 'tags'))]
+        count = manager.count_missing(('title', 'tags'))
+
+        # Assert
+        assert sorted(missing) == ['bare', 'partial']
+        assert count == 2
+
+class TestBatchUpdate:
+    """Test batch_update_entries persistence."""
+
+    def test_batch_update_writes_json_and_yaml(self, refs_dir):
+        """Test JSON and YAML (including logged writes) are current on return."""
+        import json
+        import yaml
+
+        manager = refs_dir.create_index_manager({
+            'doc1': create_mock_index_entry('doc1', 'https://geminicli.com/doc1', 'doc1.md'),
+        })
+        assert manager.update_entry('logged', {'title': 'Logged'})
+
+        assert manager.batch_update_entries({
+            'doc1': {'title': 'Doc One', 'url': 'https://ignored.example'},
+            'doc2': create_mock_index_entry('doc2', 'https://geminicli.com/doc2', 'doc2.md'),
+        })
+
+        with open(manager.json_path, encoding='utf-8') as f:
+            saved_json = json.load(f)
+        assert saved_json['doc1']['title'] == 'Doc One'
+        assert saved_json['doc1']['url'] == 'https://geminicli.com/doc1'  # protected field
+        assert 'doc2' in saved_json
+
+        with open(manager.index_path, encoding='utf-8') as f:
+            assert yaml.safe_load(f) == saved_json
+        assert saved_json['logged'] == {'title': 'Logged'}
+        assert not manager.wal_path.exists()
+
+
+class TestWriteAll:
+    """Test whole-index replacement."""
+
+    def test_write_all_replaces_index_and_log(self, refs_dir):
+        """Test write_all overwrites protected fields, drops removed entries and the log."""
+        # Arrange
+        import yaml
+        manager = refs_dir.create_index_manager({
+            'doc1': create_mock_index_entry('doc1', 'https://geminicli.com/doc1', 'doc1.md'),
+            'doc2': create_mock_index_entry('doc2', 'https://geminicli.com/doc2', 'doc2.md'),
+        })
+        manager.update_entry('doc3', create_mock_index_entry('doc3', 'https://geminicli.com/doc3', 'doc3.md'))
+
+        # Act
+        written = manager.write_all({
+            'doc3': create_mock_index_entry('doc3', 'https://geminicli.com/doc3', 'doc3.md'),
+            'doc1': create_mock_index_entry('doc1', 'https://geminicli.com/doc1', 'moved/doc1.md'),
+        })
+
+        # Assert
+        assert written
+        assert not manager.wal_path.exists()
+        with open(manager.index_path, encoding='utf-8') as f:
+            saved = yaml.safe_load(f)
+        assert list(saved) == ['doc1', 'doc3']
+        assert saved['doc1']['path'] == 'moved/doc1.md'
+        assert manager.load_all() == saved
+
+    def test_write_all_refuses_unloadable_index(self, refs_dir):
+        """Test a non-empty index file that loads as empty is not overwritten."""
+        # Arrange
+        from scripts.management.index_manager import IndexManager
+        refs_dir.index_path.write_text('# comment only\n', encoding='utf-8')
+        manager = IndexManager(refs_dir.references_dir)
+
+        # Act
+        written = manager.write_all({'doc1': {'path': 'doc1.md'}})
+
+        # Assert
+        assert not written
+        assert refs_dir.index_path.read_text(encoding='utf-8') == '# comment only\n'
+
+
+class TestEntryCount:
+    """Test get_entry_count."""
+
+    def test_count_from_yaml_scan(self, refs_dir):
+        """Test counting top-level keys in index.yaml without a loaded snapshot."""
+        manager = refs_dir.create_index_manager({
+            f'doc{i}': create_mock_index_entry(f'doc{i}', f'https://geminicli.com/doc{i}', f'doc{i}.md',
+                                               keywords=['a', 'b'])
+            for i in range(5)
+        })
+
+        assert manager.get_entry_count() == 5
+
+    def test_count_empty_file(self, refs_dir):
+        """Test an empty index.yaml counts as zero entries."""
+        refs_dir.index_path.write_text('', encoding='utf-8')
+        from scripts.management.index_manager import IndexManager
+
+        assert IndexManager(refs_dir.references_dir).get_entry_count() == 0
+
+    def test_count_uses_current_snapshot(self, refs_dir):
+        """Test the count reflects writes published by this manager."""
+        manager = refs_dir.create_index_manager({
+            'doc1': create_mock_index_entry('doc1', 'https://geminicli.com/doc1', 'doc1.md'),
+        })
+
+        manager.batch_update_entries({
+            'doc2': create_mock_index_entry('doc2', 'https://geminicli.com/doc2', 'doc2.md'),
+        })
+
+        assert manager.get_entry_count() == 2
+
+
+class TestWriteAheadLog:
+    """Test single-entry writes through the write-ahead log."""
+
+    def test_update_and_remove_are_logged_and_replayed(self, refs_dir):
+        """Test logged writes are visible to a fresh manager before compaction."""
+        manager = refs_dir.create_index_manager({
+            'doc1': create_mock_index_entry('doc1', 'https://geminicli.com/doc1', 'doc1.md'),
+            'doc2': create_mock_index_entry('doc2', 'https://geminicli.com/doc2', 'doc2.md'),
+        })
+
+        assert manager.update_entry('doc1', {'title': 'Updated'})
+        assert manager.remove_entry('doc2')
+
+        assert manager.wal_path.exists()
+        from scripts.management.index_manager import IndexManager
+        fresh = IndexManager(refs_dir.references_dir)
+        assert fresh.load_all() == {'doc1': {'title': 'Updated'}}
+        assert fresh.get_entry_count() == 1
+
+    def test_truncated_tail_is_ignored(self, refs_dir):
+        """Test an interrupted append does not break replay."""
+        manager = refs_dir.create_index_manager({
+            'doc1': create_mock_index_entry('doc1', 'https://geminicli.com/doc1', 'doc1.md'),
+        })
+        assert manager.update_entry('doc1', {'title': 'Updated'})
+        with open(manager.wal_path, 'a', encoding='utf-8') as f:
+            f.write('{"op": "remove", "id": "doc1"')
+
+        assert manager.load_all() == {'doc1': {'title': 'Updated'}}
+
+    def test_compact_folds_log_into_index_files(self, refs_dir):
+        """Test compaction writes YAML and JSON and drops the log."""
+        import yaml
+
+        manager = refs_dir.create_index_manager({
+            'doc1': create_mock_index_entry('doc1', 'https://geminicli.com/doc1', 'doc1.md'),
+        })
+        assert manager.update_entry('doc2', {'title': 'New'})
+
+        assert manager.compact()
+
+        assert not manager.wal_path.exists()
+        with open(manager.index_path, encoding='utf-8') as f:
+            assert yaml.safe_load(f)['doc2'] == {'title': 'New'}
+        assert manager.load_all()['doc2'] == {'title': 'New'}
+
+    def test_first_write_to_fresh_index_writes_files(self, refs_dir):
+        """Test the first write to an empty directory creates index.yaml instead of only the log."""
+        from scripts.management.index_manager import IndexManager
+        manager = IndexManager(refs_dir.references_dir)
+
+        assert manager.update_entry('doc1', {'title': 'First'})
+
+        assert manager.index_path.exists()
+        assert not manager.wal_path.exists()
+        fresh = IndexManager(refs_dir.references_dir)
+        assert fresh.get_entry('doc1') == {'title': 'First'}
+        assert list(fresh.list_entries()) == [('doc1', {'title': 'First'})]
+
+    def test_log_without_index_files_is_read(self, refs_dir):
+        """Test readers replay a write-ahead log even when no index file exists yet."""
+        import json
+        from scripts.management.index_manager import IndexManager
+        manager = IndexManager(refs_dir.references_dir)
+        manager.wal_path.write_text(json.dumps({'op': 'update', 'id': 'doc1', 'meta': {'title': 'Logged'}}) + '\n',
+                                    encoding='utf-8')
+
+        assert manager.get_entry('doc1') == {'title': 'Logged'}
+        assert manager.search_entries(title='Logged') == [('doc1', {'title': 'Logged'})]
+        assert len(manager.entries_view()) == 1
+
+
+class TestWriteOrder:
+    """Test index files stay sorted without sort_keys on every dump."""
+
+    def test_written_files_are_sorted(self, refs_dir):
+        """Test doc_ids and entry fields are written in sorted order."""
+        import json
+
+        manager = refs_dir.create_index_manager({
+            'doc-b': create_mock_index_entry('doc-b', 'https://geminicli.com/b', 'b.md'),
+        })
+
+        assert manager.batch_update_entries({
+            'doc-c': {'url': 'https://geminicli.com/c', 'path': 'c.md'},
+            'doc-a': {'url': 'https://geminicli.com/a', 'path': 'a.md', 'extra': {'z': 1, 'a': 2}},
+        })
+
+        with open(manager.json_path, encoding='utf-8') as f:
+            saved = json.load(f)
+        assert list(saved) == ['doc-a', 'doc-b', 'doc-c']
+        assert list(saved['doc-a']) == ['extra', 'path', 'url']
+        assert list(saved['doc-a']['extra']) == ['a', 'z']
+        yaml_lines = manager.index_path.read_text(encoding='utf-8').splitlines()
+        assert [line for line in yaml_lines if not line.startswith(' ')] == ['doc-a:', 'doc-b:', 'doc-c:']
+
+    def test_long_values_are_not_folded(self, refs_dir):
+        """Test long scalars stay on one line so the output is stable and greppable."""
+        # Arrange
+        description = ' '.join(['settings'] * 40)
+        manager = refs_dir.create_index_manager({
+            'doc1': create_mock_index_entry('doc1', 'https://geminicli.com/doc1', 'doc1.md'),
+        })
+
+        # Act
+        manager.write_all({
+            'doc1': create_mock_index_entry('doc1', 'https://geminicli.com/doc1', 'doc1.md', description=description),
+        })
+
+        # Assert
+        assert f'description: {description}\n' in refs_dir.index_path.read_text(encoding='utf-8')
+
+
+class TestNoOpWrites:
+    """Test unchanged updates skip persistence."""
+
+    def test_identical_update_is_not_written(self, refs_dir):
+        """Test update_entry with unchanged metadata leaves files untouched."""
+        entry = create_mock_index_entry('doc1', 'https://geminicli.com/doc1', 'doc1.md')
+        manager = refs_dir.create_index_manager({'doc1': entry})
+
+        assert manager.update_entry('doc1', dict(entry))
+
+        assert not manager.wal_path.exists()
+
+    def test_identical_batch_is_not_written(self, refs_dir):
+        """Test batch_update_entries with no effective change writes nothing."""
+        entry = create_mock_index_entry('doc1', 'https://geminicli.com/doc1', 'doc1.md')
+        manager = refs_dir.create_index_manager({'doc1': entry})
+
+        # Protected field differs but is already set, so the merge is a no-op
+        assert manager.batch_update_entries({'doc1': {'url': 'https://other.example'}})
+
+        assert not manager.json_path.exists()
+
+
+class TestLocking:
+    """Test index lock acquisition."""
+
+    def test_uncontended_lock_fast_path(self, refs_dir, monkeypatch):
+        """Test an uncontended lock does not enter the retry loop."""
+        manager = refs_dir.create_index_manager({})
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("retry path used")
+
+        monkeypatch.setattr(manager, '_acquire_lock', _fail)
+
+        assert manager._acquire_lock_with_retry("test")
+        assert manager.lock_file.exists()
+        manager._release_lock()
+        assert not manager.lock_file.exists()
+
+    def test_stale_lock_uses_retry_path(self, refs_dir):
+        """Test a leftover stale lock is cleared by the retry path."""
+        import os
+        import time
+
+        manager = refs_dir.create_index_manager({})
+        manager.lock_file.write_text('', encoding='utf-8')
+        old = time.time() - 3600
+        os.utime(manager.lock_file, (old, old))
+
+        assert manager._acquire_lock_with_retry("test")
+        manager._release_lock()
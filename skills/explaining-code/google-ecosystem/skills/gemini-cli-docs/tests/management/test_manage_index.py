@@ -0,0 +1,334 @@
+"""
+Tests for manage_index.py (extract-keywords and validate-metadata commands).
+"""
+
+from tests.shared.test_utils import create_mock_gemini_doc, create_mock_index_entry
+
+
+class TestExtractKeywords:
+    """Test the extract-keywords command."""
+
+    def test_extract_one_returns_update_for_missing_fields(self, refs_dir):
+        """Test _extract_one proposes updates for fields absent from the entry."""
+        # Arrange
+        from scripts.management.manage_index import _extract_one
+        doc_path = refs_dir.create_doc('geminicli.com', 'docs', 'doc0.md', create_mock_gemini_doc('doc0'))
+
+        # Act
+        doc_id, update, stats, error = _extract_one(
+            'doc0', str(doc_path), 'https://geminicli.com/docs/doc0', {}, True
+        )
+
+        # Assert
+        assert doc_id == 'doc0'
+        assert error is None
+        assert update['title'] == 'Gemini CLI doc0'
+        assert stats is not None
+
+    def test_extract_one_reports_errors(self, refs_dir):
+        """Test _extract_one returns the error instead of raising."""
+        # Arrange
+        from scripts.management.manage_index import _extract_one
+
+        # Act
+        doc_id, update, stats, error = _extract_one(
+            'missing', str(refs_dir.references_dir / 'missing.md'), '', {}, True
+        )
+
+        # Assert
+        assert update is None
+        assert error
+
+    def test_extract_one_skips_unchanged_files(self, refs_dir):
+        """Test a stored extracted_hash matching the file bytes skips extraction."""
+        # Arrange
+        from scripts.management.manage_index import _extract_one
+        doc_path = refs_dir.create_doc('geminicli.com', 'docs', 'doc0.md', create_mock_gemini_doc('doc0'))
+        _, first_update, _, _ = _extract_one('doc0', str(doc_path), '', {}, True)
+
+        # Act
+        unchanged = _extract_one('doc0', str(doc_path), '', first_update, True)
+        doc_path.write_text(create_mock_gemini_doc('doc0') + "\nMore text.\n", encoding='utf-8')
+        changed = _extract_one('doc0', str(doc_path), '', first_update, True)
+
+        # Assert
+        assert first_update['extracted_hash']
+        assert unchanged == ('doc0', None, None, None)
+        assert changed[1]['extracted_hash'] != first_update['extracted_hash']
+
+    def test_extract_one_reextracts_when_extractors_change(self, refs_dir, monkeypatch):
+        """Test a newly available optional extractor invalidates the stored extracted_hash."""
+        # Arrange
+        import sys
+        from scripts.management.manage_index import MetadataExtractor, _extract_one
+        extract_metadata = sys.modules[MetadataExtractor.__module__]
+        doc_path = refs_dir.create_doc('geminicli.com', 'docs', 'doc0.md', create_mock_gemini_doc('doc0'))
+        _, first_update, _, _ = _extract_one('doc0', str(doc_path), '', {}, True)
+
+        # Act
+        monkeypatch.setattr(extract_metadata, 'YAKE_AVAILABLE', not extract_metadata.YAKE_AVAILABLE)
+        _, update, _, error = _extract_one('doc0', str(doc_path), '', first_update, True)
+
+        # Assert
+        assert error is None
+        assert update['extracted_hash'] != first_update['extracted_hash']
+
+    def test_extract_one_keeps_populated_fields(self, refs_dir):
+        """Test populated fields are kept while tags and weak keywords are refreshed."""
+        # Arrange
+        from scripts.management.manage_index import _extract_one
+        doc_path = refs_dir.create_doc('geminicli.com', 'docs', 'doc0.md', create_mock_gemini_doc('doc0'))
+        existing = {'title': 'Custom Title', 'keywords': ['cli'], 'tags': ['old']}
+
+        # Act
+        _, update, _, _ = _extract_one('doc0', str(doc_path), '', existing, True)
+
+        # Assert
+        assert 'title' not in update
+        assert 'keywords' in update
+        assert 'tags' in update
+
+    def test_min_meaningful_keywords(self):
+        """Test the keyword quality predicate matches the documented threshold."""
+        # Arrange
+        from scripts.management.manage_index import _has_min_meaningful_keywords
+
+        # Act / Assert
+        assert _has_min_meaningful_keywords(['gemini', 'sandbox', 'settings'])
+        assert not _has_min_meaningful_keywords(['gemini', 'cli', 'mcp', 'sandbox'])
+        assert not _has_min_meaningful_keywords(['gemini', None, '', 'sandbox'])
+        assert _has_min_meaningful_keywords(['gemini', 12345, 'sandbox'])
+
+    def test_parallel_and_serial_runs_match(self, refs_dir):
+        """Test the process pool produces the same index as the serial loop."""
+        # Arrange
+        from scripts.management.manage_index import cmd_extract_keywords
+        index = refs_dir.create_docs(4)
+        manager = refs_dir.create_index_manager(index)
+
+        # Act
+        cmd_extract_keywords(manager, refs_dir.references_dir, auto_install=False, workers=1)
+        serial = manager.load_all()
+        refs_dir.create_index(index)
+        manager = refs_dir.create_index_manager(index)
+        cmd_extract_keywords(manager, refs_dir.references_dir, auto_install=False, workers=2)
+        parallel = manager.load_all()
+
+        # Assert
+        assert parallel == serial
+        assert all(entry.get('title') for entry in parallel.values())
+
+    def test_updates_are_flushed_in_chunks(self, refs_dir, monkeypatch):
+        """Test queued updates are persisted every flush_every entries."""
+        # Arrange
+        from scripts.management.manage_index import cmd_extract_keywords
+        manager = refs_dir.create_index_manager(refs_dir.create_docs(5))
+        batch_sizes = []
+        original = manager.batch_update_entries
+
+        def _recording_batch_update(updates):
+            batch_sizes.append(len(updates))
+            return original(updates)
+
+        monkeypatch.setattr(manager, 'batch_update_entries', _recording_batch_update)
+
+        # Act
+        cmd_extract_keywords(manager, refs_dir.references_dir, auto_install=False, workers=1, flush_every=2)
+
+        # Assert
+        assert batch_sizes == [2, 2, 1]
+        assert all(entry.get('title') for entry in manager.load_all().values())
+
+
+    def test_resumes_from_checkpoint(self, refs_dir):
+        """Test results left in the checkpoint are applied without re-extraction."""
+        # Arrange
+        import json
+        from scripts.management.manage_index import CHECKPOINT_FILENAME, cmd_extract_keywords
+        from scripts.utils.path_config import get_cache_dir
+        manager = refs_dir.create_index_manager(refs_dir.create_docs(2))
+        checkpoint_path = get_cache_dir(refs_dir.references_dir) / CHECKPOINT_FILENAME
+        checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        checkpoint_path.write_text(
+            json.dumps({'id': 'doc0', 'u': {'title': 'Resumed Title'}}) + '\n' + '{"id": "doc1", "u"',
+            encoding='utf-8',
+        )
+
+        # Act
+        cmd_extract_keywords(manager, refs_dir.references_dir, auto_install=False, workers=1)
+
+        # Assert
+        index = manager.load_all()
+        assert index['doc0']['title'] == 'Resumed Title'
+        assert index['doc1']['title'] == 'Gemini CLI doc1'
+        assert not checkpoint_path.exists()
+
+    def test_resumed_updates_outside_the_scan_are_applied(self, refs_dir):
+        """Test checkpointed results for doc_ids the run does not scan are kept, not dropped."""
+        # Arrange
+        import json
+        from scripts.management.manage_index import CHECKPOINT_FILENAME, cmd_extract_keywords
+        from scripts.utils.path_config import get_cache_dir
+        manager = refs_dir.create_index_manager(refs_dir.create_docs(2))
+        checkpoint_path = get_cache_dir(refs_dir.references_dir) / CHECKPOINT_FILENAME
+        checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        checkpoint_path.write_text(
+            json.dumps({'id': 'doc0', 'u': {'title': 'Resumed Title'}}) + '\n'
+            + json.dumps({'id': 'gone', 'u': {'title': 'Removed Since'}}) + '\n',
+            encoding='utf-8',
+        )
+
+        # Act
+        cmd_extract_keywords(manager, refs_dir.references_dir, auto_install=False, workers=1, only=['doc1'])
+
+        # Assert
+        index = manager.load_all()
+        assert index['doc0']['title'] == 'Resumed Title'
+        assert index['doc1']['title'] == 'Gemini CLI doc1'
+        assert 'gone' not in index
+        assert not checkpoint_path.exists()
+
+    def test_only_restricts_extraction_to_listed_ids(self, refs_dir):
+        """Test only= extracts the listed doc_ids and leaves the rest untouched."""
+        # Arrange
+        from scripts.management.manage_index import cmd_extract_keywords
+        manager = refs_dir.create_index_manager(refs_dir.create_docs(3))
+
+        # Act
+        cmd_extract_keywords(manager, refs_dir.references_dir, auto_install=False, workers=1,
+                             only=['doc1', 'not-in-index'])
+
+        # Assert
+        index = manager.load_all()
+        assert index['doc1'].get('title') == 'Gemini CLI doc1'
+        assert not index['doc0'].get('title')
+        assert not index['doc2'].get('title')
+
+    def test_returns_failed_doc_ids(self, refs_dir, monkeypatch):
+        """Test doc_ids whose extraction errored are returned for a retry."""
+        # Arrange
+        from scripts.management import manage_index
+        manager = refs_dir.create_index_manager(refs_dir.create_docs(3))
+        original = manage_index._extract_one
+
+        def _failing_extract_one(doc_id, *args, **kwargs):
+            if doc_id == 'doc1':
+                return doc_id, None, None, 'boom'
+            return original(doc_id, *args, **kwargs)
+
+        monkeypatch.setattr(manage_index, '_extract_one', _failing_extract_one)
+
+        # Act
+        failed = manage_index.cmd_extract_keywords(manager, refs_dir.references_dir,
+                                                   auto_install=False, workers=1)
+
+        # Assert
+        assert failed == ['doc1']
+        assert manager.load_all()['doc0'].get('title') == 'Gemini CLI doc0'
+
+
+class TestValidateMetadata:
+    """Test the validate-metadata command."""
+
+    def test_snapshot_lists_relative_posix_paths(self, refs_dir):
+        """Test the directory snapshot matches index path format."""
+        # Arrange
+        from scripts.management.manage_index import _snapshot_existing_files
+        refs_dir.create_docs(2)
+
+        # Act
+        existing = _snapshot_existing_files(refs_dir.references_dir)
+
+        # Assert
+        assert 'geminicli.com/docs/doc0.md' in existing
+        assert 'geminicli.com/docs/doc1.md' in existing
+
+    def test_counts_missing_files(self, refs_dir, capsys):
+        """Test entries whose files are absent are reported as missing."""
+        # Arrange
+        import json
+        from scripts.management.manage_index import cmd_validate_metadata
+        index = refs_dir.create_docs(2)
+        index['gone'] = create_mock_index_entry('gone', 'https://geminicli.com/gone', 'geminicli.com/docs/gone.md')
+        manager = refs_dir.create_index_manager(index)
+
+        # Act
+        cmd_validate_metadata(manager, refs_dir.references_dir, json_output=True)
+
+        # Assert
+        stats = json.loads(capsys.readouterr().out)
+        assert stats['total'] == 3
+        assert stats['missing_files'] == 1
+
+    def test_counts_field_coverage(self, refs_dir, capsys):
+        """Test coverage, empty and minimal keyword counts from a single pass."""
+        # Arrange
+        import json
+        from scripts.management.manage_index import cmd_validate_metadata
+        full = dict(title='T', description='D', tags=['t'], category='c', domain='d',
+                    keywords=['gemini', 'settings', 'sandbox'])
+        manager = refs_dir.create_index_manager({
+            'full': create_mock_index_entry('full', 'https://geminicli.com/a', 'a.md', **full),
+            'minimal': create_mock_index_entry('minimal', 'https://geminicli.com/b', 'b.md', title='T', keywords=['cli']),
+            'empty': create_mock_index_entry('empty', 'https://geminicli.com/c', 'c.md', keywords=[]),
+        })
+
+        # Act
+        cmd_validate_metadata(manager, refs_dir.references_dir, json_output=True)
+
+        # Assert
+        stats = json.loads(capsys.readouterr().out)
+        assert stats['has_title'] == 2
+        assert stats['has_keywords'] == 2
+        assert stats['has_all_metadata'] == 1
+        assert stats['minimal_keywords'] == 1
+        assert stats['empty_keywords'] == 1
+        assert stats['coverage']['title'] == 66
+
+    def test_counts_empty_keywords(self, refs_dir, capsys):
+        """Test empty_keywords counts entries whose keywords field is present but empty."""
+        # Arrange (this stat was always reported as 0 before the single-pass counters)
+        import json
+        from scripts.management.manage_index import cmd_validate_metadata
+        manager = refs_dir.create_index_manager({
+            'empty-list': create_mock_index_entry('empty-list', 'https://geminicli.com/a', 'a.md', keywords=[]),
+            'null': create_mock_index_entry('null', 'https://geminicli.com/b', 'b.md', keywords=None),
+            'absent': create_mock_index_entry('absent', 'https://geminicli.com/c', 'c.md'),
+            'filled': create_mock_index_entry('filled', 'https://geminicli.com/d', 'd.md', keywords=['gemini']),
+        })
+
+        # Act
+        cmd_validate_metadata(manager, refs_dir.references_dir, json_output=True)
+
+        # Assert
+        stats = json.loads(capsys.readouterr().out)
+        assert stats['empty_keywords'] == 2
+        assert stats['has_keywords'] == 1
+
+    def test_extract_and_validate_matches_separate_runs(self, refs_dir, capsys):
+        """Test the single-pass command reports the same stats as extract then validate."""
+        # Arrange
+        import json
+        from scripts.management.manage_index import (
+            cmd_extract_and_validate,
+            cmd_extract_keywords,
+            cmd_validate_metadata,
+        )
+        index = refs_dir.create_docs(3)
+        index['gone'] = create_mock_index_entry('gone', 'https://geminicli.com/gone', 'geminicli.com/docs/gone.md')
+        manager = refs_dir.create_index_manager(index)
+        cmd_extract_keywords(manager, refs_dir.references_dir, auto_install=False, workers=1)
+        capsys.readouterr()
+        cmd_validate_metadata(manager, refs_dir.references_dir, json_output=True)
+        expected = json.loads(capsys.readouterr().out)
+
+        # Act
+        manager = refs_dir.create_index_manager(index)
+        cmd_extract_and_validate(manager, refs_dir.references_dir, json_output=True,
+                                 auto_install=False, workers=1)
+        out = capsys.readouterr().out
+
+        # Assert
+        combined = json.loads(out[out.index('{'):])
+        assert combined == expected
+        assert combined['missing_files'] == 1
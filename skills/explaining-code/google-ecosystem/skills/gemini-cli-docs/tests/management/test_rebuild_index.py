@@ -0,0 +1,463 @@
+"""
+Tests for rebuild_index.py (filesystem -> index.yaml rebuild).
+"""
+
+import os
+
+from tests.shared.test_utils import create_mock_gemini_doc
+
+
+def _load_index(refs_dir) -> dict:
+    from scripts.management.index_manager import IndexManager
+    return IndexManager(refs_dir.references_dir).load_all()
+
+
+class TestCalculateHash:
+    """Test content hashing."""
+
+    def test_bytes_hash_matches_text_hash(self, tmp_path):
+        """Test hashing raw bytes gives the same digest as hashing read_text()."""
+        # Arrange
+        from scripts.management.rebuild_index import calculate_hash, calculate_hash_bytes
+        samples = [
+            '---\nsource_url: x\n---\n\n# Title\n\nBody\n',
+            '# No frontmatter\n\nBody  \n',
+            '---\na: 1\n---\r\n# CRLF\r\nBody\r\n',
+            '---\na: 1\n---\n\u00a0Body with nbsp\u00a0\n',
+            '---\nunterminated frontmatter\n',
+            '',
+        ]
+
+        # Act / Assert
+        for text in samples:
+            path = tmp_path / 'doc.md'
+            path.write_bytes(text.encode('utf-8'))
+            content = path.read_text(encoding='utf-8')
+            assert calculate_hash_bytes(path.read_bytes()) == calculate_hash(content), text
+            assert calculate_hash_bytes(path.read_bytes(), body_only=False) == calculate_hash(content, body_only=False)
+
+    def test_algorithm_prefix_selects_hasher(self, monkeypatch):
+        """Test hashes carry their algorithm prefix and sha256 stays available."""
+        # Arrange
+        import hashlib
+        from scripts.management import rebuild_index as module
+        monkeypatch.setitem(module.HASHERS, 'blake3', hashlib.blake2b)
+        data = b'---\ntitle: x\n---\nBody text.\n'
+
+        # Act
+        stored = module.calculate_hash_bytes(data, algorithm='sha256')
+        fast = module.calculate_hash_bytes(data, algorithm='blake3')
+
+        # Assert
+        assert stored == 'sha256:' + hashlib.sha256(b'Body text.').hexdigest()
+        assert fast == 'blake3:' + hashlib.blake2b(b'Body text.').hexdigest()
+
+    def test_strip_frontmatter_uses_first_closing_delimiter(self):
+        """Test the body starts after the first '---' following the opening one."""
+        # Arrange
+        from scripts.management.rebuild_index import strip_frontmatter
+
+        # Act / Assert
+        assert strip_frontmatter('---\na: 1\n---\n\nBody\n---\nMore\n') == 'Body\n---\nMore'
+        assert strip_frontmatter('---\nunterminated\n') == '---\nunterminated\n'
+        assert strip_frontmatter('# Plain\n') == '# Plain\n'
+
+
+    def test_strip_frontmatter_bytes_offsets_match_text(self):
+        """Test byte offsets select the same body as strip_frontmatter."""
+        # Arrange
+        from scripts.management.rebuild_index import strip_frontmatter, strip_frontmatter_bytes
+        samples = ['---\na: 1\n---\n\n  Body\n\n', '# Plain\n', '---\na: 1\n---\n\n', '---\nunterminated\n']
+
+        # Act / Assert
+        for text in samples:
+            data = text.encode('utf-8')
+            start, end = strip_frontmatter_bytes(data)
+            assert data[start:end].decode('utf-8') == strip_frontmatter(text), text
+
+
+class TestExtractSourceUrl:
+    """Test source_url lookup in raw frontmatter."""
+
+    def test_matches_yaml_parse(self):
+        """Test the regex fast path and YAML fallback agree with a full parse."""
+        # Arrange
+        import yaml
+        from scripts.management.rebuild_index import extract_source_url
+        samples = [
+            'source_url: https://geminicli.com/docs/a#section\ntitle: A\n',
+            "title: B\nsource_url: 'https://geminicli.com/docs/b'\n",
+            'source_url: "https://geminicli.com/docs/c"  # canonical\n',
+            'source_url: >-\n  https://geminicli.com/docs/d\n',
+            "source_url: 'https://geminicli.com/docs/''e'''\n",
+            'title: No URL\n',
+        ]
+
+        # Act / Assert
+        for text in samples:
+            expected = yaml.safe_load(text).get('source_url')
+            assert extract_source_url(('\n' + text).encode('utf-8')) == expected, text
+
+
+class TestWalkMarkdown:
+    """Test the scandir-based markdown walk."""
+
+    def test_lists_markdown_with_relative_paths(self, refs_dir):
+        """Test README.md, non-markdown files and junk directories are skipped."""
+        # Arrange
+        from scripts.management.rebuild_index import _walk_md
+        refs_dir.create_docs(2)
+        refs_dir.create_doc('geminicli.com', 'docs', 'README.md', '# Readme')
+        refs_dir.create_doc('geminicli.com', 'docs', 'notes.txt', 'text')
+        refs_dir.create_doc('geminicli.com', 'node_modules', 'pkg.md', '# Package')
+
+        # Act
+        paths = sorted(relative for _, relative in _walk_md(refs_dir.references_dir))
+
+        # Assert
+        assert paths == ['geminicli.com/docs/doc0.md', 'geminicli.com/docs/doc1.md']
+
+
+class TestPrefetch:
+    """Test the read-ahead helper for the serial path."""
+
+    def test_yields_bytes_in_order(self, refs_dir):
+        """Test files come back in input order with their bytes, failures as None."""
+        # Arrange
+        from scripts.management.rebuild_index import _iter_prefetched
+        refs_dir.create_docs(3)
+        docs_dir = refs_dir.references_dir / 'geminicli.com' / 'docs'
+        files = [docs_dir / 'doc2.md', docs_dir / 'missing.md', docs_dir / 'doc0.md']
+
+        # Act
+        results = list(_iter_prefetched(files))
+
+        # Assert
+        assert [md_file for md_file, _ in results] == files
+        assert results[0][1] == files[0].read_bytes()
+        assert results[1][1] is None
+
+
+class TestProcessFile:
+    """Test the per-file worker."""
+
+    def test_returns_hash_path_and_url(self, refs_dir):
+        """Test _process_file reads frontmatter URL and normalizes the path."""
+        # Arrange
+        from scripts.management.rebuild_index import HASH_ALGORITHM, _process_file
+        refs_dir.create_docs(1)
+        md_file = refs_dir.references_dir / 'geminicli.com' / 'docs' / 'doc0.md'
+
+        # Act
+        doc_id, content_hash, path_str, url, extracted, error, _fast_hash = _process_file(
+            md_file, refs_dir.references_dir, False
+        )
+
+        # Assert
+        assert error is None
+        assert doc_id == 'geminicli.com-docs-doc0'
+        assert content_hash.startswith(f'{HASH_ALGORITHM}:')
+        assert path_str == 'geminicli.com/docs/doc0.md'
+        assert url == 'https://geminicli.com/docs/doc0'
+        assert extracted is None
+
+    def test_extracts_from_bytes_already_read(self, refs_dir, monkeypatch):
+        """Test metadata extraction for new entries does not reopen the file."""
+        # Arrange
+        from pathlib import Path
+        from scripts.management.rebuild_index import _process_file
+        refs_dir.create_docs(1)
+        md_file = refs_dir.references_dir / 'geminicli.com' / 'docs' / 'doc0.md'
+        reads = []
+        original = Path.read_text
+
+        def _recording_read_text(self, *args, **kwargs):
+            reads.append(self)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, 'read_text', _recording_read_text)
+
+        # Act
+        result = _process_file(md_file, refs_dir.references_dir, True)
+
+        # Assert
+        assert result[4]['title'] == 'Gemini CLI doc0'
+        assert reads == []
+
+    def test_reports_errors(self, refs_dir):
+        """Test unreadable files return an error instead of raising."""
+        # Arrange
+        from scripts.management.rebuild_index import _process_file
+
+        # Act
+        result = _process_file(refs_dir.references_dir / 'missing.md', refs_dir.references_dir, True)
+
+        # Assert
+        assert result[0] is None
+        assert result[5]
+
+
+class TestRebuildIndex:
+    """Test the rebuild_index command."""
+
+    def test_parallel_and_serial_runs_match(self, refs_dir):
+        """Test the process pool produces the same index as the serial loop."""
+        # Arrange
+        from scripts.management.rebuild_index import rebuild_index
+        refs_dir.create_docs(4)
+
+        # Act
+        serial_stats = rebuild_index(refs_dir.references_dir, workers=1)
+        serial = _load_index(refs_dir)
+        for path in refs_dir.references_dir.glob('index.*'):
+            path.unlink()
+        parallel_stats = rebuild_index(refs_dir.references_dir, workers=2)
+        parallel = _load_index(refs_dir)
+
+        # Assert
+        assert serial_stats == parallel_stats
+        assert serial_stats['added'] == 4
+        assert parallel == serial
+        assert parallel['geminicli.com-docs-doc0']['title'] == 'Gemini CLI doc0'
+
+    def test_rerun_reports_unchanged(self, refs_dir):
+        """Test a second rebuild over unchanged files changes nothing."""
+        # Arrange
+        from scripts.management.rebuild_index import rebuild_index
+        refs_dir.create_docs(2)
+        rebuild_index(refs_dir.references_dir, workers=1)
+
+        # Act
+        stats = rebuild_index(refs_dir.references_dir, workers=1)
+
+        # Assert
+        assert stats['added'] == 0
+        assert stats['updated'] == 0
+        assert stats['unchanged'] == 2
+
+    def test_unchanged_mtime_skips_reading(self, refs_dir, monkeypatch):
+        """Test files whose stored mtime matches are not re-read, edited ones are."""
+        # Arrange
+        from scripts.management import rebuild_index as module
+        refs_dir.create_docs(2)
+        module.rebuild_index(refs_dir.references_dir, workers=1)
+        edited = refs_dir.references_dir / 'geminicli.com' / 'docs' / 'doc1.md'
+        edited.write_text(create_mock_gemini_doc('doc1') + '\nEdited.\n', encoding='utf-8')
+        os.utime(edited, ns=(edited.stat().st_atime_ns, edited.stat().st_mtime_ns + 10**9))
+        processed = []
+        original = module._process_file
+
+        def _recording_process_file(md_file, base_dir, extract, data=None, known=None):
+            processed.append(md_file.name)
+            return original(md_file, base_dir, extract, data, known)
+
+        monkeypatch.setattr(module, '_process_file', _recording_process_file)
+
+        # Act
+        stats = module.rebuild_index(refs_dir.references_dir, workers=1)
+
+        # Assert
+        assert processed == ['doc1.md']
+        assert stats['unchanged'] == 1
+        assert stats['updated'] == 1
+        fingerprints = module.load_fingerprints(refs_dir.references_dir)
+        assert fingerprints['geminicli.com/docs/doc1.md']['mtime'] == edited.stat().st_mtime_ns
+        assert 'mtime' not in _load_index(refs_dir)['geminicli.com-docs-doc1']
+
+    def test_stat_fields_are_kept_out_of_the_index(self, refs_dir):
+        """Test mtime/size are recorded in the local cache, never in index entries."""
+        # Arrange
+        from scripts.management.rebuild_index import FINGERPRINTS_FILENAME, load_fingerprints, rebuild_index
+        from scripts.utils.path_config import get_cache_dir
+        refs_dir.create_docs(1)
+
+        # Act
+        rebuild_index(refs_dir.references_dir, workers=1)
+
+        # Assert
+        fingerprint = load_fingerprints(refs_dir.references_dir)['geminicli.com/docs/doc0.md']
+        assert {'mtime', 'size'} <= fingerprint.keys()
+        assert not {'mtime', 'size'} & _load_index(refs_dir)['geminicli.com-docs-doc0'].keys()
+        assert (get_cache_dir(refs_dir.references_dir) / FINGERPRINTS_FILENAME).exists()
+        assert (get_cache_dir(refs_dir.references_dir) / FINGERPRINTS_FILENAME).exists()
+
+    def test_reports_orphaned_entries(self, refs_dir):
+        """Test index entries without a file on disk are counted as orphaned."""
+        # Arrange
+        from scripts.management.rebuild_index import rebuild_index
+        from tests.shared.test_utils import create_mock_index_entry
+        refs_dir.create_docs(1)
+        refs_dir.create_index({
+            'gone': create_mock_index_entry('gone', 'https://geminicli.com/gone', 'geminicli.com/docs/gone.md'),
+            'aliased': create_mock_index_entry('aliased', 'https://geminicli.com/a', 'geminicli.com/docs/doc0.md'),
+        })
+
+        # Act
+        stats = rebuild_index(refs_dir.references_dir, dry_run=True, workers=1)
+
+        # Assert
+        assert stats['orphaned'] == 1
+        assert stats['added'] == 1
+
+    def test_entry_with_stale_path_is_not_orphaned(self, refs_dir):
+        """Test an entry whose file is found under its doc_id gets its path fixed, not orphaned."""
+        # Arrange
+        from scripts.management.rebuild_index import rebuild_index
+        from tests.shared.test_utils import create_mock_index_entry
+        refs_dir.create_docs(1)
+        refs_dir.create_index({
+            'geminicli.com-docs-doc0': create_mock_index_entry(
+                'geminicli.com-docs-doc0', 'https://geminicli.com/docs/doc0', 'old\\location\\doc0.md'
+            ),
+        })
+
+        # Act
+        stats = rebuild_index(refs_dir.references_dir, workers=1)
+
+        # Assert
+        assert stats['orphaned'] == 0
+        assert stats['updated'] == 1
+        assert stats['index']['geminicli.com-docs-doc0']['path'] == 'geminicli.com/docs/doc0.md'
+
+    def test_renamed_file_keeps_old_id_as_alias(self, refs_dir):
+        """Test a moved file gets the new doc_id with the old one as an alias."""
+        # Arrange
+        from scripts.management.rebuild_index import rebuild_index
+        refs_dir.create_docs(1)
+        rebuild_index(refs_dir.references_dir, workers=1)
+        docs_dir = refs_dir.references_dir / 'geminicli.com' / 'docs'
+        (docs_dir / 'doc0.md').rename(docs_dir / 'renamed.md')
+
+        # Act
+        stats = rebuild_index(refs_dir.references_dir, workers=1)
+
+        # Assert
+        index = _load_index(refs_dir)
+        assert stats['renamed'] == 1
+        assert list(index) == ['geminicli.com-docs-renamed']
+        assert index['geminicli.com-docs-renamed']['aliases'] == ['geminicli.com-docs-doc0']
+
+    def test_size_change_with_same_mtime_is_detected(self, refs_dir):
+        """Test an edit that keeps the mtime but changes the size is re-hashed."""
+        # Arrange
+        from scripts.management.rebuild_index import rebuild_index
+        refs_dir.create_docs(1)
+        rebuild_index(refs_dir.references_dir, workers=1)
+        doc = refs_dir.references_dir / 'geminicli.com' / 'docs' / 'doc0.md'
+        before = doc.stat()
+        doc.write_text(create_mock_gemini_doc('doc0') + '\nEdited.\n', encoding='utf-8')
+        os.utime(doc, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+        # Act
+        stats = rebuild_index(refs_dir.references_dir, workers=1)
+
+        # Assert
+        from scripts.management.rebuild_index import load_fingerprints
+        assert stats['updated'] == 1
+        assert load_fingerprints(refs_dir.references_dir)['geminicli.com/docs/doc0.md']['size'] == doc.stat().st_size
+        assert 'size' not in _load_index(refs_dir)['geminicli.com-docs-doc0']
+
+    def test_repeat_rebuild_returns_identical_index(self, refs_dir, monkeypatch):
+        """Test the index returned by a write run matches a re-hashing dry run (determinism check)."""
+        # Arrange
+        from scripts.management import rebuild_index as module
+        refs_dir.create_docs(3)
+        first = module.rebuild_index(refs_dir.references_dir, workers=1)
+        processed = []
+        original = module._process_file
+
+        def _recording_process_file(md_file, base_dir, extract, data=None, known=None):
+            processed.append((md_file.name, known))
+            return original(md_file, base_dir, extract, data, known)
+
+        monkeypatch.setattr(module, '_process_file', _recording_process_file)
+
+        # Act
+        second = module.rebuild_index(refs_dir.references_dir, dry_run=True, workers=1, use_fingerprints=False)
+
+        # Assert
+        assert processed == [('doc0.md', None), ('doc1.md', None), ('doc2.md', None)]
+        assert first['index'] == second['index']
+        assert first['index'] == _load_index(refs_dir)
+
+    def test_records_changed_ids_until_consumed(self, refs_dir):
+        """Test changed doc_ids accumulate across rebuilds until they are consumed."""
+        # Arrange
+        from scripts.management.rebuild_index import load_changed_ids, rebuild_index, save_changed_ids
+        refs_dir.create_docs(2)
+        first = rebuild_index(refs_dir.references_dir, workers=1)
+        refs_dir.create_doc('geminicli.com', 'docs', 'doc2.md', create_mock_gemini_doc('doc2'))
+
+        # Act
+        second = rebuild_index(refs_dir.references_dir, workers=1)
+        recorded = load_changed_ids(refs_dir.references_dir)
+        save_changed_ids(refs_dir.references_dir, [])
+        rebuild_index(refs_dir.references_dir, workers=1)
+
+        # Assert
+        assert first['changed'] == ['geminicli.com-docs-doc0', 'geminicli.com-docs-doc1']
+        assert second['changed'] == ['geminicli.com-docs-doc2']
+        assert recorded == first['changed'] + second['changed']
+        assert load_changed_ids(refs_dir.references_dir) == []
+
+    def test_failed_ids_stay_recorded(self, refs_dir):
+        """Test saving the failed ids keeps only those, outside the canonical directory."""
+        # Arrange
+        from scripts.management.rebuild_index import (
+            CHANGED_FILENAME, load_changed_ids, rebuild_index, save_changed_ids,
+        )
+        from scripts.utils.path_config import get_cache_dir
+        refs_dir.create_docs(2)
+        rebuild_index(refs_dir.references_dir, workers=1)
+
+        # Act
+        save_changed_ids(refs_dir.references_dir, ['geminicli.com-docs-doc1'])
+
+        # Assert
+        assert load_changed_ids(refs_dir.references_dir) == ['geminicli.com-docs-doc1']
+        assert (get_cache_dir(refs_dir.references_dir) / CHANGED_FILENAME).exists()
+        assert not (refs_dir.references_dir / CHANGED_FILENAME).exists()
+
+    def test_dry_run_records_nothing(self, refs_dir):
+        """Test a dry run leaves no changed-ids file behind."""
+        # Arrange
+        from scripts.management.rebuild_index import load_changed_ids, rebuild_index
+        refs_dir.create_docs(1)
+
+        # Act
+        stats = rebuild_index(refs_dir.references_dir, dry_run=True, workers=1)
+
+        # Assert
+        assert stats['changed'] == ['geminicli.com-docs-doc0']
+        assert load_changed_ids(refs_dir.references_dir) is None
+
+    def test_fast_hash_skips_index_hash_when_only_stat_changed(self, refs_dir, monkeypatch):
+        """Test a touched file is matched by the cached fast hash without recomputing sha256."""
+        # Arrange
+        import hashlib
+        from scripts.management import rebuild_index as module
+        monkeypatch.setitem(module.HASHERS, 'blake3', hashlib.blake2b)
+        monkeypatch.setattr(module, 'FAST_HASH_ALGORITHM', 'blake3')
+        refs_dir.create_docs(1)
+        first = module.rebuild_index(refs_dir.references_dir, workers=1)
+        doc = refs_dir.references_dir / 'geminicli.com' / 'docs' / 'doc0.md'
+        os.utime(doc, ns=(doc.stat().st_atime_ns, doc.stat().st_mtime_ns + 10**9))
+        algorithms = []
+        original = module.calculate_hash_bytes
+
+        def _recording_hash(data, body_only=True, fm_end=None, algorithm=None):
+            algorithms.append(algorithm or module.HASH_ALGORITHM)
+            return original(data, body_only, fm_end, algorithm)
+
+        monkeypatch.setattr(module, 'calculate_hash_bytes', _recording_hash)
+
+        # Act
+        stats = module.rebuild_index(refs_dir.references_dir, workers=1)
+
+        # Assert
+        assert algorithms == ['blake3']
+        assert stats['unchanged'] == 1
+        assert stats['index'] == first['index']
+        fingerprint = module.load_fingerprints(refs_dir.references_dir)['geminicli.com/docs/doc0.md']
+        assert fingerprint['mtime'] == doc.stat().st_mtime_ns
+        assert fingerprint['fast'].startswith('blake3:')
@@ -0,0 +1,106 @@
+"""
+Tests for refresh_index.py (step orchestration).
+"""
+
+import sys
+import types
+
+
+def _install_fake_step(monkeypatch, name: str, main) -> None:
+    module = types.ModuleType(name)
+    module.main = main
+    monkeypatch.setitem(sys.modules, name, module)
+
+
+class TestRunStepInProcess:
+    """Test running step scripts inside the orchestrator process."""
+
+    def test_passes_argv_and_restores_it(self, monkeypatch, tmp_path):
+        """Test the step sees its own argv and the caller's argv is restored."""
+        # Arrange
+        from scripts.management.refresh_index import run_step_in_process
+        seen = []
+        _install_fake_step(monkeypatch, 'fake_step_ok', lambda: seen.append(list(sys.argv)))
+        saved_argv = list(sys.argv)
+
+        # Act
+        ok = run_step_in_process('Fake step', 'fake_step_ok', tmp_path / 'fake.py', ['extract-keywords'])
+
+        # Assert
+        assert ok
+        assert seen == [[str(tmp_path / 'fake.py'), 'extract-keywords']]
+        assert sys.argv == saved_argv
+
+    def test_system_exit_codes_become_step_status(self, monkeypatch, tmp_path):
+        """Test sys.exit(0) succeeds while non-zero exits and exceptions fail."""
+        # Arrange
+        from scripts.management.refresh_index import run_step_in_process
+
+        def _exit(code):
+            def _main():
+                sys.exit(code)
+            return _main
+
+        def _raise():
+            raise RuntimeError('boom')
+
+        _install_fake_step(monkeypatch, 'fake_step_zero', _exit(0))
+        _install_fake_step(monkeypatch, 'fake_step_two', _exit(2))
+        _install_fake_step(monkeypatch, 'fake_step_raise', _raise)
+
+        # Act / Assert
+        assert run_step_in_process('Zero', 'fake_step_zero', tmp_path / 'a.py')
+        assert not run_step_in_process('Two', 'fake_step_two', tmp_path / 'b.py')
+        assert not run_step_in_process('Raise', 'fake_step_raise', tmp_path / 'c.py')
+
+    def test_falls_back_to_subprocess_when_import_fails(self, monkeypatch, tmp_path):
+        """Test an unimportable step module is run as a subprocess instead."""
+        # Arrange
+        from scripts.management import refresh_index
+        calls = []
+        monkeypatch.setattr(refresh_index, 'run_step', lambda description, cmd: calls.append(cmd) or True)
+
+        # Act
+        ok = refresh_index.run_step_in_process('Missing', 'no_such_step_module', tmp_path / 'missing.py', ['--x'])
+
+        # Assert
+        assert ok
+        assert calls == [[sys.executable, str(tmp_path / 'missing.py'), '--x']]
+
+
+class TestStepExtractKeywords:
+    """Test incremental keyword extraction after a rebuild."""
+
+    def test_runs_changed_extraction_when_ids_recorded(self, monkeypatch, tmp_path):
+        """Test recorded doc_ids select --changed and the file is left for extract-keywords."""
+        # Arrange
+        from scripts.management import refresh_index
+        from scripts.management.rebuild_index import load_changed_ids, record_changed_ids
+        base_dir = tmp_path / 'canonical'
+        calls = []
+        monkeypatch.setattr(refresh_index, 'run_step_in_process',
+                            lambda description, module, script, args: calls.append(args) or True)
+        record_changed_ids(base_dir, ['b-doc', 'a-doc'])
+
+        # Act
+        ok = refresh_index.step_extract_keywords(tmp_path / 'scripts', base_dir)
+
+        # Assert
+        assert ok
+        assert calls == [['extract-keywords', '--changed']]
+        assert load_changed_ids(base_dir) == ['a-doc', 'b-doc']
+
+    def test_runs_full_extraction_without_changed_file(self, monkeypatch, tmp_path):
+        """Test a missing changed-ids file falls back to extracting everything."""
+        # Arrange
+        from scripts.management import refresh_index
+        calls = []
+        monkeypatch.setattr(refresh_index, 'run_step_in_process',
+                            lambda description, module, script, args: calls.append(args) or True)
+
+        # Act
+        ok = refresh_index.step_extract_keywords(tmp_path / 'scripts', tmp_path / 'canonical')
+
+        # Assert
+        assert ok
+        assert calls == [['extract-keywords']]
@@ -0,0 +1,128 @@
+"""
+Tests for check_dependencies.py module checks.
+"""
+
+import subprocess
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def check_deps():
+    """check_dependencies with the pip list probe forgotten before and after each test."""
+    from scripts.setup import check_dependencies as check_deps
+    check_deps._pip_list_packages.cache_clear()
+    yield check_deps
+    check_deps._pip_list_packages.cache_clear()
+
+
+class TestCheckImport:
+    """Test locating and importing dependency modules."""
+
+    def test_locates_module_without_importing(self, check_deps, tmp_path, monkeypatch):
+        """Test the default check finds a module without running its code."""
+        # Arrange
+        (tmp_path / 'explodes_on_import.py').write_text("raise RuntimeError('imported')\n", encoding='utf-8')
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        # Act
+        available, message = check_deps.check_import('explodes_on_import')
+        missing = check_deps.check_import('no_such_module_for_tests')
+
+        # Assert
+        assert available
+        assert message == f"Found at {tmp_path}"
+        assert missing == (False, "Module 'no_such_module_for_tests' not found")
+
+    def test_load_reports_import_failure(self, check_deps, tmp_path, monkeypatch):
+        """Test load=True imports the module and reports errors other than ImportError."""
+        # Arrange
+        (tmp_path / 'broken_on_import.py').write_text("raise RuntimeError('boom')\n", encoding='utf-8')
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        # Act
+        available, message = check_deps.check_import('broken_on_import', load=True)
+
+        # Assert
+        assert not available
+        assert message == "Module 'broken_on_import' failed to import: boom"
+
+
+class TestProbesRunOnce:
+    """Test probes that run at most once per process."""
+
+    def test_pip_list_runs_once(self, check_deps, monkeypatch):
+        """Test pip list is run once and its names are normalized."""
+        # Arrange
+        calls = []
+        stdout = '[{"name": "en_core_web_sm", "version": "3.8.0"}, {"name": "spaCy", "version": "3.8.2"}]'
+        monkeypatch.setattr(check_deps.subprocess, 'run', lambda cmd, **kwargs: calls.append(cmd) or
+                            subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr=''))
+
+        # Act
+        first = check_deps._pip_list_packages()
+        second = check_deps._pip_list_packages()
+
+        # Assert
+        assert first == second == frozenset({'en-core-web-sm', 'spacy'})
+        assert len(calls) == 1
+
+    def test_spacy_warning_filter_installed_once(self, check_deps, monkeypatch):
+        """Test the pydantic warning filter is only installed before the first spaCy import."""
+        # Arrange
+        calls = []
+        monkeypatch.setattr(check_deps, '_spacy_import_ready', False)
+        monkeypatch.setattr(check_deps, 'suppress_pydantic_v1_warning', lambda: calls.append(1))
+
+        # Act
+        check_deps._ensure_spacy_import_ready()
+        check_deps._ensure_spacy_import_ready()
+
+        # Assert
+        assert calls == [1]
+
+
+class TestMain:
+    """Test the report's environment probes."""
+
+    def _run_main(self, check_deps, monkeypatch, effective_spacy: dict) -> list:
+        from setup import setup_dependencies
+        compiler_probes = []
+        env_info = {'python_version': '3.12.0', 'python_executable': 'python', 'is_venv': False,
+                    'venv_path': None, 'pip_location': None, 'pip_python_match': True}
+        monkeypatch.setattr(check_deps, 'logger', MagicMock())
+        monkeypatch.setattr(check_deps.sys, 'argv', ['check_dependencies.py'])
+        monkeypatch.setattr(check_deps, 'check_import', lambda module, package=None, load=False: (module != 'spacy', ''))
+        monkeypatch.setattr(check_deps, 'check_spacy_model', lambda deep=False: (False, 'missing', {}))
+        monkeypatch.setattr(setup_dependencies, 'get_python_environment_info', lambda: env_info)
+        monkeypatch.setattr(setup_dependencies, 'detect_python_for_spacy', lambda: None)
+        monkeypatch.setattr(setup_dependencies, 'get_effective_spacy_status', lambda: effective_spacy)
+        monkeypatch.setattr(setup_dependencies, 'check_compiler_accessible', lambda: compiler_probes.append(1) or True)
+        monkeypatch.setattr(setup_dependencies, 'locate_vcvarsall_bat', lambda: None)
+        check_deps.main()
+        return compiler_probes
+
+    def test_compiler_not_probed_when_spacy_available(self, check_deps, monkeypatch, capsys):
+        """Test the build-tool probe is skipped when spaCy and its model are available."""
+        # Arrange
+        effective = {'effective_available': True, 'effective_model_available': True, 'effective_python': None}
+
+        # Act
+        compiler_probes = self._run_main(check_deps, monkeypatch, effective)
+
+        # Assert
+        assert compiler_probes == []
+        assert "All optional dependencies are installed" in capsys.readouterr().out
+
+    def test_compiler_probed_when_spacy_missing(self, check_deps, monkeypatch, capsys):
+        """Test the build-tool probe runs once for the spaCy install instructions."""
+        # Arrange
+        effective = {'effective_available': False, 'effective_model_available': False, 'effective_python': None}
+
+        # Act
+        compiler_probes = self._run_main(check_deps, monkeypatch, effective)
+
+        # Assert
+        assert compiler_probes == [1]
+        assert "spaCy - Missing in all supported interpreters" in capsys.readouterr().out
@@ -0,0 +1,447 @@
+"""
+Tests for setup_dependencies.py environment probes (compiler, VS environment, build tools, spaCy).
+
+Subprocess calls are mocked, so the Windows-only paths run on any platform.
+"""
+
+import codecs
+import json
+import subprocess
+
+import pytest
+
+
+@pytest.fixture
+def deps(monkeypatch, tmp_path):
+    """setup_dependencies with its on-disk cache under tmp_path and no memoized probes."""
+    from scripts.setup import setup_dependencies as deps
+    monkeypatch.setattr(deps, 'SETUP_CACHE_DIR', tmp_path / 'cache')
+    monkeypatch.setattr(deps, 'PLATFORM_CACHE_PATH', tmp_path / 'cache' / 'platform.json')
+    # Collected up front: tests may replace some of these with plain functions
+    memoized = [value for value in vars(deps).values() if hasattr(value, 'cache_clear')]
+    for probe in memoized:
+        probe.cache_clear()
+    yield deps
+    for probe in memoized:
+        probe.cache_clear()
+
+
+@pytest.fixture
+def mbcs_codec():
+    """Alias the Windows-only 'mbcs' codec to UTF-8 so vcvarsall output can be parsed anywhere."""
+    try:
+        codecs.lookup('mbcs')
+    except LookupError:
+        pass
+    else:
+        yield
+        return
+
+    def _search(name):
+        return codecs.lookup('utf-8') if name == 'mbcs' else None
+
+    codecs.register(_search)
+    yield
+    codecs.unregister(_search)
+
+
+def _completed(returncode: int = 0, stdout=b'') -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout=stdout, stderr=b'')
+
+
+def _compiler_dir(tmp_path):
+    """Directory holding a fake cl compiler."""
+    directory = tmp_path / 'msvc'
+    directory.mkdir(exist_ok=True)
+    (directory / 'cl').touch()
+    return str(directory)
+
+
+def _vcvarsall(tmp_path):
+    path = tmp_path / 'vcvarsall.bat'
+    path.write_text('@echo off\n', encoding='utf-8')
+    return path
+
+
+class TestCaptureVsEnvironment:
+    """Test capturing (and caching) the environment produced by vcvarsall.bat."""
+
+    def test_captures_changed_variables_and_caches_them(self, deps, tmp_path, monkeypatch, mbcs_codec):
+        """Test only changed variables are kept, via the helper batch file, and written to the cache."""
+        # Arrange
+        monkeypatch.setattr(deps.sys, 'platform', 'win32')
+        monkeypatch.setenv('UNCHANGED', 'same')
+        monkeypatch.delenv('INCLUDE', raising=False)
+        vcvarsall = _vcvarsall(tmp_path)
+        compiler_dir = _compiler_dir(tmp_path)
+        calls = []
+        output = f'PATH={compiler_dir}\r\nINCLUDE=C:\\VC\\include\r\nUNCHANGED=same\r\n_=ignored\r\n'.encode()
+        monkeypatch.setattr(deps.subprocess, 'run', lambda cmd, **kwargs: calls.append(cmd) or _completed(stdout=output))
+
+        # Act
+        delta, message = deps._capture_vs_environment(vcvarsall, 'x64')
+
+        # Assert
+        cache_path = deps._vcvars_cache_path(vcvarsall, 'x64')
+        helper_bat = cache_path.with_suffix('.bat')
+        assert delta == {'PATH': compiler_dir, 'INCLUDE': 'C:\\VC\\include'}
+        assert message == "VS Build Tools environment set up successfully"
+        assert calls == [['cmd.exe', '/c', f'"{helper_bat}"']]
+        assert f'call "{vcvarsall}" x64' in helper_bat.read_text(encoding='utf-8')
+        assert json.loads(cache_path.read_text(encoding='utf-8')) == delta
+
+    def test_restores_environment_from_cache(self, deps, tmp_path, monkeypatch):
+        """Test a cached environment that provides a compiler is reused without running vcvarsall.bat."""
+        # Arrange
+        monkeypatch.setattr(deps.sys, 'platform', 'win32')
+        vcvarsall = _vcvarsall(tmp_path)
+        cached = {'PATH': _compiler_dir(tmp_path)}
+        cache_path = deps._vcvars_cache_path(vcvarsall, 'x64')
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_text(json.dumps(cached), encoding='utf-8')
+
+        def _unexpected_run(cmd, **kwargs):
+            raise AssertionError(f"vcvarsall.bat should not run: {cmd}")
+
+        monkeypatch.setattr(deps.subprocess, 'run', _unexpected_run)
+
+        # Act
+        delta, message = deps._capture_vs_environment(vcvarsall, 'x64')
+
+        # Assert
+        assert delta == cached
+        assert message == "VS Build Tools environment restored from cache"
+
+    def test_reruns_vcvarsall_when_cache_is_stale(self, deps, tmp_path, monkeypatch, mbcs_codec):
+        """Test a cached environment without a compiler is captured again and replaced."""
+        # Arrange
+        monkeypatch.setattr(deps.sys, 'platform', 'win32')
+        vcvarsall = _vcvarsall(tmp_path)
+        cache_path = deps._vcvars_cache_path(vcvarsall, 'x64')
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_text(json.dumps({'PATH': str(tmp_path / 'gone')}), encoding='utf-8')
+        compiler_dir = _compiler_dir(tmp_path)
+        calls = []
+        output = f'PATH={compiler_dir}\r\n'.encode()
+        monkeypatch.setattr(deps.subprocess, 'run', lambda cmd, **kwargs: calls.append(cmd) or _completed(stdout=output))
+
+        # Act
+        delta, _ = deps._capture_vs_environment(vcvarsall, 'x64')
+
+        # Assert
+        assert len(calls) == 1
+        assert delta == {'PATH': compiler_dir}
+        assert json.loads(cache_path.read_text(encoding='utf-8')) == delta
+
+    def test_reports_capture_failure_without_caching(self, deps, tmp_path, monkeypatch, mbcs_codec):
+        """Test a failing vcvarsall.bat returns None and leaves no cached environment."""
+        # Arrange
+        monkeypatch.setattr(deps.sys, 'platform', 'win32')
+        vcvarsall = _vcvarsall(tmp_path)
+        monkeypatch.setattr(deps.subprocess, 'run', lambda cmd, **kwargs: _completed(returncode=1))
+
+        # Act
+        delta, message = deps._capture_vs_environment(vcvarsall, 'x86')
+
+        # Assert
+        assert delta is None
+        assert message == "Failed to run vcvarsall.bat (exit code: 1)"
+        assert not deps._vcvars_cache_path(vcvarsall, 'x86').exists()
+
+    def test_reports_timeout(self, deps, tmp_path, monkeypatch, mbcs_codec):
+        """Test a hung vcvarsall.bat is reported as a timeout."""
+        # Arrange
+        vcvarsall = _vcvarsall(tmp_path)
+
+        def _timeout(cmd, **kwargs):
+            raise subprocess.TimeoutExpired(cmd, kwargs.get('timeout'))
+
+        monkeypatch.setattr(deps.subprocess, 'run', _timeout)
+
+        # Act
+        delta, message = deps._capture_vs_environment(vcvarsall, 'x64')
+
+        # Assert
+        assert delta is None
+        assert message == "VS environment setup timed out"
+
+    def test_cache_key_follows_vcvarsall_and_arch(self, deps, tmp_path):
+        """Test updating vcvarsall.bat or changing the architecture selects another cache file."""
+        # Arrange
+        import os
+        vcvarsall = _vcvarsall(tmp_path)
+        before = deps._vcvars_cache_path(vcvarsall, 'x64')
+
+        # Act
+        stat = vcvarsall.stat()
+        os.utime(vcvarsall, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        after = deps._vcvars_cache_path(vcvarsall, 'x64')
+
+        # Assert
+        assert before != after
+        assert deps._vcvars_cache_path(vcvarsall, 'x86') != after
+
+
+class TestEnsureCompilerAccessible:
+    """Test choosing a VS environment when no compiler is on PATH."""
+
+    def _setup_windows(self, deps, tmp_path, monkeypatch, captures: dict) -> tuple[list, list]:
+        monkeypatch.setattr(deps.sys, 'platform', 'win32')
+        monkeypatch.setattr(deps, 'check_compiler_accessible', lambda: False)
+        monkeypatch.setattr(deps, 'locate_vcvarsall_bat', lambda: tmp_path / 'vcvarsall.bat')
+        captured, applied = [], []
+        monkeypatch.setattr(deps, '_capture_vs_environment', lambda path, arch: captured.append(arch) or captures[arch])
+        monkeypatch.setattr(deps, '_apply_vs_environment', lambda delta: applied.append(delta) or True)
+        return captured, applied
+
+    def test_returns_early_when_compiler_on_path(self, deps, monkeypatch):
+        """Test nothing is located or captured when a compiler is already accessible."""
+        # Arrange
+        monkeypatch.setattr(deps, 'check_compiler_accessible', lambda: True)
+        monkeypatch.setattr(deps, 'locate_vcvarsall_bat', lambda: pytest.fail("vcvarsall.bat should not be located"))
+
+        # Act
+        ok, message = deps.ensure_compiler_accessible()
+
+        # Assert
+        assert ok
+        assert message == "Compiler already accessible in PATH"
+
+    def test_working_x64_runs_vcvarsall_once(self, deps, tmp_path, monkeypatch):
+        """Test a working x64 environment is applied without capturing the fallbacks."""
+        # Arrange
+        captures = {'x64': ({'PATH': _compiler_dir(tmp_path), 'ARCH': 'x64'}, "ok")}
+        captured, applied = self._setup_windows(deps, tmp_path, monkeypatch, captures)
+
+        # Act
+        ok, message = deps.ensure_compiler_accessible()
+
+        # Assert
+        assert ok
+        assert message == "VS Build Tools environment configured successfully (x64)"
+        assert captured == ['x64']
+        assert applied == [captures['x64'][0]]
+
+    def test_applies_first_working_arch_in_preference_order(self, deps, tmp_path, monkeypatch):
+        """Test x64 is skipped when it lacks a compiler and x86_amd64 wins over x86."""
+        # Arrange
+        compiler_dir = _compiler_dir(tmp_path)
+        captures = {
+            'x64': ({'PATH': str(tmp_path / 'empty')}, "ok"),
+            'x86_amd64': ({'PATH': compiler_dir, 'ARCH': 'x86_amd64'}, "ok"),
+            'x86': ({'PATH': compiler_dir, 'ARCH': 'x86'}, "ok"),
+        }
+        captured, applied = self._setup_windows(deps, tmp_path, monkeypatch, captures)
+
+        # Act
+        ok, message = deps.ensure_compiler_accessible()
+
+        # Assert
+        assert ok
+        assert message == "VS Build Tools environment configured successfully (x86_amd64)"
+        assert sorted(captured) == ['x64', 'x86', 'x86_amd64']
+        assert applied == [captures['x86_amd64'][0]]
+
+    def test_fails_when_every_capture_fails(self, deps, tmp_path, monkeypatch):
+        """Test failed captures are not applied and the overall result is a failure."""
+        # Arrange
+        captures = {arch: (None, "Failed to run vcvarsall.bat (exit code: 1)") for arch in ('x64', 'x86_amd64', 'x86')}
+        _, applied = self._setup_windows(deps, tmp_path, monkeypatch, captures)
+
+        # Act
+        ok, message = deps.ensure_compiler_accessible()
+
+        # Assert
+        assert not ok
+        assert message == "Compiler not accessible and could not set up VS Build Tools environment"
+        assert applied == []
+
+    def test_fails_without_vcvarsall(self, deps, monkeypatch):
+        """Test a missing vcvarsall.bat fails without capturing anything."""
+        # Arrange
+        monkeypatch.setattr(deps.sys, 'platform', 'win32')
+        monkeypatch.setattr(deps, 'check_compiler_accessible', lambda: False)
+        monkeypatch.setattr(deps, 'locate_vcvarsall_bat', lambda: None)
+        monkeypatch.setattr(deps, '_capture_vs_environment', lambda path, arch: pytest.fail("nothing to capture"))
+
+        # Act
+        ok, _ = deps.ensure_compiler_accessible()
+
+        # Assert
+        assert not ok
+
+
+class TestBuildToolDetection:
+    """Test build-tool detection and its on-disk platform cache."""
+
+    def test_locate_vcvarsall_reuses_cached_path(self, deps, tmp_path, monkeypatch):
+        """Test a location saved by an earlier run is used while the file exists."""
+        # Arrange
+        monkeypatch.setattr(deps.sys, 'platform', 'win32')
+        vcvarsall = _vcvarsall(tmp_path)
+        deps._save_platform_cache(vcvarsall_path=str(vcvarsall))
+        deps._load_platform_cache.cache_clear()  # New run
+        monkeypatch.setattr(deps, '_find_vcvarsall_bat', lambda: pytest.fail("should not search"))
+
+        # Act
+        located = deps.locate_vcvarsall_bat()
+
+        # Assert
+        assert located == vcvarsall
+
+    def test_locate_vcvarsall_searches_when_cached_path_is_gone(self, deps, tmp_path, monkeypatch):
+        """Test a cached location that no longer exists triggers a new search."""
+        # Arrange
+        monkeypatch.setattr(deps.sys, 'platform', 'win32')
+        deps._save_platform_cache(vcvarsall_path=str(tmp_path / 'removed.bat'))
+        deps._load_platform_cache.cache_clear()
+        vcvarsall = _vcvarsall(tmp_path)
+        monkeypatch.setattr(deps, '_find_vcvarsall_bat', lambda: vcvarsall)
+
+        # Act
+        located = deps.locate_vcvarsall_bat()
+
+        # Assert
+        assert located == vcvarsall
+        assert deps._load_platform_cache()['vcvarsall_path'] == str(vcvarsall)
+
+    def test_positive_result_is_reused_across_runs(self, deps, monkeypatch):
+        """Test installed build tools are remembered on disk, but only for the same PATH."""
+        # Arrange
+        detections = []
+        monkeypatch.setattr(deps, '_detect_build_tools_installed', lambda: detections.append(1) or True)
+        assert deps.check_build_tools_installed()
+
+        # Act
+        deps.check_build_tools_installed.cache_clear()
+        deps._load_platform_cache.cache_clear()
+        reused = deps.check_build_tools_installed()
+        deps.check_build_tools_installed.cache_clear()
+        deps._load_platform_cache.cache_clear()
+        monkeypatch.setenv('PATH', '/changed')
+        deps.check_build_tools_installed()
+
+        # Assert
+        assert reused
+        assert len(detections) == 2
+
+    @pytest.mark.parametrize('stdout, expected', [
+        ("Name                       Id                               Version\n"
+         "-------------------------------------------------------------------\n"
+         "Visual Studio Build Tools  Microsoft.VisualStudio.BuildTools 17.9.6\n", True),
+        ("No installed package found matching input criteria.\n", False),
+        ("microsoft.visualstudio.buildtools listed without a version\n", False),
+    ])
+    def test_winget_rows_need_a_version(self, deps, monkeypatch, stdout, expected):
+        """Test a winget list row counts as installed only when it carries a version."""
+        # Arrange
+        monkeypatch.setattr(deps.sys, 'platform', 'win32')
+        monkeypatch.setattr(deps, 'locate_vcvarsall_bat', lambda: None)
+        monkeypatch.setattr(deps.subprocess, 'run',
+                            lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr=''))
+
+        # Act
+        installed = deps._detect_build_tools_installed()
+
+        # Assert
+        assert installed is expected
+
+    def test_vcvarsall_found_skips_winget(self, deps, tmp_path, monkeypatch):
+        """Test the filesystem checks answer before winget is started."""
+        # Arrange
+        monkeypatch.setattr(deps.sys, 'platform', 'win32')
+        monkeypatch.setattr(deps, 'locate_vcvarsall_bat', lambda: tmp_path / 'vcvarsall.bat')
+        monkeypatch.setattr(deps.subprocess, 'run', lambda cmd, **kwargs: pytest.fail("winget should not run"))
+
+        # Act / Assert
+        assert deps._detect_build_tools_installed()
+
+
+class TestPathProbes:
+    """Test PATH and directory scans."""
+
+    def test_linux_compiler_needs_gcc_and_gxx(self, deps, tmp_path, monkeypatch):
+        """Test the compiler check reads one PATH listing and requires both gcc and g++."""
+        # Arrange
+        monkeypatch.setattr(deps.sys, 'platform', 'linux')
+        bin_dir = tmp_path / 'bin'
+        bin_dir.mkdir()
+        (bin_dir / 'gcc').touch()
+        monkeypatch.setenv('PATH', str(bin_dir))
+        gcc_only = deps.check_compiler_accessible()
+
+        # Act
+        (bin_dir / 'g++').touch()
+        deps._path_executables.cache_clear()
+        deps.check_compiler_accessible.cache_clear()
+        both = deps.check_compiler_accessible()
+
+        # Assert
+        assert not gcc_only
+        assert both
+
+    def test_python_names_in_lists_interpreters(self, deps, tmp_path):
+        """Test only known interpreter names are reported, and unreadable dirs are empty."""
+        # Arrange
+        for name in ('python3', 'python.exe', 'pip', 'python3-config'):
+            (tmp_path / name).touch()
+
+        # Act
+        names = deps._python_names_in(tmp_path)
+
+        # Assert
+        assert names == {'python3', 'python.exe'}
+        assert deps._python_names_in(tmp_path / 'missing') == set()
+
+
+class TestSpacyProbe:
+    """Test probing spaCy in this and an alternate interpreter."""
+
+    def test_runs_shipped_probe_under_launcher(self, deps, monkeypatch):
+        """Test a launcher command is split and runs the spacy_probe script in --deep mode."""
+        # Arrange
+        calls = []
+        probe = {'spacy_importable': True, 'spacy_version': '3.8.0', 'model_loadable': True, 'model_location': None}
+        monkeypatch.setattr(deps.subprocess, 'run', lambda cmd, **kwargs: calls.append(cmd) or
+                            subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(probe) + '\n', stderr=''))
+
+        # Act
+        result = deps._probe_spacy('py -3.13')
+
+        # Assert
+        assert result == probe
+        assert calls == [['py', '-3.13', str(deps.SPACY_PROBE_SCRIPT), '--deep']]
+
+    def test_unusable_interpreter_returns_none(self, deps, monkeypatch):
+        """Test a failing alternate interpreter yields None instead of raising."""
+        # Arrange
+        monkeypatch.setattr(deps.subprocess, 'run',
+                            lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 1, stdout='', stderr='boom'))
+
+        # Act / Assert
+        assert deps._probe_spacy('/opt/python3.13/bin/python3.13') is None
+
+    @pytest.mark.parametrize('current_importable, alt_probed', [(True, False), (False, True)])
+    def test_alternate_probed_only_without_current_spacy(self, deps, monkeypatch, current_importable, alt_probed):
+        """Test the alternate interpreter is only probed when this one cannot import spaCy."""
+        # Arrange
+        probed = []
+        alt = {'spacy_importable': True, 'spacy_version': '3.8.0', 'model_loadable': True, 'model_location': '/m'}
+
+        def _fake_probe(python_exe=None):
+            probed.append(python_exe)
+            if python_exe is None:
+                return {'spacy_importable': current_importable, 'spacy_version': None,
+                        'model_loadable': current_importable, 'model_location': None}
+            return alt
+
+        monkeypatch.setattr(deps, '_probe_spacy', _fake_probe)
+        monkeypatch.setattr(deps, 'detect_python_for_spacy', lambda: '/opt/python3.13')
+
+        # Act
+        status = deps.get_effective_spacy_status()
+
+        # Assert
+        assert probed == ([None, '/opt/python3.13'] if alt_probed else [None])
+        assert status['effective_available']
+        assert status['effective_python'] == ('/opt/python3.13' if alt_probed else None)
@@ -168,6 +168,23 @@ class TempReferencesDir:
             f.write(content)
         return doc_file
 
+    def create_docs(self, count: int) -> dict:
+        """Create geminicli.com/docs/doc0.md .. doc<count-1>.md and return matching index entries"""
+        index = {}
+        for i in range(count):
+            doc_id = f'doc{i}'
+            self.create_doc('geminicli.com', 'docs', f'{doc_id}.md', create_mock_gemini_doc(doc_id))
+            index[doc_id] = create_mock_index_entry(
+                doc_id, f'https://geminicli.com/docs/{doc_id}', f'geminicli.com/docs/{doc_id}.md'
+            )
+        return index
+
+    def create_index_manager(self, index: dict):
+        """Create index.yaml and return an IndexManager for it"""
+        self.create_index(index)
+        from scripts.management.index_manager import IndexManager
+        return IndexManager(self.references_dir)
+
     def cleanup(self):
         """Clean up temporary directory"""
         import shutil
@@ -214,6 +231,17 @@ def create_mock_doc_with_frontmatter(content: str, **frontmatter_kwargs) -> str:
     return f"{frontmatter}\n{content}"
 
 
+def create_mock_gemini_doc(name: str) -> str:
+    """Create a mock Gemini CLI doc titled 'Gemini CLI <name>' with its source_url in the frontmatter"""
+    content = (
+        f"# Gemini CLI {name}\n\n"
+        "Configure the Gemini CLI with settings files and environment variables.\n\n"
+        "## Settings File\n\n"
+        "The settings file controls model selection, sandboxing and telemetry options.\n"
+    )
+    return create_mock_doc_with_frontmatter(content, source_url=f'https://geminicli.com/docs/{name}')
+
+
 class MockIndexManager:
     """Mock IndexManager for testing"""
 
@@ -49,6 +49,36 @@ class TestGeminiTagConfigAuditor:
             refs_dir.cleanup()
             config_dir.cleanup()
 
+    def test_reads_updates_from_write_ahead_log(self, temp_dir):
+        """Test entries updated through IndexManager are seen before index.yaml is compacted"""
+        refs_dir = TempReferencesDir()
+        config_dir = TempConfigDir()
+        try:
+            config_dir.create_tag_detection_yaml({'tags': {'cli': {'keywords': ['command']}}})
+            refs_dir.create_index({
+                'test-doc': create_mock_index_entry(
+                    'test-doc', 'https://geminicli.com/docs/test', 'geminicli-com/docs/test.md'
+                )
+            })
+            (refs_dir.references_dir / 'index.json').unlink(missing_ok=True)
+
+            from scripts.management.index_manager import IndexManager
+            from scripts.validation.audit_tag_config import GeminiTagConfigAuditor
+
+            IndexManager(refs_dir.references_dir).update_entry('test-doc', {
+                'url': 'https://geminicli.com/docs/test',
+                'path': 'geminicli-com/docs/test.md',
+                'tags': ['cli'],
+            })
+            assert (refs_dir.references_dir / 'index.wal').exists()
+
+            auditor = GeminiTagConfigAuditor(refs_dir.references_dir, config_dir.config_dir)
+
+            assert auditor.entries[0]['tags'] == ['cli']
+        finally:
+            refs_dir.cleanup()
+            config_dir.cleanup()
+
     def test_audit_tag_coverage(self, temp_dir):
         """Test tag coverage analysis in audit"""
         refs_dir = TempReferencesDir()